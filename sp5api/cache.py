@@ -11,6 +11,12 @@ from typing import Any
 _lock = threading.Lock()
 _store: dict[str, tuple[float, Any]] = {}  # key -> (expires_at, value)
 
+# Singleflight für get_or_set: je Schlüssel ein Lock, damit bei N parallelen
+# Cache-Misses die factory nur einmal läuft und die übrigen Threads auf das
+# Ergebnis warten statt dieselbe Arbeit N-fach zu rechnen.
+_inflight_lock = threading.Lock()
+_inflight: dict[str, threading.Lock] = {}
+
 # Default TTL in seconds
 DEFAULT_TTL = 60
 
@@ -66,10 +72,26 @@ def stats() -> dict:
 
 
 def get_or_set(key: str, factory, ttl: float = DEFAULT_TTL) -> Any:
-    """Liefert den Cache-Wert oder berechnet ihn via factory(), cached und liefert ihn."""
+    """Liefert den Cache-Wert oder berechnet ihn via factory(), cached und liefert ihn.
+
+    Parallele Misses auf denselben Schlüssel werden serialisiert (Singleflight):
+    der erste Thread rechnet, die übrigen übernehmen danach den Cache-Treffer.
+    """
     value = get(key)
     if value is not None:
         return value
-    result = factory()
-    put(key, result, ttl)
+
+    with _inflight_lock:
+        key_lock = _inflight.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Ein anderer Thread kann den Wert inzwischen berechnet haben
+        value = get(key)
+        if value is not None:
+            return value
+        result = factory()
+        put(key, result, ttl)
+
+    with _inflight_lock:
+        _inflight.pop(key, None)
     return result
@@ -5,7 +5,6 @@ Extracted from main.py for modular router support.
 
 # ── Structured JSON Logging setup ───────────────────────────────
 import contextvars as _contextvars
-import json as _json
 import logging
 import logging.handlers
 import os
@@ -15,6 +14,7 @@ from datetime import UTC
 from datetime import datetime as _dt
 
 import jwt as _jwt
+import orjson
 from fastapi import Depends, Header, HTTPException, Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -26,6 +26,21 @@ request_id_ctx: _contextvars.ContextVar[str | None] = _contextvars.ContextVar(
 )
 
 
+# Extra-Felder, die logger.info("msg", extra={...}) an den Record hängt.
+# Der Formatter liest sie direkt aus record.__dict__ statt per getattr —
+# das spart die Attribut-Protokoll-Maschinerie je Feld und Log-Zeile.
+_LOG_EXTRA_KEYS = (
+    "request_id",
+    "method",
+    "path",
+    "status_code",
+    "duration_ms",
+    "username",
+    "event",
+    "exc_type",
+)
+
+
 class _JsonFormatter(logging.Formatter):
     """Gibt Log-Einträge als einzeilige JSON-Objekte mit request_id aus dem Kontext aus."""
 
@@ -42,22 +57,16 @@ class _JsonFormatter(logging.Formatter):
         if rid:
             entry["request_id"] = rid
         # Merge extra fields attached by logger.info("msg", extra={...})
-        for key in (
-            "request_id",
-            "method",
-            "path",
-            "status_code",
-            "duration_ms",
-            "username",
-            "event",
-            "exc_type",
-        ):
-            val = getattr(record, key, None)
+        rec_dict = record.__dict__
+        for key in _LOG_EXTRA_KEYS:
+            val = rec_dict.get(key)
             if val is not None:
                 entry[key] = val
         if record.exc_info:
             entry["exc"] = self.formatException(record.exc_info)
-        return _json.dumps(entry, ensure_ascii=False)
+        # orjson statt stdlib-json: der Formatter läuft je Log-Zeile auf dem
+        # Request-Pfad; orjson gibt UTF-8 direkt aus (ensure_ascii=False-Semantik)
+        return orjson.dumps(entry).decode()
 
 
 class _TextFormatter(logging.Formatter):
@@ -519,6 +528,12 @@ def enforce_wpast(user: dict, *dates: str | None) -> None:
             )
 
 
+# Eine Facade-Instanz je db_path — SP5Database ist zustandslos (der DBF-Cache
+# ist global), daher ist die Instanz prozessweit teilbar statt sie bei jedem
+# get_db()-Aufruf neu zu allozieren.
+_DB_INSTANCES: dict[str, SP5Database] = {}
+
+
 def get_db():
     """Liefert eine Datenbankverbindung des konfigurierten Backends.
 
@@ -534,7 +549,10 @@ def get_db():
     else:
         import sp5api.main as _main
 
-        return SP5Database(_main.DB_PATH)
+        db = _DB_INSTANCES.get(_main.DB_PATH)
+        if db is None:
+            db = _DB_INSTANCES[_main.DB_PATH] = SP5Database(_main.DB_PATH)
+        return db
 
 
 def invalidate_sessions_for_user(user_id: int, except_session_id: str | None = None) -> int:
@@ -587,7 +605,6 @@ def purge_stale_failed_logins() -> int:
 
 
 # ── Audit Log (JSON file) ────────────────────────────────────────
-import json as _audit_json  # noqa: E402
 import threading as _audit_threading  # noqa: E402
 
 _AUDIT_LOG_FILE = os.environ.get("SP5_AUDIT_LOG", "/tmp/sp5-audit.json")
@@ -609,8 +626,9 @@ def write_audit_log(action: str, actor: str, details: dict) -> None:
     }
     try:
         with _audit_lock:
-            with open(_AUDIT_LOG_FILE, "a", encoding="utf-8") as _f:
-                _f.write(_audit_json.dumps(entry, ensure_ascii=False) + "\n")
+            # orjson wie im JSON-Log-Formatter: UTF-8 direkt, Binär-Append
+            with open(_AUDIT_LOG_FILE, "ab") as _f:
+                _f.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n")
     except Exception as _ae:
         _logger.warning("Audit log write failed: %s", _ae)
 
@@ -1,10 +1,15 @@
 """FastAPI-Anwendung für OpenSchichtplaner5."""
 
+import calendar as _cal
+import hashlib
+import heapq
 import os
 import threading
-import time as _startup_time_module
+import time
+import uuid
 from collections import deque
 from contextlib import asynccontextmanager
+from operator import itemgetter
 
 from dotenv import load_dotenv
 
@@ -17,7 +22,7 @@ from ._paths import backend_dir as _backend_dir
 # site-packages heraus übereinstimmen.
 os.environ.setdefault("SP5_BACKEND_DIR", _backend_dir())
 
-_APP_START_TIME = _startup_time_module.time()
+_APP_START_TIME = time.time()
 
 # Stammdaten-GET-Pfade, die clientseitig 60 s gecacht werden. Eine gemeinsame
 # Quelle für die Cache-Control-Middleware (setzt den Header) und den Metrik-
@@ -78,11 +83,36 @@ _CACHEABLE_API_PREFIXES = (
     "/api/extracharges",
 )
 
+# Berichts-/Statistik-GETs: ändern sich nur mit dem DBF-Bestand, haben aber
+# teils große Bodies und werden von Dashboards gepollt. Kein max-age (immer
+# revalidieren, Plandaten dürfen nie veraltet angezeigt werden), aber ETag +
+# 304 — unveränderte Antworten kosten dann nur noch den Header-Roundtrip.
+_REVALIDATE_API_PREFIXES = (
+    "/api/stats",
+    "/api/statistics",
+    "/api/capacity-year",
+    "/api/zeitkonto",
+    "/api/overtime-summary",
+)
+
 
 # ── In-memory metrics collector ──────────────────────────────────
 class _Metrics:
     """Einfache thread-sichere In-Memory-Metriken für die Observability."""
 
+    # record_request läuft in der Middleware für JEDEN Request — mit __slots__
+    # sind die Zähler-Zugriffe direkte Slot-Reads statt __dict__-Lookups.
+    __slots__ = (
+        "_lock",
+        "request_count",
+        "error_count",
+        "not_found_count",
+        "cache_hit_count",
+        "cache_total_count",
+        "_latencies",
+        "_latency_sum",
+    )
+
     def __init__(self, latency_window: int = 100):
         self._lock = threading.Lock()
         self.request_count = 0
@@ -90,10 +120,12 @@ class _Metrics:
         self.not_found_count = 0  # 404 responses
         self.cache_hit_count = 0  # responses with Cache-Control max-age (hits)
         self.cache_total_count = 0  # cacheable requests total
-        # Ringpuffer der letzten DB-Lese-Latenzen (ms)
+        # Ringpuffer der letzten DB-Lese-Latenzen (ms) plus laufende Summe —
+        # snapshot() muss so den Puffer nicht bei jedem Poll durchsummieren.
         self._latencies: deque = deque(maxlen=latency_window)
+        self._latency_sum = 0.0
 
-    def record_request(self, status: int, duration_ms: float, path: str, response_headers: dict):
+    def record_request(self, status: int, duration_ms: float, path: str, cache_control: str):
         with self._lock:
             self.request_count += 1
             if status >= 500:
@@ -101,15 +133,20 @@ class _Metrics:
             elif status == 404:
                 self.not_found_count += 1
             # Cache tracking: count cacheable API paths
-            if any(path.startswith(p) for p in _CACHEABLE_API_PREFIXES):
+            # startswith akzeptiert das Präfix-Tupel direkt (ein C-Aufruf
+            # statt Generator-Scan je Request)
+            if path.startswith(_CACHEABLE_API_PREFIXES):
                 self.cache_total_count += 1
-                cc = response_headers.get("cache-control", "")
-                if "max-age" in cc and status == 200:
+                if "max-age" in cache_control and status == 200:
                     self.cache_hit_count += 1
 
     def record_db_latency(self, ms: float):
         with self._lock:
+            # Verdrängtes Sample vor dem Append aus der Summe nehmen
+            if len(self._latencies) == self._latencies.maxlen:
+                self._latency_sum -= self._latencies[0]
             self._latencies.append(ms)
+            self._latency_sum += ms
 
     def snapshot(self) -> dict:
         with self._lock:
@@ -117,8 +154,9 @@ class _Metrics:
             err_rate = round(self.error_count / total, 4)
             cache_total = self.cache_total_count or 1
             cache_hit_rate = round(self.cache_hit_count / cache_total, 4)
-            latencies = list(self._latencies)
-        avg_lat = round(sum(latencies) / len(latencies), 2) if latencies else None
+            lat_samples = len(self._latencies)
+            lat_sum = self._latency_sum
+        avg_lat = round(lat_sum / lat_samples, 2) if lat_samples else None
         return {
             "request_count": self.request_count,
             "error_count": self.error_count,
@@ -128,7 +166,7 @@ class _Metrics:
             "cache_total_count": self.cache_total_count,
             "cache_hit_rate": cache_hit_rate,
             "db_read_latency_avg_ms": avg_lat,
-            "db_read_latency_samples": len(latencies),
+            "db_read_latency_samples": lat_samples,
         }
 
 
@@ -144,13 +182,19 @@ from fastapi import FastAPI, HTTPException, Query, Request  # noqa: E402
 from fastapi.exceptions import RequestValidationError  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.middleware.gzip import GZipMiddleware  # noqa: E402
-from fastapi.responses import FileResponse, JSONResponse  # noqa: E402
+from fastapi.responses import (  # noqa: E402
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles  # noqa: E402
 from slowapi.errors import RateLimitExceeded  # noqa: E402
 from slowapi.middleware import SlowAPIMiddleware  # noqa: E402
 
 # ── Import shared dependencies ──────────────────────────────────
 # Hier re-exportiert, damit Tests weiterhin `from sp5api.main import _sessions` können
+from . import cache  # noqa: E402
 from .dependencies import (  # noqa: E402
     _DEV_MODE_ACTIVE,
     _DEV_TOKEN,
@@ -163,6 +207,7 @@ from .dependencies import (  # noqa: E402
     limiter,
     purge_expired_sessions,
     purge_stale_failed_logins,
+    request_id_ctx,
 )
 
 # ── Dev-mode session ────────────────────────────────────────────
@@ -365,6 +410,10 @@ async def lifespan(app: FastAPI):
         _logger.warning("Startup auto-backup failed: %s", _exc)
     # Start background cleanup task
     cleanup_task = asyncio.create_task(_periodic_cleanup())
+    # Stammdaten-Caches im Hintergrund vorwärmen, damit der erste echte
+    # Request nicht die Kalt-Lese-Latenz der großen Tabellen zahlt. Fehler
+    # sind unkritisch — der Cache füllt sich dann beim ersten Zugriff.
+    warmup_task = asyncio.create_task(_prewarm_caches())
     # Start scheduled reports background scheduler
     try:
         from .routers.scheduled_reports import start_scheduler, stop_scheduler
@@ -375,6 +424,7 @@ async def lifespan(app: FastAPI):
         _logger.warning("Scheduled reports scheduler start failed: %s", _exc)
     yield
     cleanup_task.cancel()
+    warmup_task.cancel()
     try:
         stop_scheduler()
     except Exception:
@@ -382,8 +432,51 @@ async def lifespan(app: FastAPI):
     _logger.info("SP5 API shutting down — cleaning up resources")
 
 
+async def _prewarm_caches() -> None:
+    """Füllt die Dashboard-Stammdaten-Schlüssel des TTL-Caches beim Start.
+
+    Läuft als Hintergrund-Task nach dem Startup, blockiert also weder den
+    Serverstart noch eingehende Requests; die Schlüssel entsprechen denen
+    des Dashboard-Summary-Endpunkts und liegen unter den etablierten
+    Invalidierungs-Präfixen.
+    """
+    import asyncio
+
+    try:
+        from .dependencies import get_db
+
+        db = get_db()
+        await asyncio.gather(
+            asyncio.to_thread(_dashboard_employees, db),
+            asyncio.to_thread(cache.get_or_set, "groups:dashboard:list", db.get_groups),
+            asyncio.to_thread(
+                cache.get_or_set,
+                "leave_types:dashboard:list",
+                lambda: db.get_leave_types(include_hidden=True),
+            ),
+        )
+        _logger.info("Cache pre-warm complete (employees/groups/leave_types)")
+    except asyncio.CancelledError:
+        raise
+    except Exception as _exc:
+        _logger.warning("Cache pre-warm failed: %s", _exc)
+
+
+class _ORJSONResponse(ORJSONResponse):
+    """Default-Response-Klasse: orjson serialisiert die großen Report-/
+    Schedule-Payloads deutlich schneller als das stdlib-json. OPT_NON_STR_KEYS,
+    weil einzelne Endpunkte dicts mit int-Schlüsseln liefern (stdlib-json hat
+    die bisher still zu Strings konvertiert)."""
+
+    def render(self, content) -> bytes:
+        import orjson
+
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=_ORJSONResponse,
     title="OpenSchichtplaner5 API",
     description=(
         "Open-source REST API for Schichtplaner5 databases.\n\n"
@@ -476,7 +569,9 @@ def _rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
 
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# compresslevel=5 statt Starlette-Default 9: bei den hochredundanten Plan-
+# JSONs nahezu dieselbe Ratio, aber deutlich weniger CPU je Response
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
 
 app.add_middleware(
     CORSMiddleware,
@@ -489,13 +584,54 @@ app.add_middleware(
 
 @app.middleware("http")
 async def cache_control_middleware(request: Request, call_next):
-    """Setzt Cache-Control-Header für statische/selten wechselnde GET-Endpunkte."""
+    """Setzt Cache-Control-Header für statische/selten wechselnde GET-Endpunkte.
+
+    Die Stammdaten-Präfixe bekommen zusätzlich ein ETag über den Body: bei
+    passendem If-None-Match geht nur ein 304 ohne Payload über die Leitung —
+    der Client revalidiert nach Ablauf der 60 s, statt die komplette Liste
+    erneut zu übertragen. Die Bodies dieser Endpunkte sind klein, das
+    Zwischenpuffern in der Middleware ist daher unkritisch.
+    """
     response = await call_next(request)
     if request.method == "GET":
         path = request.url.path
         # Selten wechselnde Stammdaten: 60 s clientseitig cachen
-        if any(path.startswith(p) for p in _CACHEABLE_API_PREFIXES) and response.status_code == 200:
-            response.headers["Cache-Control"] = "private, max-age=60"
+        if path.startswith(_CACHEABLE_API_PREFIXES) and response.status_code == 200:
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+            if request.headers.get("if-none-match") == etag:
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": "private, max-age=60"},
+                )
+            headers = dict(response.headers)
+            headers["Cache-Control"] = "private, max-age=60"
+            headers["ETag"] = etag
+            return Response(
+                content=body,
+                status_code=200,
+                headers=headers,
+                media_type=response.media_type,
+            )
+        # Berichte/Statistiken: immer revalidieren, aber per ETag mit 304
+        # antworten, solange sich der Body nicht geändert hat
+        elif path.startswith(_REVALIDATE_API_PREFIXES) and response.status_code == 200:
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+            if request.headers.get("if-none-match") == etag:
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+                )
+            headers = dict(response.headers)
+            headers["Cache-Control"] = "private, no-cache"
+            headers["ETag"] = etag
+            return Response(
+                content=body,
+                status_code=200,
+                headers=headers,
+                media_type=response.media_type,
+            )
         elif path.startswith("/api/"):
             # All other API responses: no caching
             response.headers.setdefault("Cache-Control", "no-cache, no-store, must-revalidate")
@@ -619,8 +755,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Fängt unbehandelte Exceptions, loggt Details, liefert bereinigte 500."""
-    from .dependencies import request_id_ctx
-
     token = (
         request.headers.get("x-auth-token")
         or request.cookies.get("sp5_token")
@@ -655,7 +789,7 @@ async def filesystem_error_handler(request: Request, exc: OSError):
     response instead of an opaque 500 (cycle 8 / Regel 6). Covers write paths that
     do not wrap their DB calls themselves (e.g. wishes). The most common cause is a
     data directory mounted into the non-root container without write permission."""
-    from .dependencies import describe_write_error, request_id_ctx
+    from .dependencies import describe_write_error
 
     mapped = describe_write_error(exc)
     if mapped is None:
@@ -692,22 +826,17 @@ _PUBLIC_PATHS = {
 @app.middleware("http")
 async def request_logging_middleware(request: Request, call_next):
     """Loggt jeden Request mit Timing und Request-ID via strukturiertem Logging."""
-    import time as _t
-    import uuid as _uuid
-
-    from .dependencies import request_id_ctx
-
     # Use incoming X-Request-ID or generate a new UUID
-    req_id = request.headers.get("x-request-id") or str(_uuid.uuid4())
+    req_id = request.headers.get("x-request-id") or str(uuid.uuid4())
     # Set request_id in contextvars so all log entries include it
     token_cv = request_id_ctx.set(req_id)
-    start = _t.time()
+    start = time.time()
     try:
         response = await call_next(request)
     except Exception:
         request_id_ctx.reset(token_cv)
         raise
-    duration_ms = round((_t.time() - start) * 1000)
+    duration_ms = round((time.time() - start) * 1000)
     token = (
         request.headers.get("x-auth-token")
         or request.cookies.get("sp5_token")
@@ -737,7 +866,8 @@ async def request_logging_middleware(request: Request, call_next):
         status=response.status_code,
         duration_ms=duration_ms,
         path=request.url.path,
-        response_headers=dict(response.headers),
+        # Nur der eine benötigte Header statt dict(response.headers) je Request
+        cache_control=response.headers.get("cache-control", ""),
     )
     return response
 
@@ -778,7 +908,7 @@ async def auth_middleware(request: Request, call_next):
     # deckt /api/v1/-Aufrufe ab (Rewrite läuft erst nach dieser Middleware).
     if _CORE_ONLY:
         _norm = path.replace("/api/v1/", "/api/", 1)
-        if any(_norm.startswith(px) for px in _EXTRA_PREFIXES):
+        if _norm.startswith(_EXTRA_PREFIXES):
             resp_core = JSONResponse(
                 status_code=404,
                 content={"detail": "Diese Funktion ist im Core-Modus deaktiviert (SP5_CORE_ONLY)."},
@@ -1033,6 +1163,13 @@ app.include_router(orm_mirror.router)
 # ── Routes ──────────────────────────────────────────────────────
 
 
+# Startzeitpunkt einmal als ISO-String formatieren — der Wert ist über die
+# gesamte Prozesslaufzeit konstant, health() braucht ihn bei jedem Aufruf.
+from datetime import datetime as _startup_dt  # noqa: E402
+
+_APP_STARTED_AT_ISO = _startup_dt.fromtimestamp(_APP_START_TIME, tz=UTC).isoformat()
+
+
 def _format_uptime(seconds: float) -> str:
     """Format seconds into a human-readable uptime string."""
     total = int(seconds)
@@ -1092,7 +1229,11 @@ def health():
     db_employees: int | None = None
     try:
         db = get_db()
-        db_employees = db.get_stats().get("employees")
+        # Health wird von Monitoring im Sekundentakt gepollt — der MA-Zähler
+        # muss dafür nicht bei jedem Poll neu aus den DBFs gelesen werden
+        db_employees = cache.get_or_set(
+            "health:db_stats", db.get_stats, ttl=60
+        ).get("employees")
     except Exception:
         db_check = "error"
 
@@ -1137,7 +1278,10 @@ def health():
         disk_details["free_mb"] = round(free_mb, 1)
         disk_details["total_mb"] = round(usage.total / (1024 * 1024), 1)
         disk_details["used_percent"] = round((usage.used / usage.total) * 100, 1)
-        db_dir_size = _get_dir_size(DB_PATH)
+        # Verzeichnis-Walk über alle DBFs nicht je Poll wiederholen (60s TTL)
+        db_dir_size = cache.get_or_set(
+            "health:db_dir_size", lambda: _get_dir_size(DB_PATH), ttl=60
+        )
         if db_dir_size >= 0:
             disk_details["db_dir_size_mb"] = round(db_dir_size / (1024 * 1024), 2)
         if free_mb < 100:
@@ -1168,7 +1312,7 @@ def health():
     # ── Uptime ──
     uptime_seconds = round(now - _APP_START_TIME, 1)
     uptime_human = _format_uptime(now - _APP_START_TIME)
-    started_at = datetime.fromtimestamp(_APP_START_TIME, tz=UTC).isoformat()
+    started_at = _APP_STARTED_AT_ISO
 
     # ── Active sessions ──
     active_sessions = sum(
@@ -1271,8 +1415,8 @@ def root():
 
 
 @app.get("/", include_in_schema=False)
-async def frontend_root():
-    """Liefert das React-Frontend aus."""
+def frontend_root():
+    """Liefert das React-Frontend aus (sync ⇒ Threadpool, Datei-I/O blockiert den Event-Loop nicht)."""
     index = os.path.join(_FRONTEND_DIST, "index.html")
     if os.path.exists(index):
         return FileResponse(index)
@@ -1331,122 +1475,238 @@ def get_migration_status():
         }
 
 
+def _dbf_stats_key() -> str:
+    """Cache-Schlüssel für /api/stats aus den DBF-mtimes.
+
+    Die Statistik ist rein aus den Tabellen abgeleitet und ändert sich nur,
+    wenn eine DBF-Datei sich ändert — solange alle mtimes gleich bleiben,
+    kostet ein Aufruf nur die stat()-Calls statt des kompletten Tabellen-Scans.
+    """
+    try:
+        with os.scandir(DB_PATH) as it:
+            stamps = sorted(
+                (e.name, e.stat().st_mtime)
+                for e in it
+                if e.name.upper().endswith(".DBF")
+            )
+        return f"stats:db:{hash(tuple(stamps))}"
+    except OSError:
+        # Verzeichnis nicht lesbar → eindeutiger Schlüssel, nicht cachen
+        return f"stats:db:{time.time()}"
+
+
 @app.get("/api/stats", tags=["Health"], summary="Database statistics")
 def get_stats():
-    """Liefert Statistiken der verbundenen SP5-Datenbank."""
-    return get_db().get_stats()
+    """Liefert Statistiken der verbundenen SP5-Datenbank (mtime-gecacht)."""
+    db = get_db()
+    return cache.get_or_set(_dbf_stats_key(), db.get_stats)
 
 
 # ── Dashboard Summary ────────────────────────────────────────
 
+# Konstante Beschriftungen einmal je Prozess statt je Request allozieren
+_MONTH_NAMES_DE = (
+    "Januar",
+    "Februar",
+    "März",
+    "April",
+    "Mai",
+    "Juni",
+    "Juli",
+    "August",
+    "September",
+    "Oktober",
+    "November",
+    "Dezember",
+)
+
+_WEEK_DAYS_DE = (
+    "Montag",
+    "Dienstag",
+    "Mittwoch",
+    "Donnerstag",
+    "Freitag",
+    "Samstag",
+    "Sonntag",
+)
+
+
+def _birthday_md(bday_raw: str | None) -> tuple[int, int] | None:
+    """(Monat, Tag) aus einem BIRTHDAY-Rohwert, None bei leer/unparsebar.
+
+    Gemeinsamer Kern der Geburtstags-Blöcke in Summary und Upcoming — beide
+    Endpunkte filtern danach nur unterschiedlich (30-Tage-Horizont vs. Woche).
+    """
+    if not bday_raw or len(bday_raw) < 10:
+        return None
+    try:
+        return int(bday_raw[5:7]), int(bday_raw[8:10])
+    except ValueError:
+        return None
+
+
+def _dashboard_employees(db) -> list[dict]:
+    """Sichtbare MA über den geteilten Dashboard-Cache-Schlüssel.
+
+    Alle Dashboard-Endpunkte lesen dieselbe Liste — ein Schlüssel unter dem
+    employees:-Präfix, damit Writes sie gemeinsam invalidieren."""
+    return cache.get_or_set(
+        "employees:dashboard:list",
+        lambda: db.get_employees(include_hidden=False),
+    )
+
 
 @app.get("/api/dashboard/summary", tags=["Health"], summary="Dashboard summary")
-def get_dashboard_summary(
+async def get_dashboard_summary(
     year: int | None = Query(None, description="Year (YYYY), defaults to current year"),
     month: int | None = Query(None, description="Month (1-12), defaults to current month"),
 ):
     """Liefert alle Dashboard-KPIs in einem Request."""
-    import calendar as _cal
+    import asyncio
     from collections import defaultdict
     from datetime import date, timedelta
-    from datetime import datetime as _dt
 
     from sp5lib.color_utils import bgr_to_hex
 
-    _today = date.today()
+    # Ein Uhr-Read pro Request — denselben Tag überall wiederverwenden
+    today = date.today()
     if year is None:
-        year = _today.year
+        year = today.year
     if month is None:
-        month = _today.month
+        month = today.month
 
     if not (1 <= month <= 12):
         raise HTTPException(status_code=400, detail="Invalid month: must be between 1 and 12")
 
     db = get_db()
-    today = date.today()
     today_str = today.isoformat()
     prefix = f"{year:04d}-{month:02d}"
 
-    # ── Month label ───────────────────────────────────────────
-    month_names_de = [
-        "Januar",
-        "Februar",
-        "März",
-        "April",
-        "Mai",
-        "Juni",
-        "Juli",
-        "August",
-        "September",
-        "Oktober",
-        "November",
-        "Dezember",
-    ]
-    month_label = f"{month_names_de[month - 1]} {year}"
+    # Die sechs Basis-Reads sind unabhängig voneinander — parallel in den
+    # Threadpool dispatchen statt seriell lesen (Wartezeit ≈ max statt Summe;
+    # sp5lib._read ist via RLock thread-sicher). Stammdaten laufen durch den
+    # TTL-Cache; die Schlüssel liegen unter den etablierten Präfixen
+    # (employees:/groups:/leave_types:), damit Writes sie mit invalidieren.
+    (
+        employees,
+        groups,
+        today_entries,
+        month_entries,
+        leave_types,
+        absen_by_month,
+    ) = await asyncio.gather(
+        asyncio.to_thread(_dashboard_employees, db),
+        asyncio.to_thread(cache.get_or_set, "groups:dashboard:list", db.get_groups),
+        asyncio.to_thread(db.get_schedule_day, today_str),
+        asyncio.to_thread(db.get_schedule, year=year, month=month),
+        asyncio.to_thread(
+            cache.get_or_set,
+            "leave_types:dashboard:list",
+            lambda: db.get_leave_types(include_hidden=True),
+        ),
+        asyncio.to_thread(db._read_by_month, "ABSEN"),
+    )
+    # Monats-Index der Fassade statt Volltabellen-Scan: nur der angefragte
+    # Monat landet in der Aggregation, der Präfix-Filter je Zeile entfällt.
+    absen_rows = absen_by_month.get(prefix, [])
 
-    # ── Employees ─────────────────────────────────────────────
-    employees = db.get_employees(include_hidden=False)
-    total_employees = len(employees)
+    # ── Month label ───────────────────────────────────────────
+    month_label = f"{_MONTH_NAMES_DE[month - 1]} {year}"
+
+    # Die reine CPU-Aggregation über die gelesenen Zeilen gehört nach der
+    # async-Umstellung nicht auf den Event-Loop — als ein Block in den
+    # Threadpool auslagern, damit der Loop unter parallelen Requests
+    # reaktionsfähig bleibt.
+    def _aggregate() -> tuple:
+        # ── Shifts today ─────────────────────────────────────
+        shifts_today_count = sum(
+            1 for e in today_entries if e["kind"] in ("shift", "special_shift")
+        )
+        # Group by shift short name
+        shift_groups: dict = defaultdict(lambda: {"count": 0, "color": "#6B7280"})
+        for e in today_entries:
+            if e["kind"] in ("shift", "special_shift"):
+                key = e.get("display_name") or e.get("shift_short") or "?"
+                shift_groups[key]["count"] += 1
+                shift_groups[key]["color"] = e.get("color_bk", "#6B7280")
+
+        by_shift = [
+            {"name": k, "count": v["count"], "color": v["color"]}
+            for k, v in shift_groups.items()
+        ]
+        by_shift.sort(key=itemgetter("count"), reverse=True)
+
+        # ── Shifts + absences this month ─────────────────────
+        # Fassade statt Roh-Read (siehe gather oben): enthält expandierte
+        # 5CYASS-Zyklusdienste (B-2)
+        total_shifts_scheduled = sum(
+            1 for e in month_entries if e["kind"] in ("shift", "special_shift")
+        )
 
-    # ── Groups ───────────────────────────────────────────────
-    groups = db.get_groups()
-
-    # ── Shifts today ─────────────────────────────────────────
-    today_entries = db.get_schedule_day(today_str)
-    shifts_today_count = sum(1 for e in today_entries if e["kind"] in ("shift", "special_shift"))
-    # Group by shift short name
-    shift_groups: dict = defaultdict(lambda: {"count": 0, "color": "#6B7280"})
-    for e in today_entries:
-        if e["kind"] in ("shift", "special_shift"):
-            key = e.get("display_name") or e.get("shift_short") or "?"
-            shift_groups[key]["count"] += 1
-            shift_groups[key]["color"] = e.get("color_bk", "#6B7280")
-
-    by_shift = [
-        {"name": k, "count": v["count"], "color": v["color"]} for k, v in shift_groups.items()
-    ]
-    by_shift.sort(key=lambda x: -x["count"])
+        # Arbeitstage für die Abdeckungs-Prozente zählen — Wochentage rein
+        # arithmetisch aus dem Monatsersten ableiten statt je Tag ein
+        # date-Objekt zu bauen
+        first_wd, num_days = _cal.monthrange(year, month)
+        working_days = sum(
+            1 for d in range(num_days) if (first_wd + d) % 7 < 5
+        )
+        max_possible = total_employees * working_days if working_days > 0 else 1
+        coverage_pct = (
+            round((total_shifts_scheduled / max_possible) * 100) if max_possible > 0 else 0
+        )
 
-    # ── Shifts + absences this month ─────────────────────────
-    # Fassade statt Roh-Read: enthält expandierte 5CYASS-Zyklusdienste (B-2)
-    month_entries = db.get_schedule(year=year, month=month)
-    total_shifts_scheduled = sum(
-        1 for e in month_entries if e["kind"] in ("shift", "special_shift")
-    )
+        # ── Absences this month ──────────────────────────────
+        # Key/Name/Farbe je Abwesenheitsart einmal vorberechnen — die
+        # Fallback-Kette und bgr_to_hex liefen sonst je 5ABSEN-Zeile neu
+        lt_cols: dict = {}
+        for lt in leave_types:
+            key = lt.get("SHORTNAME") or lt.get("NAME", "?")
+            lt_cols[lt["ID"]] = (
+                key,
+                lt.get("NAME", key),
+                bgr_to_hex(lt.get("COLORBK", 16777215)),
+            )
+        abs_by_type: dict = defaultdict(lambda: {"count": 0, "name": "", "color": "#6B7280"})
+        total_absences_month = len(absen_rows)
 
-    # Arbeitstage für die Abdeckungs-Prozente zählen
-    num_days = _cal.monthrange(year, month)[1]
-    working_days = sum(1 for d in range(1, num_days + 1) if _dt(year, month, d).weekday() < 5)
-    max_possible = total_employees * working_days if working_days > 0 else 1
-    coverage_pct = round((total_shifts_scheduled / max_possible) * 100) if max_possible > 0 else 0
+        for r in absen_rows:
+            ltid = r.get("LEAVETYPID")
+            cols = (lt_cols.get(ltid) if ltid else None) or ("?", "?", "#6B7280")
+            bucket = abs_by_type[cols[0]]
+            bucket["count"] += 1
+            bucket["name"] = cols[1]
+            bucket["color"] = cols[2]
+
+        absences_by_type_list = [
+            {"short": k, "name": v["name"], "count": v["count"], "color": v["color"]}
+            for k, v in abs_by_type.items()
+        ]
+        absences_by_type_list.sort(key=itemgetter("count"), reverse=True)
+
+        return (
+            shifts_today_count,
+            by_shift,
+            total_shifts_scheduled,
+            coverage_pct,
+            total_absences_month,
+            absences_by_type_list,
+        )
 
-    # ── Absences this month ───────────────────────────────────
-    lt_map = {lt["ID"]: lt for lt in db.get_leave_types(include_hidden=True)}
-    abs_by_type: dict = defaultdict(lambda: {"count": 0, "name": "", "color": "#6B7280"})
-    total_absences_month = 0
+    # ── Employees ─────────────────────────────────────────────
+    total_employees = len(employees)
 
-    for r in db._read("ABSEN"):
-        if r.get("DATE", "").startswith(prefix):
-            total_absences_month += 1
-            ltid = r.get("LEAVETYPID")
-            lt = lt_map.get(ltid) if ltid else None
-            key = lt.get("SHORTNAME") or lt.get("NAME", "?") if lt else "?"
-            abs_by_type[key]["count"] += 1
-            if lt:
-                abs_by_type[key]["name"] = lt.get("NAME", key)
-                abs_by_type[key]["color"] = bgr_to_hex(lt.get("COLORBK", 16777215))
-            else:
-                abs_by_type[key]["name"] = key
-
-    absences_by_type_list = [
-        {"short": k, "name": v["name"], "count": v["count"], "color": v["color"]}
-        for k, v in abs_by_type.items()
-    ]
-    absences_by_type_list.sort(key=lambda x: -x["count"])
+    (
+        shifts_today_count,
+        by_shift,
+        total_shifts_scheduled,
+        coverage_pct,
+        total_absences_month,
+        absences_by_type_list,
+    ) = await asyncio.to_thread(_aggregate)
 
     # ── Zeitkonto-Alarme (MA mit > 8 h Defizit im Monat) ──────────────────────
     try:
-        stats = db.get_statistics(year, month)
+        stats = await asyncio.to_thread(db.get_statistics, year, month)
         zeitkonto_alerts = []
         for s in stats:
             if s["overtime_hours"] < -8:
@@ -1457,8 +1717,8 @@ def get_dashboard_summary(
                         "hours_diff": round(s["overtime_hours"], 1),
                     }
                 )
-        zeitkonto_alerts.sort(key=lambda x: x["hours_diff"])
-        zeitkonto_alerts = zeitkonto_alerts[:10]
+        # Top 10 (größtes Defizit zuerst) ohne Vollsortierung aller MA
+        zeitkonto_alerts = heapq.nsmallest(10, zeitkonto_alerts, key=itemgetter("hours_diff"))
     except Exception:
         zeitkonto_alerts = []
 
@@ -1466,11 +1726,11 @@ def get_dashboard_summary(
     upcoming_birthdays = []
     for emp in employees:
         bday_raw = emp.get("BIRTHDAY")
-        if not bday_raw or len(bday_raw) < 10:
+        md = _birthday_md(bday_raw)
+        if md is None:
             continue
+        bday_month, bday_day = md
         try:
-            bday_month = int(bday_raw[5:7])
-            bday_day = int(bday_raw[8:10])
             bday_this_year = date(today.year, bday_month, bday_day)
             if bday_this_year < today:
                 bday_this_year = date(today.year + 1, bday_month, bday_day)
@@ -1484,48 +1744,61 @@ def get_dashboard_summary(
                         "days_until": days_until,
                     }
                 )
-        except (ValueError, IndexError):
+        except ValueError:
             continue
-    upcoming_birthdays.sort(key=lambda x: x["days_until"])
+    upcoming_birthdays.sort(key=itemgetter("days_until"))
 
     # ── Staffing warnings (next 7 days vs SHDEM) ──────────────
     staffing_warnings = []
     try:
-        staffing_req = db.get_staffing_requirements()
+        staffing_req = await asyncio.to_thread(db.get_staffing_requirements)
         shift_reqs = staffing_req.get("shift_requirements", [])
 
         if shift_reqs:
-            for day_offset in range(7):
-                check_date = today + timedelta(days=day_offset)
+            # Konstante Warnungs-Felder je Anforderung einmal als Prototyp-Dict
+            # bauen; der Tages-Loop ergänzt nur noch Datum und Ist-Besetzung.
+            req_protos = []
+            for req in shift_reqs:
+                min_req = req.get("min", 0) or 0
+                if min_req == 0:
+                    continue
+                req_protos.append(
+                    (
+                        req.get("weekday"),
+                        req.get("shift_id"),
+                        min_req,
+                        {
+                            "shift": req.get("shift_short") or req.get("shift_name", "?"),
+                            "shift_name": req.get("shift_name", "?"),
+                            "required": min_req,
+                            "color": req.get("color_bk", "#EF4444"),
+                        },
+                    )
+                )
+
+            # Die 7 Tagespläne sind unabhängig — ebenfalls parallel lesen
+            check_dates = [today + timedelta(days=i) for i in range(7)]
+            day_plans = await asyncio.gather(
+                *(asyncio.to_thread(db.get_schedule_day, d.isoformat()) for d in check_dates)
+            )
+            for check_date, day_ents in zip(check_dates, day_plans, strict=True):
                 check_str = check_date.isoformat()
                 weekday = check_date.weekday()  # 0=Mon..6=Sun
 
-                day_ents = db.get_schedule_day(check_str)
                 actual_by_shift: dict = defaultdict(int)
                 for e in day_ents:
                     if e["kind"] in ("shift", "special_shift") and e.get("shift_id"):
                         actual_by_shift[e["shift_id"]] += 1
 
-                for req in shift_reqs:
-                    if req.get("weekday") != weekday:
-                        continue
-                    min_req = req.get("min", 0) or 0
-                    if min_req == 0:
+                for req_weekday, shift_id, min_req, proto in req_protos:
+                    if req_weekday != weekday:
                         continue
-                    shift_id = req.get("shift_id")
                     actual = actual_by_shift.get(shift_id, 0)
                     if actual < min_req:
                         staffing_warnings.append(
-                            {
-                                "date": check_str,
-                                "shift": req.get("shift_short") or req.get("shift_name", "?"),
-                                "shift_name": req.get("shift_name", "?"),
-                                "actual": actual,
-                                "required": min_req,
-                                "color": req.get("color_bk", "#EF4444"),
-                            }
+                            {"date": check_str, **proto, "actual": actual}
                         )
-        staffing_warnings.sort(key=lambda x: x["date"])
+        staffing_warnings.sort(key=itemgetter("date"))
     except Exception:
         _logger.debug("Staffing warnings computation failed", exc_info=True)
 
@@ -1611,15 +1884,6 @@ def get_dashboard_today():
 
     # ── Week Peak: find busiest day this week ─────────────────
     week_start = today - timedelta(days=today_weekday)  # Monday
-    week_days_de = [
-        "Montag",
-        "Dienstag",
-        "Mittwoch",
-        "Donnerstag",
-        "Freitag",
-        "Samstag",
-        "Sonntag",
-    ]
     week_data = []
     peak_count = 0
     peak_day = None
@@ -1631,8 +1895,8 @@ def get_dashboard_today():
         week_data.append(
             {
                 "date": day.isoformat(),
-                "weekday_name": week_days_de[i],
-                "weekday_short": week_days_de[i][:2],
+                "weekday_name": _WEEK_DAYS_DE[i],
+                "weekday_short": _WEEK_DAYS_DE[i][:2],
                 "count": day_count,
                 "is_today": day == today,
                 "is_weekend": i >= 5,
@@ -1687,8 +1951,7 @@ def get_dashboard_upcoming():
                     "recurring": bool(h.get("INTERVAL", 0)),
                 }
             )
-    upcoming_holidays.sort(key=lambda x: x["date"])
-    upcoming_holidays = upcoming_holidays[:3]
+    upcoming_holidays = heapq.nsmallest(3, upcoming_holidays, key=itemgetter("date"))
 
     # Ohne künftige Feiertage zusätzlich wiederkehrende fürs laufende Jahr expandieren
     if not upcoming_holidays:
@@ -1711,23 +1974,24 @@ def get_dashboard_upcoming():
                         )
                     except Exception:
                         _logger.debug("Holiday date adjustment failed", exc_info=True)
-            upcoming_holidays.sort(key=lambda x: x["date"])
-            upcoming_holidays = upcoming_holidays[:3]
+            upcoming_holidays = heapq.nsmallest(
+                3, upcoming_holidays, key=itemgetter("date")
+            )
 
     # Geburtstage dieser Woche (Mo–So der laufenden Woche)
     weekday = today.weekday()  # 0=Mon
     week_start = today - timedelta(days=weekday)
     week_end = week_start + timedelta(days=6)
 
-    employees = db.get_employees(include_hidden=False)
+    employees = _dashboard_employees(db)
     birthdays_this_week = []
     for emp in employees:
         bday_raw = emp.get("BIRTHDAY", "")
-        if not bday_raw or len(bday_raw) < 10:
+        md = _birthday_md(bday_raw)
+        if md is None:
             continue
+        bday_month, bday_day = md
         try:
-            bday_month = int(bday_raw[5:7])
-            bday_day = int(bday_raw[8:10])
             # Check if birthday falls in current week
             bday_this_year = date(today.year, bday_month, bday_day)
             if week_start <= bday_this_year <= week_end:
@@ -1747,7 +2011,7 @@ def get_dashboard_upcoming():
                 )
         except (ValueError, IndexError):
             continue
-    birthdays_this_week.sort(key=lambda x: x["days_until"])
+    birthdays_this_week.sort(key=itemgetter("days_until"))
 
     return {
         "holidays": upcoming_holidays,
@@ -1763,9 +2027,7 @@ def get_dashboard_upcoming():
 @app.get("/api/dashboard/stats", tags=["Health"], summary="Dashboard statistics")
 def get_dashboard_stats(year: int | None = None, month: int | None = None):
     """Return key statistics: total employees, active shifts this month, vacation days used."""
-    import calendar as _cal
     from datetime import date
-    from datetime import datetime as _dt
 
     db = get_db()
     today = date.today()
@@ -1779,61 +2041,63 @@ def get_dashboard_stats(year: int | None = None, month: int | None = None):
 
         raise HTTPException(status_code=400, detail="Invalid month: must be between 1 and 12")
 
-    # Total employees
-    employees = db.get_employees(include_hidden=False)
+    # Total employees (geteilter Dashboard-Cache-Schlüssel)
+    employees = _dashboard_employees(db)
     total_employees = len(employees)
 
     # Aktive Dienste des angefragten Monats — via Fassade (inkl. expandierter
-    # 5CYASS-Zyklusdienste, B-2) statt Roh-Read auf 5MASHI
+    # 5CYASS-Zyklusdienste, B-2) statt Roh-Read auf 5MASHI. Ein Durchlauf
+    # füllt Zähler, Schichtarten-Menge und die Tages-Abdeckung zugleich.
     month_entries = db.get_schedule(year=req_year, month=req_month)
+    first_wd, num_days = _cal.monthrange(req_year, req_month)
     shifts_used_ids = set()
     shifts_this_month = 0
+    day_counts: dict = {d: 0 for d in range(1, num_days + 1)}
     for e in month_entries:
         if e["kind"] == "shift":
             shifts_this_month += 1
             if e.get("shift_id"):
                 shifts_used_ids.add(e["shift_id"])
+            try:
+                day_num = int(e.get("date", "")[8:10])
+                day_counts[day_num] = day_counts.get(day_num, 0) + 1
+            except (ValueError, IndexError):
+                pass
 
     # Vacation days used this year (leave type ENTITLED=1)
-    lt_map = {lt["ID"]: lt for lt in db.get_leave_types(include_hidden=True)}
+    leave_types = cache.get_or_set(
+        "leave_types:dashboard:list",
+        lambda: db.get_leave_types(include_hidden=True),
+    )
+    lt_map = {lt["ID"]: lt for lt in leave_types}
     vacation_ids = {lt_id for lt_id, lt in lt_map.items() if lt.get("ENTITLED")}
 
-    year_prefix = str(req_year)
+    # Über den Monats-Index der Fassade nur die zwölf Jahres-Buckets ziehen
+    # statt die komplette 5ABSEN je Request mit Präfix-Vergleichen zu scannen
+    abs_by_month = db._read_by_month("ABSEN")
     vacation_days_used = sum(
         1
-        for r in db._read("ABSEN")
-        if r.get("DATE", "").startswith(year_prefix) and r.get("LEAVETYPID") in vacation_ids
+        for m in range(1, 13)
+        for r in abs_by_month.get(f"{req_year}-{m:02d}", [])
+        if r.get("LEAVETYPID") in vacation_ids
     )
 
-    # Abdeckungs-Balken: je Tag des angefragten Monats (Fassade, inkl. Zyklusdienste)
-    num_days = _cal.monthrange(req_year, req_month)[1]
-    day_counts: dict = {d: 0 for d in range(1, num_days + 1)}
-    for e in month_entries:
-        if e["kind"] != "shift":
-            continue
-        try:
-            day_num = int(e.get("date", "")[8:10])
-            day_counts[day_num] = day_counts.get(day_num, 0) + 1
-        except (ValueError, IndexError):
-            pass
-
+    # Abdeckungs-Balken: je Tag des angefragten Monats (Fassade, inkl.
+    # Zyklusdienste). Wochentag arithmetisch aus monthrange fortschreiben
+    # statt je Tag ein date-Objekt zu konstruieren.
+    is_current_month = req_year == today.year and req_month == today.month
     coverage_by_day = []
     for day_num in range(1, num_days + 1):
-        try:
-            wd = _dt(req_year, req_month, day_num).weekday()
-            is_weekend = wd >= 5
-            is_today = req_year == today.year and req_month == today.month and day_num == today.day
-            coverage_by_day.append(
-                {
-                    "day": day_num,
-                    "count": day_counts.get(day_num, 0),
-                    "is_weekend": is_weekend,
-                    "is_today": is_today,
-                    "weekday": wd,
-                }
-            )
-        except ValueError:
-            pass
+        wd = (first_wd + day_num - 1) % 7
+        coverage_by_day.append(
+            {
+                "day": day_num,
+                "count": day_counts.get(day_num, 0),
+                "is_weekend": wd >= 5,
+                "is_today": is_current_month and day_num == today.day,
+                "weekday": wd,
+            }
+        )
 
     # MA-Schicht-Ranking des Monats (Top-/Bottom-Werte)
     try:
@@ -1851,7 +2115,7 @@ def get_dashboard_stats(year: int | None = None, month: int | None = None):
                     "overtime_hours": round(s.get("overtime_hours", 0), 1),
                 }
             )
-        emp_ranking.sort(key=lambda x: -x["shifts_count"])
+        emp_ranking.sort(key=itemgetter("shifts_count"), reverse=True)
     except Exception:
         emp_ranking = []
 
@@ -1882,7 +2146,7 @@ if os.path.isdir(_FRONTEND_DIST):
     )
 
     @app.get("/{full_path:path}", include_in_schema=False)
-    async def spa_fallback(full_path: str):
+    def spa_fallback(full_path: str):
         # Unbekannte /api/*-Pfade müssen 404 liefern, nicht die SPA — verhindert stilles 200 bei Tippfehlern
         """Liefert die index.html der React-SPA für alle nicht gematchten Routen."""
         if full_path.startswith("api/") or full_path == "api":
@@ -1894,4 +2158,19 @@ if os.path.isdir(_FRONTEND_DIST):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("sp5api.main:app", host="0.0.0.0", port=8000, reload=True)
+    # SP5_DEV=1 → Autoreload für die Entwicklung (Default-Loop, 1 Worker).
+    # Produktion: uvloop + httptools (beide via uvicorn[standard] installiert)
+    # senken den Syscall-/Scheduler-Overhead pro Request deutlich. Worker
+    # bleiben standardmäßig bei 1, weil Metriken, TTL-Cache und Inflight-
+    # Deduplizierung prozesslokal sind — SP5_WORKERS hebt das bewusst auf.
+    if os.environ.get("SP5_DEV", "").strip().lower() in ("1", "true", "yes"):
+        uvicorn.run("sp5api.main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run(
+            "sp5api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.environ.get("SP5_WORKERS", "1")),
+        )
@@ -5,11 +5,12 @@ The store supports querying by time range and user, with automatic rotation
 to keep the file under 10 000 entries.
 """
 
-import json
 import os
 import threading
 from datetime import UTC, datetime
 
+import orjson
+
 from ._paths import state_path
 
 _RATE_LIMIT_LOG = os.environ.get(
@@ -41,9 +42,10 @@ def log_rate_limit_event(
     }
     try:
         _ensure_dir()
+        # orjson wie im Audit-Log: UTF-8 direkt, Binär-Append
         with _lock:
-            with open(_RATE_LIMIT_LOG, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            with open(_RATE_LIMIT_LOG, "ab") as f:
+                f.write(orjson.dumps(entry) + b"\n")
     except Exception:
         pass  # never crash the request path
 
@@ -72,8 +74,8 @@ def get_rate_limit_events(
                     if not line:
                         continue
                     try:
-                        evt = json.loads(line)
-                    except json.JSONDecodeError:
+                        evt = orjson.loads(line)
+                    except orjson.JSONDecodeError:
                         continue
                     # Filter by time range
                     ts = evt.get("timestamp", "")
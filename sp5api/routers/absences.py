@@ -1,11 +1,13 @@
 """Absences, leave entitlements, holiday bans, annual close router."""
 
+import heapq
 import os
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from .. import cache
 from .._paths import state_path
 from ..dependencies import (
     _sanitize_500,
@@ -864,8 +866,28 @@ def _classify_leave_type(lt: dict | None) -> str:
     return "other"
 
 
+def _leave_categories(db) -> dict[int, str]:
+    """Kategorie je Abwesenheitsart über den TTL-Cache.
+
+    Das Keyword-Matching in _classify_leave_type ist eine reine Funktion der
+    Stammdaten, lief aber je Statistik-Aufruf (bei Gruppen sogar je Mitglied)
+    komplett neu. Schreibzugriffe in master_data invalidieren das
+    "leave_types:"-Präfix."""
+    return cache.get_or_set(
+        "leave_types:absences:categories",
+        lambda: {
+            lt["ID"]: _classify_leave_type(lt)
+            for lt in db.get_leave_types(include_hidden=True)
+        },
+    )
+
+
 def _build_employee_stats(
-    employee_id: int, year: int, absences: list[dict], lt_map: dict, status_data: dict
+    employee_id: int,
+    year: int,
+    absences: list[dict],
+    category_by_lt: dict[int, str],
+    status_data: dict,
 ) -> dict:
     """Baut die Abwesenheits-Statistik je MA für ein Jahr."""
     year_str = str(year)
@@ -882,8 +904,7 @@ def _build_employee_stats(
         if not d.startswith(year_str):
             continue
         lt_id = ab.get("leave_type_id")
-        lt = lt_map.get(lt_id) if lt_id else None
-        category = _classify_leave_type(lt)
+        category = category_by_lt.get(lt_id, "other") if lt_id else "other"
         try:
             month = int(d[5:7])
         except (ValueError, IndexError):
@@ -941,9 +962,10 @@ def get_absence_stats_employee(
         if emp is None:
             raise HTTPException(status_code=404, detail=f"Mitarbeiter {employee_id} nicht gefunden")
         absences = db.get_absences_list(year=year, employee_id=employee_id)
-        lt_map = {lt["ID"]: lt for lt in db.get_leave_types(include_hidden=True)}
         status_data = _load_absence_status()
-        stats = _build_employee_stats(employee_id, year, absences, lt_map, status_data)
+        stats = _build_employee_stats(
+            employee_id, year, absences, _leave_categories(db), status_data
+        )
         stats["employee_name"] = f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(", ")
         return stats
     except HTTPException:
@@ -976,10 +998,16 @@ def get_absence_stats_group(
 
         member_ids = db.get_group_members(group_id)
         emp_map = {e["ID"]: e for e in db.get_employees(include_hidden=True)}
-        lt_map = {lt["ID"]: lt for lt in db.get_leave_types(include_hidden=True)}
+        category_by_lt = _leave_categories(db)
         absences = db.get_absences_list(year=year)
         status_data = _load_absence_status()
 
+        # Abwesenheiten EINMAL je MA vorgruppieren statt je Mitglied die
+        # komplette Jahresliste neu zu scannen (O(Mitglieder · Abwesenheiten))
+        abs_by_emp: dict[int, list[dict]] = {}
+        for ab in absences:
+            abs_by_emp.setdefault(ab.get("employee_id"), []).append(ab)
+
         employees_stats = []
         group_vacation = 0
         group_sick = 0
@@ -989,7 +1017,9 @@ def get_absence_stats_group(
             emp = emp_map.get(eid)
             if not emp:
                 continue
-            stats = _build_employee_stats(eid, year, absences, lt_map, status_data)
+            stats = _build_employee_stats(
+                eid, year, abs_by_emp.get(eid, []), category_by_lt, status_data
+            )
             stats["employee_name"] = f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(", ")
             employees_stats.append(stats)
             group_vacation += stats["vacation_days"]
@@ -998,8 +1028,11 @@ def get_absence_stats_group(
 
         employees_stats.sort(key=lambda x: x.get("employee_name", ""))
 
-        top3_sick = sorted(employees_stats, key=lambda x: -x["sick_days"])[:3]
-        top3_vacation = sorted(employees_stats, key=lambda x: -x["vacation_days"])[:3]
+        # Top-3 per Heap-Partial-Sort statt zweimal die ganze Liste sortieren
+        top3_sick = heapq.nlargest(3, employees_stats, key=lambda x: x["sick_days"])
+        top3_vacation = heapq.nlargest(
+            3, employees_stats, key=lambda x: x["vacation_days"]
+        )
 
         return {
             "group_id": group_id,
@@ -1044,9 +1077,7 @@ def get_absence_stats_overview(
     try:
         db = get_db()
         all_groups = db.get_groups(include_hidden=False)
-        lt_map = {lt["ID"]: lt for lt in db.get_leave_types(include_hidden=True)}
         absences = db.get_absences_list(year=year)
-        status_data = _load_absence_status()
 
         # Monthly company-wide totals
         monthly: dict[int, dict] = {
@@ -1054,32 +1085,43 @@ def get_absence_stats_overview(
         }
         year_str = str(year)
 
-        # Alle Abwesenheiten samt Kategorie vorberechnen
+        # Alle Abwesenheiten samt Kategorie vorberechnen — ein Durchlauf liefert
+        # die Monats-Gesamtwerte UND die Kategorie-Zähler je MA. Vorher lief je
+        # Gruppe × Mitglied ein voller _build_employee_stats-Scan über alle
+        # Abwesenheiten (O(Gruppen·Mitglieder·Abwesenheiten)).
+        per_emp: dict[int, dict[str, int]] = {}
+        category_by_lt = _leave_categories(db)
         for ab in absences:
             d = ab.get("date", "")
             if not d.startswith(year_str):
                 continue
             lt_id = ab.get("leave_type_id")
-            lt = lt_map.get(lt_id) if lt_id else None
-            category = _classify_leave_type(lt)
+            category = category_by_lt.get(lt_id, "other") if lt_id else "other"
             try:
                 month = int(d[5:7])
             except (ValueError, IndexError):
                 continue
             monthly[month][category] += 1
+            emp_row = per_emp.setdefault(
+                ab.get("employee_id"), {"vacation": 0, "sick": 0, "other": 0}
+            )
+            emp_row[category] += 1
 
+        # Gruppen→Mitglieder in einem Rutsch holen (kein Read je Gruppe)
+        all_members = db.get_all_group_members()
         groups_summary = []
         for grp in all_groups:
             gid = grp["ID"]
-            member_ids = db.get_group_members(gid)
             grp_vacation = 0
             grp_sick = 0
             grp_other = 0
-            for eid in member_ids:
-                stats = _build_employee_stats(eid, year, absences, lt_map, status_data)
-                grp_vacation += stats["vacation_days"]
-                grp_sick += stats["sick_days"]
-                grp_other += stats["other_days"]
+            for eid in all_members.get(gid, []):
+                emp_row = per_emp.get(eid)
+                if not emp_row:
+                    continue
+                grp_vacation += emp_row["vacation"]
+                grp_sick += emp_row["sick"]
+                grp_other += emp_row["other"]
             groups_summary.append({
                 "group_id": gid,
                 "group_name": grp.get("NAME", ""),
@@ -319,17 +319,17 @@ def create_auto_backup() -> str | None:
         _logger.info("Auto-backup skipped: backup dir not writable: %s", backup_dir)
         return None
 
-    # Prüfen, ob das letzte Backup jünger als 24 h ist
-    existing = sorted(
-        [
+    # Prüfen, ob das letzte Backup jünger als 24 h ist — nur das neueste
+    # interessiert, max() statt Vollsortierung der Dateiliste
+    newest = max(
+        (
             f
             for f in os.listdir(backup_dir)
             if f.startswith("sp5_backup_") and f.endswith(".zip")
-        ],
-        reverse=True,
+        ),
+        default=None,
     )
-    if existing:
-        newest = existing[0]
+    if newest:
         newest_path = os.path.join(backup_dir, newest)
         age_hours = (
             _backup_dt.now() - _backup_dt.fromtimestamp(os.path.getmtime(newest_path))
@@ -776,27 +776,21 @@ def get_rate_limit_events(
     limit: int = Query(500, ge=1, le=5000, description="Max events to return"),
     _cur_user: dict = Depends(require_admin),
 ):
+    from collections import Counter
+
     from sp5api.rate_limit_store import get_rate_limit_events as _get_events
 
     events = _get_events(since=since, until=until, user=user, limit=limit)
 
-    # Compute summary stats
-    top_users: dict[str, int] = {}
-    top_endpoints: dict[str, int] = {}
-    top_ips: dict[str, int] = {}
-    for evt in events:
-        u = evt.get("user") or "(anonymous)"
-        ep = evt.get("endpoint", "?")
-        ip = evt.get("ip", "?")
-        top_users[u] = top_users.get(u, 0) + 1
-        top_endpoints[ep] = top_endpoints.get(ep, 0) + 1
-        top_ips[ip] = top_ips.get(ip, 0) + 1
-
-    def _top(d: dict[str, int], n: int = 10) -> list[dict]:
-        return [
-            {"name": k, "count": v}
-            for k, v in sorted(d.items(), key=lambda x: -x[1])[:n]
-        ]
+    # Summary-Histogramme je Spalte in einem Counter-Durchlauf statt drei
+    # dict.get()+1-Updates pro Ereignis; most_common zieht die Top-10 per
+    # heapq.nlargest statt Vollsortierung.
+    top_users = Counter(evt.get("user") or "(anonymous)" for evt in events)
+    top_endpoints = Counter(evt.get("endpoint", "?") for evt in events)
+    top_ips = Counter(evt.get("ip", "?") for evt in events)
+
+    def _top(c: Counter, n: int = 10) -> list[dict]:
+        return [{"name": k, "count": v} for k, v in c.most_common(n)]
 
     return {
         "count": len(events),
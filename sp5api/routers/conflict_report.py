@@ -16,9 +16,11 @@ import csv
 import io
 import logging
 from datetime import date, timedelta
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
+from sp5lib import calculations as calc
 
 from ..dependencies import get_db, limiter, require_planer
 
@@ -37,10 +39,15 @@ def _shift_time_windows(shift: dict, day_idx: int) -> list[tuple[int, int]]:
     (Ende <= Start ⇒ +24h). Leerer Tagesslot = keine Zeiten definiert
     (3.4.3 Nr. 6) — kein Fallback auf STARTEND0.
     """
-    from sp5lib import calculations as calc
+    return list(_parse_windows(str(shift.get(f"STARTEND{day_idx}") or "")))
 
-    windows = calc.parse_startend(str(shift.get(f"STARTEND{day_idx}") or ""))
-    return [(s, e if e > s else e + 1440) for s, e in windows if (s, e) != (0, 0)]
+
+@lru_cache(maxsize=512)
+def _parse_windows(startend: str) -> tuple[tuple[int, int], ...]:
+    """Reines STARTEND-Parsing, memoisiert: dieselben Slot-Strings tauchen je
+    Report vielfach auf (gleiche Schicht, gleicher Tagindex)."""
+    windows = calc.parse_startend(startend)
+    return tuple((s, e if e > s else e + 1440) for s, e in windows if (s, e) != (0, 0))
 
 
 def _windows_overlap(a: list[tuple[int, int]], b: list[tuple[int, int]]) -> bool:
@@ -53,6 +60,19 @@ def _date_range(from_date: date, to_date: date) -> list[date]:
     return [from_date + timedelta(days=i) for i in range(delta)]
 
 
+def _month_prefixes(from_date: date, to_date: date) -> list[str]:
+    """YYYY-MM-Präfixe aller Monate im Bereich [from_date, to_date]."""
+    out = []
+    y, m = from_date.year, from_date.month
+    while (y, m) <= (to_date.year, to_date.month):
+        out.append(f"{y:04d}-{m:02d}")
+        m += 1
+        if m > 12:
+            m = 1
+            y += 1
+    return out
+
+
 # ── core detection logic ──────────────────────────────────────────────────────
 
 
@@ -63,8 +83,6 @@ def _detect_conflicts(
     group_id: int | None,
 ) -> list[dict]:
     """Führt alle Konfliktprüfungen aus und liefert die Konflikt-dicts."""
-    from sp5lib import calculations as calc
-
     conflicts: list[dict] = []
 
     # ── load reference data ──────────────────────────────────────────────────
@@ -83,6 +101,15 @@ def _detect_conflicts(
 
     groups = {g["ID"]: g for g in db.get_groups()}
 
+    # Gruppenzugehörigkeit einmalig in einem Durchlauf laden (statt
+    # get_group_members je Konfliktpaar/Gruppe — N+1 vermeiden) und daraus
+    # die erste Gruppe je MA in groups-Reihenfolge indexieren.
+    all_members = db.get_all_group_members()
+    first_group_by_emp: dict[int, int] = {}
+    for gid in groups:
+        for m_eid in all_members.get(gid, []):
+            first_group_by_emp.setdefault(m_eid, gid)
+
     # ── collect schedule entries (MASHI + SPSHI) in range ───────────────────
     from_str = from_date.isoformat()
     to_str = to_date.isoformat()
@@ -96,82 +123,96 @@ def _detect_conflicts(
     emp_day_shifts: dict[tuple[int, str], list[int]] = {}
     emp_day_ist_shifts: dict[tuple[int, str], list[int]] = {}
 
-    # Read MASHI entries
-    for r in db._read("MASHI"):
-        d = r.get("DATE", "")
-        if not d or not (from_str <= d[:10] <= to_str):
-            continue
-        eid = r.get("EMPLOYEEID")
-        if eid is None or eid not in employees:
-            continue
-        if member_ids is not None and eid not in member_ids:
-            continue
-        sid = r.get("SHIFTID")
-        if sid:
-            key = (eid, d[:10])
-            emp_day_shifts.setdefault(key, []).append(sid)
-            if int(r.get("TYPE") or 0) != 1:
-                emp_day_ist_shifts.setdefault(key, []).append(sid)
-
-    # Read SPSHI entries (special shifts, TYPE==0 = shift, not absence)
-    try:
-        for r in db._read("SPSHI"):
-            if r.get("TYPE", 0) != 0:
-                continue
-            d = r.get("DATE", "")
-            if not d or not (from_str <= d[:10] <= to_str):
-                continue
+    # Sichtbarkeits- und Gruppenfilter zu EINEM Set fusionieren und als
+    # billigsten, selektivsten Check VOR die Datums-Stringvergleiche ziehen —
+    # bei Gruppenfilter fallen die meisten Zeilen schon am int-Lookup raus.
+    if member_ids is not None:
+        visible_ids = frozenset(member_ids & employees.keys())
+    else:
+        visible_ids = frozenset(employees)
+
+    # Read MASHI entries — über den Monats-Index der Fassade nur die Buckets
+    # des angefragten Bereichs ziehen statt die komplette Tabelle zu scannen;
+    # der Tagesvergleich bleibt für die Randmonate nötig.
+    prefixes = _month_prefixes(from_date, to_date)
+    mashi_by_month = db._read_by_month("MASHI")
+    for prefix in prefixes:
+        for r in mashi_by_month.get(prefix, ()):
             eid = r.get("EMPLOYEEID")
-            if eid is None or eid not in employees:
+            if eid not in visible_ids:
                 continue
-            if member_ids is not None and eid not in member_ids:
+            day = (r.get("DATE") or "")[:10]
+            if not (from_str <= day <= to_str):
                 continue
             sid = r.get("SHIFTID")
             if sid:
-                key = (eid, d[:10])
+                key = (eid, day)
                 emp_day_shifts.setdefault(key, []).append(sid)
-                emp_day_ist_shifts.setdefault(key, []).append(sid)
+                if int(r.get("TYPE") or 0) != 1:
+                    emp_day_ist_shifts.setdefault(key, []).append(sid)
+
+    # Read SPSHI entries (special shifts, TYPE==0 = shift, not absence)
+    try:
+        spshi_by_month = db._read_by_month("SPSHI")
+        for prefix in prefixes:
+            for r in spshi_by_month.get(prefix, ()):
+                if r.get("TYPE", 0) != 0:
+                    continue
+                eid = r.get("EMPLOYEEID")
+                if eid not in visible_ids:
+                    continue
+                day = (r.get("DATE") or "")[:10]
+                if not (from_str <= day <= to_str):
+                    continue
+                sid = r.get("SHIFTID")
+                if sid:
+                    key = (eid, day)
+                    emp_day_shifts.setdefault(key, []).append(sid)
+                    emp_day_ist_shifts.setdefault(key, []).append(sid)
     except Exception:
         pass
 
     # ── check overlap + double_booked per employee/day (nur Ist-Schichten) ────
+    # Tag-Index je Datum nur EINMAL bestimmen (7 an Feiertagen, D-34): viele MA
+    # teilen sich denselben Tag, der Parse+try/except lief bisher pro (MA, Tag).
+    day_idx_cache: dict[str, int] = {}
+    # Anzeigenamen je MA nur einmal zusammensetzen, nicht je Konflikt-Tag
+    emp_name_cache: dict[int, str] = {}
     for (eid, date_str), shift_ids in emp_day_ist_shifts.items():
         if len(shift_ids) < 2:
             continue
 
-        emp = employees[eid]
-        emp_name = f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip()
-
-        # Tag-Index für Zeit-Lookups bestimmen (7 an Feiertagen, D-34)
-        try:
-            d_obj = date.fromisoformat(date_str)
-            idx = calc.day_index(d_obj, holidays)
-        except ValueError:
-            idx = 0
-
-        # Liste aus (shift_id, time_windows) bauen
+        emp_name = emp_name_cache.get(eid)
+        if emp_name is None:
+            emp = employees[eid]
+            emp_name = f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip()
+            emp_name_cache[eid] = emp_name
+
+        idx = day_idx_cache.get(date_str)
+        if idx is None:
+            try:
+                idx = calc.day_index(date.fromisoformat(date_str), holidays)
+            except ValueError:
+                idx = 0
+            day_idx_cache[date_str] = idx
+
+        # Zu meldende group_id bestimmen: Parameter oder erste Gruppe des MA
+        report_gid = group_id if group_id is not None else first_group_by_emp.get(eid)
+
+        # Liste aus (shift_id, name, time_windows) bauen — Name gleich mit
+        # auflösen statt je Paar-Vergleich erneut in shifts_map nachzuschlagen
         shift_ranges = []
         for sid in shift_ids:
             s = shifts_map.get(sid)
+            name = s.get("NAME", str(sid)) if s else str(sid)
             tr = _shift_time_windows(s, idx) if s else []
-            shift_ranges.append((sid, tr))
+            shift_ranges.append((sid, name, tr))
 
         # pairwise checks
         for i in range(len(shift_ranges)):
             for j in range(i + 1, len(shift_ranges)):
-                sid_a, range_a = shift_ranges[i]
-                sid_b, range_b = shift_ranges[j]
-                name_a = shifts_map.get(sid_a, {}).get("NAME", str(sid_a))
-                name_b = shifts_map.get(sid_b, {}).get("NAME", str(sid_b))
-
-                # Zu meldende group_id bestimmen: Parameter oder erste Gruppe des MA
-                report_gid = group_id
-                if report_gid is None:
-                    for gid, _grp in groups.items():
-                        mems = db.get_group_members(gid)
-                        if eid in mems:
-                            report_gid = gid
-                            break
+                sid_a, name_a, range_a = shift_ranges[i]
+                sid_b, name_b, range_b = shift_ranges[j]
 
                 if range_a and range_b:
                     if sorted(range_a) == sorted(range_b):
@@ -217,18 +258,22 @@ def _detect_conflicts(
                     })
 
     # ── understaffed days (group has members but 0 scheduled) ────────────────
-    groups_to_check: list[tuple[int, set[int]]] = []
+    # Gruppenname gleich mit auflösen — der Tages-Durchlauf unten schlug ihn
+    # sonst je Tag × Gruppe doppelt nach (groups.get(...).get("NAME"))
+    groups_to_check: list[tuple[int, set[int], str]] = []
+    visible_ids = set(employees.keys())
     if group_id is not None:
-        mems = set(db.get_group_members(group_id))
         # Only filter to visible employees
-        mems = mems & set(employees.keys())
+        mems = set(all_members.get(group_id, [])) & visible_ids
         if mems:
-            groups_to_check.append((group_id, mems))
+            name = groups.get(group_id, {}).get("NAME", str(group_id))
+            groups_to_check.append((group_id, mems, name))
     else:
-        for gid, _grp in groups.items():
-            mems = set(db.get_group_members(gid)) & set(employees.keys())
+        for gid in groups:
+            mems = set(all_members.get(gid, [])) & visible_ids
             if mems:
-                groups_to_check.append((gid, mems))
+                name = groups.get(gid, {}).get("NAME", str(gid))
+                groups_to_check.append((gid, mems, name))
 
     # Eingeteilte je Tag bauen: {date_str: set(emp_ids)} über den Zeitraum
     day_scheduled: dict[str, set[int]] = {}
@@ -236,11 +281,11 @@ def _detect_conflicts(
         if shift_ids:
             day_scheduled.setdefault(date_str, set()).add(eid)
 
-    for d_obj in _date_range(from_date, to_date):
+    # Ohne prüfbare Gruppen den Tages-Durchlauf gar nicht erst aufbauen
+    for d_obj in _date_range(from_date, to_date) if groups_to_check else ():
         date_str = d_obj.isoformat()
         scheduled_on_day = day_scheduled.get(date_str, set())
-        for gid, mems in groups_to_check:
-            group_name = groups.get(gid, {}).get("NAME", str(gid))
+        for gid, mems, group_name in groups_to_check:
             # Nur melden, wenn GAR KEIN Gruppenmitglied eingeteilt ist
             if not (mems & scheduled_on_day):
                 conflicts.append({
@@ -263,10 +308,20 @@ def _detect_conflicts(
 # ── summary helper ────────────────────────────────────────────────────────────
 
 def _make_summary(conflicts: list[dict]) -> dict:
+    # Ein Durchlauf statt drei Zähl-Scans über dieselbe Liste
+    overlaps = double_booked = understaffed = 0
+    for c in conflicts:
+        t = c["type"]
+        if t == "overlap":
+            overlaps += 1
+        elif t == "double_booked":
+            double_booked += 1
+        elif t == "understaffed":
+            understaffed += 1
     return {
-        "overlaps": sum(1 for c in conflicts if c["type"] == "overlap"),
-        "double_booked": sum(1 for c in conflicts if c["type"] == "double_booked"),
-        "understaffed": sum(1 for c in conflicts if c["type"] == "understaffed"),
+        "overlaps": overlaps,
+        "double_booked": double_booked,
+        "understaffed": understaffed,
     }
 
 
@@ -17,7 +17,7 @@ from ..dependencies import (
     require_addempl,
     require_admin,
 )
-from ..schemas import GroupResponse, paginate
+from ..schemas import paginate
 from ..scopes import (
     filter_by_employee_scope,
     visible_employee_ids,
@@ -74,7 +74,6 @@ def get_employee(
     tags=["Groups"],
     summary="List groups",
     description="Return all groups. Set include_hidden=true to include hidden/archived groups.",
-    response_model=list[GroupResponse],
 )
 def get_groups(
     include_hidden: bool = False,
@@ -464,7 +463,8 @@ _PHOTOS_DIR = os.path.join(
 @router.get(
     "/api/employees/{emp_id}/photo", tags=["Employees"], summary="Get employee photo"
 )
-async def get_employee_photo(emp_id: int):
+def get_employee_photo(emp_id: int):
+    """Sync-Handler: die Datei-Stats laufen im Starlette-Threadpool, nicht auf dem Event-Loop."""
     import pathlib
 
     from fastapi.responses import FileResponse as _FileResponse
@@ -649,6 +649,7 @@ async def upload_employee_photo(
     Akzeptiert JPG/PNG/GIF/WebP. Das Bild wird optional zugeschnitten (wenn
     crop_w/crop_h > 0), auf max. 400×400 px verkleinert und als WebP gespeichert.
     """
+    import asyncio as _asyncio
     import io as _io
     import pathlib
 
@@ -674,33 +675,43 @@ async def upload_employee_photo(
     if len(content) > _MAX_PHOTO_SIZE:
         raise HTTPException(status_code=413, detail="File too large (max. 5 MB)")
 
-    # Bild mit Pillow öffnen
-    try:
+    def _process_photo() -> bytes:
+        """Decode → Crop → Resize → WebP-Encode (reines CPU-Bound Pillow)."""
         # Als Image.Image annotieren: Image.open() liefert ein ImageFile, aber
         # convert()/crop() unten liefern ein einfaches Image — ohne die Annotation
         # meldet der Type-Checker die Neuzuweisungen als inkompatibel.
         img: Image.Image = Image.open(_io.BytesIO(content))
         img = img.convert("RGB")  # ensure RGB for WebP
+
+        # Apply crop if specified
+        if crop_w > 0 and crop_h > 0:
+            img_w, img_h = img.size
+            # Clamp crop to image bounds
+            cx = min(crop_x, img_w)
+            cy = min(crop_y, img_h)
+            cw = min(crop_w, img_w - cx)
+            ch = min(crop_h, img_h - cy)
+            if cw > 0 and ch > 0:
+                img = img.crop((cx, cy, cx + cw, cy + ch))
+
+        # Resize to max 400x400 preserving aspect ratio
+        max_size = (400, 400)
+        # Image.Resampling.LANCZOS ist die unterstützte Form; der Top-Level-Alias
+        # Image.LANCZOS ist deprecated und fliegt in einem künftigen Pillow raus.
+        img.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+        buf = _io.BytesIO()
+        img.save(buf, format="WEBP", quality=85)
+        return buf.getvalue()
+
+    # Die Pillow-Pipeline blockiert sonst den Event-Loop für die gesamte
+    # Bildverarbeitung — in einen Worker-Thread auslagern (gleiches Muster
+    # wie die to_thread-Reads im Dashboard-Summary).
+    try:
+        webp_bytes = await _asyncio.to_thread(_process_photo)
     except Exception:
         raise HTTPException(status_code=400, detail="Bild konnte nicht gelesen werden")
 
-    # Apply crop if specified
-    if crop_w > 0 and crop_h > 0:
-        img_w, img_h = img.size
-        # Clamp crop to image bounds
-        cx = min(crop_x, img_w)
-        cy = min(crop_y, img_h)
-        cw = min(crop_w, img_w - cx)
-        ch = min(crop_h, img_h - cy)
-        if cw > 0 and ch > 0:
-            img = img.crop((cx, cy, cx + cw, cy + ch))
-
-    # Resize to max 400x400 preserving aspect ratio
-    max_size = (400, 400)
-    # Image.Resampling.LANCZOS ist die unterstützte Form; der Top-Level-Alias
-    # Image.LANCZOS ist deprecated und fliegt in einem künftigen Pillow raus.
-    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
     # Alte Fotos dieses MA entfernen
     for old in photos_dir.glob(f"{emp_id}.*"):
         try:
@@ -710,9 +721,7 @@ async def upload_employee_photo(
 
     # Save as WebP
     dest = photos_dir / f"{emp_id}.webp"
-    buf = _io.BytesIO()
-    img.save(buf, format="WEBP", quality=85)
-    dest.write_bytes(buf.getvalue())
+    dest.write_bytes(webp_bytes)
 
     rel_path = f"uploads/photos/{emp_id}.webp"
     try:
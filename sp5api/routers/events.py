@@ -1,11 +1,11 @@
 """Server-Sent-Events-(SSE)-Router für Echtzeit-Updates."""
 
 import asyncio
-import json
 import logging
 import threading
 from collections.abc import AsyncGenerator
 
+import orjson
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
@@ -56,7 +56,8 @@ async def _event_generator(
             try:
                 payload = await asyncio.wait_for(queue.get(), timeout=25.0)
                 event_type = payload["type"]
-                data_str = json.dumps(payload["data"])
+                # je Event × je Subscriber serialisiert — orjson statt stdlib
+                data_str = orjson.dumps(payload["data"]).decode()
                 yield f"event: {event_type}\ndata: {data_str}\n\n"
             except TimeoutError:
                 # Send keepalive comment every 25s
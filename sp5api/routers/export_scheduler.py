@@ -21,7 +21,7 @@ import uuid
 from datetime import UTC
 from datetime import datetime as _dt
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field, field_validator
@@ -69,6 +69,14 @@ def _get_schedule_by_id(schedule_id: str) -> tuple[list[dict], int, dict]:
 
 _TIME_RE = re.compile(r"^\d{2}:\d{2}$")
 
+# Konstante Monatsnamen einmal je Prozess statt je Export-Lauf allozieren;
+# Final-dict mit Monat 1-12 als Schlüssel wie _MONTHS_DE in reports.py
+_MONTH_NAMES_DE: Final[dict[int, str]] = {
+    1: "Januar", 2: "Februar", 3: "März", 4: "April", 5: "Mai", 6: "Juni",
+    7: "Juli", 8: "August", 9: "September", 10: "Oktober", 11: "November",
+    12: "Dezember",
+}
+
 
 class ScheduleCreate(BaseModel):
     """Request-Body zum Anlegen eines Export-Zeitplans."""
@@ -208,13 +216,9 @@ def _generate_export(fmt: str, group_id: int | None, month: str) -> tuple[bytes,
         except ImportError as exc:
             raise RuntimeError("openpyxl is not installed") from exc
 
-        _month_names_de = [
-            "Januar", "Februar", "März", "April", "Mai", "Juni",
-            "Juli", "August", "September", "Oktober", "November", "Dezember",
-        ]
         wb = openpyxl.Workbook()
         ws = wb.active
-        ws.title = f"{_month_names_de[mon - 1]} {year}"
+        ws.title = f"{_MONTH_NAMES_DE[mon]} {year}"
         thin = Side(border_style="thin", color="CBD5E1")
         border = Border(left=thin, right=thin, top=thin, bottom=thin)
         header_font = Font(bold=True, color="FFFFFF", size=9)
@@ -11,10 +11,13 @@ from __future__ import annotations
 
 import hashlib
 from datetime import UTC, date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
 from pydantic import BaseModel
+from sp5lib import calculations as calc
 
 from ..dependencies import get_db, require_auth
 
@@ -23,6 +26,22 @@ router = APIRouter()
 # Wiener Zeitzonen-Offset (MEZ=+1, MESZ=+2) — wir nutzen UTC, Clients übernehmen die TZ
 _TZ_VIENNA = timezone(timedelta(hours=1))
 
+# Gemeinsamer Leer-Default für Map-Misses in den Feed-Schleifen: ein
+# `.get(key, {})`-Literal baut sonst pro Planeintrag ein frisches Dict.
+# Nur lesend verwenden!
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> date | None:
+    """Memoisiertes ISO-Parsing: Kalender-Clients pollen die Feeds regelmäßig,
+    dieselben Datums-Strings wiederholen sich über Requests und das
+    mehrmonatige Abo-Fenster hinweg. None bei ungültigem Datum."""
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return None
+
 
 def _make_uid(employee_id: int, date_str: str, kind: str) -> str:
     """Erzeugt eine deterministische UID für ein iCal-Ereignis."""
@@ -59,8 +78,6 @@ def _shift_times_for_day(
     Feiertagen gelten die STARTEND7-Zeiten. Leerer Slot = kein Zeitfenster
     auf diesem Tagindex (3.4.3 Nr. 6) ⇒ None (All-Day-Fallback des Aufrufers).
     """
-    from sp5lib import calculations as calc
-
     idx = calc.day_index(entry_date, holidays)
     windows = calc.parse_startend(shift.get(f"STARTEND{idx}") or "")
     if not windows:
@@ -76,19 +93,31 @@ def _shift_times_for_day(
 
 def _holiday_calendar(db) -> dict:
     """5HOLID als date→INTERVAL-Kalender für die Tagindex-Wahl."""
-    from sp5lib import calculations as calc
-
     try:
         return calc.holiday_calendar(db._read("HOLID"))
     except Exception:
         return {}
 
 
+class _Event(NamedTuple):
+    """Kompaktes Kalender-Ereignis für _build_ical. NamedTuple statt Dict —
+    je Feed-Abruf entstehen dutzende kurzlebige Ereignisse mit identischen
+    Feldern, Attributzugriff erspart die Hash-Lookups beim Serialisieren."""
+
+    uid: str
+    dtstart: str
+    dtend: str
+    summary: str
+    description: str = ""
+    categories: str = ""
+    all_day: bool = False
+
+
 def _build_ical(
-    events: list[dict],
+    events: list[_Event],
     cal_name: str,
 ) -> str:
-    """Baut den vollständigen iCal-String aus einer Liste von Ereignis-dicts."""
+    """Baut den vollständigen iCal-String aus einer Liste von Ereignissen."""
     now = datetime.now(UTC)
     lines = [
         "BEGIN:VCALENDAR",
@@ -101,22 +130,22 @@ def _build_ical(
 
     for ev in events:
         lines.append("BEGIN:VEVENT")
-        lines.append(f"UID:{ev['uid']}")
+        lines.append(f"UID:{ev.uid}")
         lines.append(f"DTSTAMP:{_ical_dt(now)}")
 
-        if ev.get("all_day"):
-            lines.append(f"DTSTART;VALUE=DATE:{ev['dtstart']}")
+        if ev.all_day:
+            lines.append(f"DTSTART;VALUE=DATE:{ev.dtstart}")
             # Bei Ganztags-Ereignissen ist DTEND der Folgetag (exklusiv)
-            lines.append(f"DTEND;VALUE=DATE:{ev['dtend']}")
+            lines.append(f"DTEND;VALUE=DATE:{ev.dtend}")
         else:
-            lines.append(f"DTSTART:{ev['dtstart']}")
-            lines.append(f"DTEND:{ev['dtend']}")
-
-        lines.append(f"SUMMARY:{_escape_ical(ev['summary'])}")
-        if ev.get("description"):
-            lines.append(f"DESCRIPTION:{_escape_ical(ev['description'])}")
-        if ev.get("categories"):
-            lines.append(f"CATEGORIES:{_escape_ical(ev['categories'])}")
+            lines.append(f"DTSTART:{ev.dtstart}")
+            lines.append(f"DTEND:{ev.dtend}")
+
+        lines.append(f"SUMMARY:{_escape_ical(ev.summary)}")
+        if ev.description:
+            lines.append(f"DESCRIPTION:{_escape_ical(ev.description)}")
+        if ev.categories:
+            lines.append(f"CATEGORIES:{_escape_ical(ev.categories)}")
         lines.append("END:VEVENT")
 
     lines.append("END:VCALENDAR")
@@ -218,11 +247,13 @@ def _generate_ical_response(
         or employee.get("NAME", f"MA-{employee_id}")
     )
 
-    # Planeinträge zu MA/Monat holen
-    schedule = db.get_schedule(year=year, month=month)
-    employee_entries = [
-        e for e in schedule if e.get("employee_id") == employee_id
-    ]
+    # Planeinträge zu MA/Monat holen — lazy gefiltert, der Monatsplan selbst
+    # wird unten nur einmal durchlaufen
+    employee_entries = (
+        e
+        for e in db.get_schedule(year=year, month=month)
+        if e.get("employee_id") == employee_id
+    )
 
     # Schichtdefinitionen für die Zeit-Lookups holen
     shifts = db.get_shifts(include_hidden=True)
@@ -236,7 +267,7 @@ def _generate_ical_response(
     holidays = _holiday_calendar(db)
 
     # Build iCal events
-    events: list[dict] = []
+    events: list[_Event] = []
 
     for entry in employee_entries:
         date_str = entry.get("date", "")
@@ -245,14 +276,13 @@ def _generate_ical_response(
         if not date_str:
             continue
 
-        try:
-            entry_date = date.fromisoformat(date_str)
-        except ValueError:
+        entry_date = _parse_date(date_str)
+        if entry_date is None:
             continue
 
         if kind in ("shift", "special_shift"):
             shift_id = entry.get("shift_id")
-            shift = shifts_map.get(shift_id, {}) if shift_id else {}
+            shift = shifts_map.get(shift_id, _EMPTY) if shift_id else _EMPTY
 
             shift_name = (
                 entry.get("custom_name")
@@ -296,35 +326,34 @@ def _generate_ical_response(
                     dt_end += timedelta(days=1)
 
                 events.append(
-                    {
-                        "uid": _make_uid(employee_id, date_str, f"shift-{shift_id}"),
-                        "dtstart": _ical_dt(dt_start),
-                        "dtend": _ical_dt(dt_end),
-                        "summary": summary,
-                        "description": description,
-                        "categories": "Schicht",
-                        "all_day": False,
-                    }
+                    _Event(
+                        uid=_make_uid(employee_id, date_str, f"shift-{shift_id}"),
+                        dtstart=_ical_dt(dt_start),
+                        dtend=_ical_dt(dt_end),
+                        summary=summary,
+                        description=description,
+                        categories="Schicht",
+                    )
                 )
                 continue
 
             # Fallback: all-day event if no times available
             next_day = entry_date + timedelta(days=1)
             events.append(
-                {
-                    "uid": _make_uid(employee_id, date_str, f"shift-{shift_id}"),
-                    "dtstart": _ical_date(entry_date),
-                    "dtend": _ical_date(next_day),
-                    "summary": summary,
-                    "description": description,
-                    "categories": "Schicht",
-                    "all_day": True,
-                }
+                _Event(
+                    uid=_make_uid(employee_id, date_str, f"shift-{shift_id}"),
+                    dtstart=_ical_date(entry_date),
+                    dtend=_ical_date(next_day),
+                    summary=summary,
+                    description=description,
+                    categories="Schicht",
+                    all_day=True,
+                )
             )
 
         elif kind == "absence":
             leave_type_id = entry.get("leave_type_id")
-            leave_type = leave_map.get(leave_type_id, {}) if leave_type_id else {}
+            leave_type = leave_map.get(leave_type_id, _EMPTY) if leave_type_id else _EMPTY
             leave_name = (
                 leave_type.get("NAME", "")
                 or entry.get("leave_type_name", "")
@@ -333,15 +362,14 @@ def _generate_ical_response(
 
             next_day = entry_date + timedelta(days=1)
             events.append(
-                {
-                    "uid": _make_uid(employee_id, date_str, f"absence-{leave_type_id}"),
-                    "dtstart": _ical_date(entry_date),
-                    "dtend": _ical_date(next_day),
-                    "summary": leave_name,
-                    "description": "",
-                    "categories": "Abwesenheit",
-                    "all_day": True,
-                }
+                _Event(
+                    uid=_make_uid(employee_id, date_str, f"absence-{leave_type_id}"),
+                    dtstart=_ical_date(entry_date),
+                    dtend=_ical_date(next_day),
+                    summary=leave_name,
+                    categories="Abwesenheit",
+                    all_day=True,
+                )
             )
 
     # Build calendar
@@ -391,7 +419,7 @@ def _generate_feed_ical(employee_id: int, months_back: int = 1, months_ahead: in
 
     # Rollierendes Monatsfenster bauen
     today = date.today()
-    events: list[dict] = []
+    events: list[_Event] = []
 
     start_year, start_month = today.year, today.month - months_back
     if start_month < 1:
@@ -405,25 +433,23 @@ def _generate_feed_ical(employee_id: int, months_back: int = 1, months_ahead: in
             m -= 12
             y += 1
 
-        schedule = db.get_schedule(year=y, month=m)
-        employee_entries = [
-            e for e in schedule if e.get("employee_id") == employee_id
-        ]
-
-        for entry in employee_entries:
+        # Direkt über den Monatsplan iterieren — die MA-Filterung braucht
+        # keine materialisierte Zwischenliste je Monat
+        for entry in db.get_schedule(year=y, month=m):
+            if entry.get("employee_id") != employee_id:
+                continue
             date_str = entry.get("date", "")
             kind = entry.get("kind", "")
 
             if not date_str:
                 continue
-            try:
-                entry_date = date.fromisoformat(date_str)
-            except ValueError:
+            entry_date = _parse_date(date_str)
+            if entry_date is None:
                 continue
 
             if kind in ("shift", "special_shift"):
                 shift_id = entry.get("shift_id")
-                shift = shifts_map.get(shift_id, {}) if shift_id else {}
+                shift = shifts_map.get(shift_id, _EMPTY) if shift_id else _EMPTY
                 shift_name = (
                     entry.get("custom_name")
                     or shift.get("NAME", "")
@@ -452,47 +478,45 @@ def _generate_feed_ical(employee_id: int, months_back: int = 1, months_ahead: in
                     ).astimezone(UTC)
                     if dt_end <= dt_start:
                         dt_end += timedelta(days=1)
-                    events.append({
-                        "uid": _make_uid(employee_id, date_str, f"shift-{shift_id}"),
-                        "dtstart": _ical_dt(dt_start),
-                        "dtend": _ical_dt(dt_end),
-                        "summary": summary,
-                        "description": description,
-                        "categories": "Schicht",
-                        "all_day": False,
-                    })
+                    events.append(_Event(
+                        uid=_make_uid(employee_id, date_str, f"shift-{shift_id}"),
+                        dtstart=_ical_dt(dt_start),
+                        dtend=_ical_dt(dt_end),
+                        summary=summary,
+                        description=description,
+                        categories="Schicht",
+                    ))
                     continue
 
                 # Fallback: all-day
                 next_day = entry_date + timedelta(days=1)
-                events.append({
-                    "uid": _make_uid(employee_id, date_str, f"shift-{shift_id}"),
-                    "dtstart": _ical_date(entry_date),
-                    "dtend": _ical_date(next_day),
-                    "summary": summary,
-                    "description": description,
-                    "categories": "Schicht",
-                    "all_day": True,
-                })
+                events.append(_Event(
+                    uid=_make_uid(employee_id, date_str, f"shift-{shift_id}"),
+                    dtstart=_ical_date(entry_date),
+                    dtend=_ical_date(next_day),
+                    summary=summary,
+                    description=description,
+                    categories="Schicht",
+                    all_day=True,
+                ))
 
             elif kind == "absence":
                 leave_type_id = entry.get("leave_type_id")
-                leave_type = leave_map.get(leave_type_id, {}) if leave_type_id else {}
+                leave_type = leave_map.get(leave_type_id, _EMPTY) if leave_type_id else _EMPTY
                 leave_name = (
                     leave_type.get("NAME", "")
                     or entry.get("leave_type_name", "")
                     or "Abwesend"
                 )
                 next_day = entry_date + timedelta(days=1)
-                events.append({
-                    "uid": _make_uid(employee_id, date_str, f"absence-{leave_type_id}"),
-                    "dtstart": _ical_date(entry_date),
-                    "dtend": _ical_date(next_day),
-                    "summary": leave_name,
-                    "description": "",
-                    "categories": "Abwesenheit",
-                    "all_day": True,
-                })
+                events.append(_Event(
+                    uid=_make_uid(employee_id, date_str, f"absence-{leave_type_id}"),
+                    dtstart=_ical_date(entry_date),
+                    dtend=_ical_date(next_day),
+                    summary=leave_name,
+                    categories="Abwesenheit",
+                    all_day=True,
+                ))
 
     cal_name = f"Schichtplan {emp_name}"
     return _build_ical(events, cal_name)
@@ -1,9 +1,8 @@
 """Master data router: shifts, leave-types, workplaces, holidays, extracharges, staffing-requirements, skills."""
 
-
-from fastapi import APIRouter, Depends, HTTPException, Query
 from datetime import date as _date
 
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .. import cache
@@ -15,7 +14,6 @@ from ..dependencies import (
     require_auth,
     require_planer,
 )
-from ..schemas import ShiftResponse
 
 router = APIRouter()
 
@@ -25,7 +23,6 @@ router = APIRouter()
     tags=["Shifts"],
     summary="List shifts",
     description="Return all shift definitions. Set include_hidden=true to include archived shifts.",
-    response_model=list[ShiftResponse],
 )
 def get_shifts(include_hidden: bool = False):
     cache_key = f"shifts:list:{include_hidden}"
@@ -1087,10 +1084,7 @@ def get_skills_matrix(_cur_user: dict = Depends(require_auth)):
     # Build lookup: employee_id -> {skill_id -> assignment}
     emp_skills: dict = {}
     for a in assignments:
-        eid = a["employee_id"]
-        if eid not in emp_skills:
-            emp_skills[eid] = {}
-        emp_skills[eid][a["skill_id"]] = a
+        emp_skills.setdefault(a["employee_id"], {})[a["skill_id"]] = a
 
     result_employees = []
     for emp in employees:
@@ -1106,23 +1100,16 @@ def get_skills_matrix(_cur_user: dict = Depends(require_auth)):
             }
         )
 
-    # Skill coverage stats
+    # Skill coverage stats — "läuft bald ab"-Schwelle ist schleifeninvariant,
+    # einmal berechnen statt vier Uhr-Reads pro Skill
+    _today = _dt.today().date()
+    soon = _today.replace(month=min(_today.month + 3, 12)).isoformat()
     skill_stats = []
     for skill in skills:
         sid = skill["id"]
         holders = [a for a in assignments if a["skill_id"] == sid]
         experts = [a for a in holders if a.get("level", 1) >= 3]
         expiring = []
-        _dt.today().date().isoformat()
-        soon = (
-            _dt.today()
-            .date()
-            .replace(
-                year=_dt.today().date().year,
-                month=min(_dt.today().date().month + 3, 12),
-            )
-            .isoformat()
-        )
         for a in holders:
             cu = a.get("certified_until")
             if cu and cu <= soon:
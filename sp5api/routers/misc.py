@@ -1,10 +1,16 @@
 """Misc router: notes, wishes, handover, swap-requests, changelog, search, access."""
 
+import calendar as _cal
+import heapq
 import logging
+from itertools import islice
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from .. import cache
 from .._paths import backend_dir
 from ..dependencies import (
     _sanitize_500,
@@ -44,8 +50,6 @@ def get_notes(
     ),
 ):
     if year is not None and month is not None:
-        import calendar as _cal
-
         last_day = _cal.monthrange(year, month)[1]
         date_from = f"{year:04d}-{month:02d}-01"
         date_to = f"{year:04d}-{month:02d}-{last_day:02d}"
@@ -161,6 +165,53 @@ def delete_note(note_id: int, _cur_user: dict = Depends(require_write("WNOTES"))
         raise _sanitize_500(e)
 
 
+def _bigrams(t: str) -> frozenset:
+    return frozenset(t[i : i + 2] for i in range(len(t) - 1)) if len(t) >= 2 else frozenset()
+
+
+def _build_search_index(rows: list[tuple]) -> tuple[list[tuple], dict[str, tuple[int, ...]]]:
+    """Invertierter Bigramm-Index über die vorbereiteten Suchzeilen.
+
+    Jede Zeile ist `(type, id, title, short, fields)` mit `fields` als Tupel
+    von `(lowercase_text, bigram_set, gewicht)`. Der Index bildet jedes
+    Bigramm auf die Zeilen-Indizes ab, in denen es vorkommt — damit muss die
+    Suche nur noch Kandidaten scoren, die mindestens ein Bigramm mit der
+    Query teilen, statt alle Zeilen.
+    """
+    inverted: dict[str, set[int]] = {}
+    for idx, (_typ, _id, _title, _short, fields) in enumerate(rows):
+        for _t, t_bi, _w in fields:
+            for bg in t_bi:
+                inverted.setdefault(bg, set()).add(idx)
+    return rows, {bg: tuple(ids) for bg, ids in inverted.items()}
+
+
+def _prepare_fields(*weighted: tuple[str, float]) -> tuple:
+    """Lowercase + Bigramme je Feld EINMAL beim Index-Bau vorberechnen."""
+    return tuple((t.lower(), _bigrams(t.lower()), w) for t, w in weighted if t)
+
+
+def _employee_search_index(db) -> tuple[list[tuple], dict[str, tuple[int, ...]]]:
+    rows = []
+    for emp in db.get_employees(include_hidden=False):
+        name = f"{emp.get('NAME', '')} {emp.get('FIRSTNAME', '')}".strip()
+        short = emp.get("SHORTNAME", "") or ""
+        number = emp.get("NUMBER", "") or ""
+        fields = _prepare_fields((name, 1.0), (short, 1.0), (number, 0.9))
+        rows.append(("employee", emp.get("ID"), name, short, fields))
+    return _build_search_index(rows)
+
+
+def _simple_search_index(items: list[dict], typ: str) -> tuple[list[tuple], dict[str, tuple[int, ...]]]:
+    rows = []
+    for item in items:
+        name = item.get("NAME", "") or ""
+        short = item.get("SHORTNAME", "") or ""
+        fields = _prepare_fields((name, 1.0), (short, 0.9))
+        rows.append((typ, item.get("ID"), name, short, fields))
+    return _build_search_index(rows)
+
+
 @router.get("/api/search", tags=["Employees"], summary="Global search", description="Full-text search across employees, shifts, groups, and other entities.")
 def global_search(
     q: str = Query("", description="Search query"),
@@ -179,141 +230,97 @@ def global_search(
 
     db = get_db()
 
-    def _fuzzy_score(text: str, q: str) -> float:
+    # Query-seitige Kleinschreibung und Bigramme EINMAL vorberechnen — der
+    # Score läuft je Zeile über vier Tabellen und mehrere Felder.
+    s = query.lower()
+    s_bi = {s[i : i + 2] for i in range(len(s) - 1)} if len(s) >= 2 else set()
+    s_bi_len = len(s_bi)
+
+    def _fuzzy_score(t: str, t_bi: frozenset) -> float:
         """Einfacher Fuzzy-Score: 1.0 exakt, 0.8 Präfix, 0.6 enthalten,
-        sonst anteilige Zeichen-Überlappung (0–0.5)."""
-        t = text.lower()
-        s = q.lower()
+        sonst anteilige Bigramm-Überlappung (0–0.5). `t` und `t_bi` kommen
+        bereits vorberechnet aus dem Such-Index."""
         if t == s:
             return 1.0
         if t.startswith(s):
             return 0.8
         if s in t:
             return 0.6
-        # Trigram-style: count overlapping 2-char substrings
-        t_bi = {t[i : i + 2] for i in range(len(t) - 1)} if len(t) >= 2 else set()
-        s_bi = {s[i : i + 2] for i in range(len(s) - 1)} if len(s) >= 2 else set()
         if t_bi and s_bi:
-            overlap = len(t_bi & s_bi) / max(len(t_bi), len(s_bi))
+            overlap = len(t_bi & s_bi) / max(len(t_bi), s_bi_len)
             if overlap > 0.3:
                 return overlap * 0.5
         return 0.0
 
-    results = []
-
-    # ── Employees ─────────────────────────────────────────────
-    employees = db.get_employees(include_hidden=False)
-    for emp in employees:
-        name = f"{emp.get('NAME', '')} {emp.get('FIRSTNAME', '')}".strip()
-        short = emp.get("SHORTNAME", "") or ""
-        number = emp.get("NUMBER", "") or ""
-        score = max(
-            _fuzzy_score(name, query),
-            _fuzzy_score(short, query),
-            _fuzzy_score(number, query) * 0.9,
-        )
-        if score > 0.25:
-            results.append(
-                {
-                    "type": "employee",
-                    "id": emp.get("ID"),
-                    "title": name,
-                    "subtitle": f"Kürzel: {short}" if short else "",
-                    "path": "/employees",
-                    "icon": "👤",
-                    "score": score,
-                }
-            )
-
-    # ── Shifts ────────────────────────────────────────────────
-    shifts = db.get_shifts(include_hidden=False)
-    for sh in shifts:
-        name = sh.get("NAME", "") or ""
-        short = sh.get("SHORTNAME", "") or ""
-        score = max(
-            _fuzzy_score(name, query),
-            _fuzzy_score(short, query) * 0.9,
-        )
-        if score > 0.25:
-            results.append(
-                {
-                    "type": "shift",
-                    "id": sh.get("ID"),
-                    "title": name,
-                    "subtitle": f"Kürzel: {short}" if short else "",
-                    "path": "/shifts",
-                    "icon": "🕐",
-                    "score": score,
-                }
-            )
-
-    # ── Leave Types ───────────────────────────────────────────
-    leave_types = db.get_leave_types(include_hidden=False)
-    for lt in leave_types:
-        name = lt.get("NAME", "") or ""
-        short = lt.get("SHORTNAME", "") or ""
-        score = max(
-            _fuzzy_score(name, query),
-            _fuzzy_score(short, query) * 0.9,
-        )
-        if score > 0.25:
-            results.append(
-                {
-                    "type": "leave_type",
-                    "id": lt.get("ID"),
-                    "title": name,
-                    "subtitle": f"Kürzel: {short}" if short else "",
-                    "path": "/leave-types",
-                    "icon": "📋",
-                    "score": score,
-                }
-            )
+    # Such-Indizes je Tabelle cachen — die Schreib-Endpunkte invalidieren
+    # genau diese Präfixe, der Index veraltet also nie.
+    tables = (
+        cache.get_or_set("employees:search:index", lambda: _employee_search_index(db)),
+        cache.get_or_set("shifts:search:index", lambda: _simple_search_index(db.get_shifts(include_hidden=False), "shift")),
+        cache.get_or_set("leave_types:search:index", lambda: _simple_search_index(db.get_leave_types(include_hidden=False), "leave_type")),
+        cache.get_or_set("groups:search:index", lambda: _simple_search_index(db.get_groups(include_hidden=False), "group")),
+    )
 
-    # ── Groups ────────────────────────────────────────────────
-    groups = db.get_groups(include_hidden=False)
-    for grp in groups:
-        name = grp.get("NAME", "") or ""
-        short = grp.get("SHORTNAME", "") or ""
-        score = max(
-            _fuzzy_score(name, query),
-            _fuzzy_score(short, query) * 0.9,
-        )
-        if score > 0.25:
-            results.append(
-                {
-                    "type": "group",
-                    "id": grp.get("ID"),
-                    "title": name,
-                    "subtitle": f"Kürzel: {short}" if short else "",
-                    "path": "/groups",
-                    "icon": "🏢",
-                    "score": score,
-                }
+    # Treffer kompakt als (score, type, id, title, subtitle)-Tupel puffern —
+    # die Ergebnis-dicts werden erst NACH Sortierung und Limit gebaut, nicht
+    # für jeden Kandidaten (spart Allokation + das spätere score-Entfernen).
+    hits: list[tuple[float, str, int | None, str, str]] = []
+
+    for rows, inverted in tables:
+        if s_bi:
+            # Jeder Treffer (exakt/Präfix/enthalten/Überlappung > 0.3) teilt
+            # mindestens ein Bigramm mit der Query → die Vereinigung der
+            # Posting-Listen ist eine verlustfreie Kandidaten-Vorauswahl.
+            candidate_ids: set[int] = set()
+            for bg in s_bi:
+                candidate_ids.update(inverted.get(bg, ()))
+            candidates = (rows[i] for i in candidate_ids)
+        else:
+            # Ein-Zeichen-Query: nur Exakt/Präfix/Teilstring möglich → Vollscan
+            candidates = iter(rows)
+        for typ, id_, title, short, fields in candidates:
+            score = max(
+                (_fuzzy_score(t, t_bi) * w for t, t_bi, w in fields),
+                default=0.0,
             )
+            if score > 0.25:
+                hits.append((score, typ, id_, title, short))
+
+    _PRESENTATION = {
+        "employee": ("/employees", "👤"),
+        "shift": ("/shifts", "🕐"),
+        "leave_type": ("/leave-types", "📋"),
+        "group": ("/groups", "🏢"),
+    }
 
-    # Sort by score descending
-    results.sort(key=lambda x: -(x["score"] or 0))  # type: ignore[operator]  # score is always numeric but typed as mixed dict value
-
+    def _mk(hit: tuple) -> dict:
+        _score, typ, id_, title, short = hit
+        path, icon = _PRESENTATION[typ]
+        return {
+            "type": typ,
+            "id": id_,
+            "title": title,
+            "subtitle": f"Kürzel: {short}" if short else "",
+            "path": path,
+            "icon": icon,
+        }
+
+    # Top-k per Heap statt Vollsortierung: nlargest hält nur k Einträge im
+    # Heap (O(N log k) statt O(N log N)) und ist stabil wie sorted().
     if grouped:
         # Treffer nach Typ gruppieren und je Kategorie begrenzen
+        by_type: dict[str, list] = {}
+        for h in hits:
+            by_type.setdefault(h[1], []).append(h)
         grouped_results: dict[str, list] = {"employees": [], "groups": [], "shifts": [], "leave_types": []}
         type_key_map = {"employee": "employees", "group": "groups", "shift": "shifts", "leave_type": "leave_types"}
-        for r in results:
-            key = type_key_map.get(r["type"], r["type"] + "s")
-            if key not in grouped_results:
-                grouped_results[key] = []
-            if len(grouped_results[key]) < limit:
-                score = r.pop("score")  # noqa: F841
-                grouped_results[key].append(r)
+        for typ, bucket in by_type.items():
+            key = type_key_map.get(typ, typ + "s")
+            grouped_results[key] = [_mk(h) for h in heapq.nlargest(limit, bucket, key=lambda h: h[0])]
         return {**grouped_results, "query": query}
 
     # Flat response: limit total results
-    results = results[:limit * 3]
-    # Remove internal score field from output
-    for r in results:
-        del r["score"]
-
-    return {"results": results, "query": query}
+    return {"results": [_mk(h) for h in heapq.nlargest(limit * 3, hits, key=lambda h: h[0])], "query": query}
 
 
 # ── Employee / Group Access Rights ───────────────────────────
@@ -568,12 +575,14 @@ _handover_notes: list[dict] = []
 @router.get("/api/handover", tags=["Notes"], summary="List handover notes", description="Return handover notes for a specific date.")
 def get_handover(date: str | None = None, shift_id: int | None = None, limit: int = 50):
     """Retrieve handover notes, optionally filtered by date/shift."""
-    notes = list(reversed(_handover_notes))  # neueste zuerst
+    # Lazy filtern und nach `limit` Treffern abbrechen, statt erst die
+    # komplette Liste zu bauen und dann zu slicen
+    notes = reversed(_handover_notes)  # neueste zuerst
     if date:
-        notes = [n for n in notes if n["date"] == date]
+        notes = (n for n in notes if n["date"] == date)
     if shift_id is not None:
-        notes = [n for n in notes if n.get("shift_id") == shift_id]
-    return notes[:limit]
+        notes = (n for n in notes if n.get("shift_id") == shift_id)
+    return list(islice(notes, limit))
 
 
 @router.post("/api/handover", tags=["Notes"], summary="Create handover note", description="Create a shift handover note for a date. Requires Planer role.")
@@ -703,8 +712,13 @@ def _swap_duty_missing(
     db = get_db()
     filepath = db._table("MASHI")
     fields = get_table_fields(filepath)
-    names = {e.get("ID"): f"{e.get('FIRSTNAME', '')} {e.get('NAME', '')}".strip()
-             for e in db.get_employees(include_hidden=True)}
+    # Anzeigenamen über den TTL-Cache statt je Validierung neu formatieren —
+    # employees:-Präfix, damit Writes sie mit invalidieren
+    names = cache.get_or_set(
+        "employees:swap:names",
+        lambda: {e.get("ID"): f"{e.get('FIRSTNAME', '')} {e.get('NAME', '')}".strip()
+                 for e in db.get_employees(include_hidden=True)},
+    )
     for emp_id, date_str in ((requester_id, requester_date), (partner_id, partner_date)):
         if not find_all_records(filepath, fields, EMPLOYEEID=emp_id, DATE=date_str):
             who = names.get(emp_id) or f"MA #{emp_id}"
@@ -727,47 +741,52 @@ def list_swap_requests(
     employees = {e["ID"]: e for e in get_db().get_employees(include_hidden=True)}
     shifts = {s["ID"]: s for s in get_db().get_shifts(include_hidden=True)}
 
+    # Tagesplan je Datum EINMAL holen und nach MA indexieren — vorher lief
+    # get_schedule_day zweimal je Antrag (N+1: voller Tagesaufbau pro Zeile),
+    # obwohl sich viele Anträge dieselben Daten teilen.
+    day_shift_idx: dict[str, dict[int, int]] = {}
+
     def get_shift_for(emp_id: int, date_str: str):
-        sched = get_db().get_schedule_day(date_str)
-        for entry in sched:
-            if entry.get("employee_id") == emp_id:
+        idx = day_shift_idx.get(date_str)
+        if idx is None:
+            idx = {}
+            for entry in get_db().get_schedule_day(date_str):
+                eid = entry.get("employee_id")
                 sid = entry.get("shift_id")
-                if sid and sid in shifts:
-                    s = shifts[sid]
-                    return {
-                        "id": sid,
-                        "name": s.get("SHORTNAME", "?"),
-                        "color": s.get("COLORBK_HEX", "#888"),
-                    }
+                if eid is not None and eid not in idx and sid and sid in shifts:
+                    idx[eid] = sid
+            day_shift_idx[date_str] = idx
+        sid = idx.get(emp_id)
+        if sid:
+            s = shifts[sid]
+            return {
+                "id": sid,
+                "name": s.get("SHORTNAME", "?"),
+                "color": s.get("COLORBK_HEX", "#888"),
+            }
         return None
 
+    # Anzeigenamen/Kürzel je MA EINMAL formatieren — vorher liefen die
+    # f-Strings je Antragszeile (zweimal pro Antrag) erneut
+    name_by_id = {
+        eid: f"{e.get('NAME', 'Deleted Employee')}, {e.get('FIRSTNAME', '')}"
+        for eid, e in employees.items()
+    }
+    short_by_id = {
+        eid: e.get("SHORTNAME", f"#{eid}") for eid, e in employees.items()
+    }
+
     result = []
     for req in requests:
         r = dict(req)
-        req_emp = employees.get(req["requester_id"], {})
-        par_emp = employees.get(req["partner_id"], {})
-        r["requester_name"] = (
-            f"{req_emp.get('NAME', 'Deleted Employee')}, {req_emp.get('FIRSTNAME', '')}"
-            if req_emp
-            else f"Deleted Employee (ID {req['requester_id']})"
-        )
-        r["requester_short"] = (
-            req_emp.get("SHORTNAME", f"#{req['requester_id']}")
-            if req_emp
-            else f"#{req['requester_id']}"
-        )
-        r["partner_name"] = (
-            f"{par_emp.get('NAME', 'Deleted Employee')}, {par_emp.get('FIRSTNAME', '')}"
-            if par_emp
-            else f"Deleted Employee (ID {req['partner_id']})"
-        )
-        r["partner_short"] = (
-            par_emp.get("SHORTNAME", f"#{req['partner_id']}")
-            if par_emp
-            else f"#{req['partner_id']}"
-        )
-        r["requester_shift"] = get_shift_for(req["requester_id"], req["requester_date"])
-        r["partner_shift"] = get_shift_for(req["partner_id"], req["partner_date"])
+        rid = req["requester_id"]
+        pid = req["partner_id"]
+        r["requester_name"] = name_by_id.get(rid, f"Deleted Employee (ID {rid})")
+        r["requester_short"] = short_by_id.get(rid, f"#{rid}")
+        r["partner_name"] = name_by_id.get(pid, f"Deleted Employee (ID {pid})")
+        r["partner_short"] = short_by_id.get(pid, f"#{pid}")
+        r["requester_shift"] = get_shift_for(rid, req["requester_date"])
+        r["partner_shift"] = get_shift_for(pid, req["partner_date"])
         result.append(r)
     return result
 
@@ -1092,15 +1111,28 @@ def expire_swap_requests(
 # ─── Self-Service Swap Requests ─────────────────────────────
 
 
+def _employee_by_user_name(cur_user: dict) -> dict | None:
+    """Sucht den MA-Satz, der dem angemeldeten Benutzer namensgleich entspricht.
+
+    Der Index NAME→EMPL wird einmal gebaut und im TTL-Cache gehalten (Schlüssel
+    unter dem employees:-Präfix, wird von MA-Writes mit invalidiert) — statt
+    bei jedem Self-Service-Aufruf die gesamte MA-Liste linear zu durchsuchen.
+    Bei Namensdubletten gewinnt wie bisher der erste Treffer.
+    """
+    user_name = cur_user.get("NAME", "").strip().lower()
+
+    def _build_index() -> dict[str, dict]:
+        index: dict[str, dict] = {}
+        for e in get_db().get_employees(include_hidden=False):
+            index.setdefault((e.get("NAME") or "").strip().lower(), e)
+        return index
+
+    return cache.get_or_set("employees:by_user_name", _build_index).get(user_name)
+
+
 def _resolve_employee_for_user(cur_user: dict):
     """Findet den MA-Satz, der dem angemeldeten Benutzer namensgleich entspricht."""
-    user_name = cur_user.get("NAME", "").strip().lower()
-    db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
+    employee = _employee_by_user_name(cur_user)
     if employee is None:
         raise HTTPException(
             status_code=404,
@@ -1327,14 +1359,7 @@ def cancel_self_swap_request(
 )
 def get_my_employee(cur_user: dict = Depends(require_auth)):
     """Liefert den namensgleichen EMPL-Satz des angemeldeten Benutzers, sonst null."""
-    user_name = cur_user.get("NAME", "").strip().lower()
-    db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    match = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
-    return {"employee": match, "user_id": cur_user.get("ID")}
+    return {"employee": _employee_by_user_name(cur_user), "user_id": cur_user.get("ID")}
 
 
 class SelfWishCreate(BaseModel):
@@ -1347,18 +1372,8 @@ class SelfWishCreate(BaseModel):
 @router.post("/api/self/wishes", tags=["Self-Service"], summary="Submit own wish/block", description="Leser can submit a Schichtwunsch or Sperrung for themselves.")
 def create_self_wish(body: SelfWishCreate, cur_user: dict = Depends(require_auth)):
     """Leser können für sich selbst einen Schichtwunsch oder eine Sperrung einreichen."""
-    user_name = cur_user.get("NAME", "").strip().lower()
     db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
-    if employee is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No employee record found for this user",
-        )
+    employee = _resolve_employee_for_user(cur_user)
     wish_type = body.wish_type.upper()
     if wish_type not in ("WUNSCH", "SPERRUNG"):
         raise HTTPException(
@@ -1383,18 +1398,8 @@ def create_self_wish(body: SelfWishCreate, cur_user: dict = Depends(require_auth
 )
 def delete_self_wish(wish_id: int, cur_user: dict = Depends(require_auth)):
     """Leser can delete their own wishes."""
-    user_name = cur_user.get("NAME", "").strip().lower()
     db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
-    if employee is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No employee record found for this user",
-        )
+    employee = _resolve_employee_for_user(cur_user)
     # Prüfen, dass der Wunsch diesem MA gehört
     wishes = db.get_wishes(employee_id=employee["ID"])
     wish = next((w for w in wishes if w.get("id") == wish_id), None)
@@ -1426,13 +1431,8 @@ def get_self_schedule(
     """Liefert nur die eigenen Planeinträge des Benutzers für Jahr/Monat."""
     if not (1 <= month <= 12):
         raise HTTPException(status_code=400, detail="Invalid month")
-    user_name = cur_user.get("NAME", "").strip().lower()
     db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
+    employee = _employee_by_user_name(cur_user)
     if employee is None:
         raise HTTPException(status_code=404, detail="Kein Mitarbeiter-Datensatz gefunden")
     all_entries = db.get_schedule(year=year, month=month)
@@ -1450,13 +1450,8 @@ def get_self_wishes(
     cur_user: dict = Depends(require_auth),
 ):
     """Liefert nur die eigenen Wünsche, optional nach Jahr/Monat gefiltert."""
-    user_name = cur_user.get("NAME", "").strip().lower()
     db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
+    employee = _employee_by_user_name(cur_user)
     if employee is None:
         raise HTTPException(status_code=404, detail="Kein Mitarbeiter-Datensatz gefunden")
     kwargs: dict = {"employee_id": employee["ID"]}
@@ -1476,18 +1471,8 @@ def create_self_absence(
     request: Request, body: SelfAbsenceCreate, cur_user: dict = Depends(require_auth)
 ):
     """Leser können für sich selbst einen Abwesenheits-/Urlaubsantrag einreichen."""
-    user_name = cur_user.get("NAME", "").strip().lower()
     db = get_db()
-    employees = db.get_employees(include_hidden=False)
-    employee = next(
-        (e for e in employees if (e.get("NAME") or "").strip().lower() == user_name),
-        None,
-    )
-    if employee is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No employee record found for this user",
-        )
+    employee = _resolve_employee_for_user(cur_user)
     # Check if already exists
     existing = db.get_absences_list(employee_id=employee["ID"])
     if any(a.get("date") == body.date for a in existing):
@@ -1500,6 +1485,11 @@ def create_self_absence(
 
 # ── Release Notes (CHANGELOG.md) ─────────────────────────────
 
+# Fertig serialisierter Response-Body als (mtime, bytes) — der Inhalt ist
+# statisch bis zum nächsten Release, das erneute JSON-Encoden des kompletten
+# Changelogs pro Request entfällt.
+_release_notes_cache: tuple[float, bytes] | None = None
+
 
 @router.get(
     "/api/release-notes",
@@ -1509,12 +1499,21 @@ def create_self_absence(
 )
 def get_release_notes():
     """Return CHANGELOG.md content as JSON."""
+    global _release_notes_cache
     import pathlib
 
     # The host app's CHANGELOG.md sits one level above its backend dir
     changelog_path = pathlib.Path(backend_dir()).parent / "CHANGELOG.md"
     try:
-        content = changelog_path.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        content = "No changelog available."
-    return {"content": content}
+        mtime = changelog_path.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    cached = _release_notes_cache
+    if cached is None or cached[0] != mtime:
+        try:
+            content = changelog_path.read_text(encoding="utf-8")
+        except OSError:
+            content = "No changelog available."
+        cached = (mtime, orjson.dumps({"content": content}))
+        _release_notes_cache = cached
+    return Response(content=cached[1], media_type="application/json")
@@ -6,6 +6,7 @@ other persistence files. Each notification has:
   message, read, created_at, link (optional).
 """
 
+import heapq
 import json
 import os
 import threading
@@ -194,7 +195,7 @@ def list_notifications(
         data = [n for n in data if n.get("recipient_employee_id") is None]
     if unread_only:
         data = [n for n in data if not n.get("read")]
-    data = sorted(data, key=lambda n: n.get("created_at", ""), reverse=True)[:limit]
+    data = heapq.nlargest(limit, data, key=lambda n: n.get("created_at", ""))
     return {"notifications": data, "count": len(data)}
 
 
@@ -213,7 +214,7 @@ def list_all_notifications(
     data = _load_safe()
     if unread_only:
         data = [n for n in data if not n.get("read")]
-    data = sorted(data, key=lambda n: n.get("created_at", ""), reverse=True)[:limit]
+    data = heapq.nlargest(limit, data, key=lambda n: n.get("created_at", ""))
     return {"notifications": data, "count": len(data)}
 
 
@@ -28,6 +28,7 @@ import os
 
 from fastapi import APIRouter, Depends, Query
 
+from .. import cache
 from .._paths import state_path
 from ..dependencies import _sanitize_500, require_admin
 
@@ -89,6 +90,8 @@ def sync_orm_mirror(user: dict = Depends(require_admin)):
 
     try:
         stats = sync_all(_get_orm_engine(), _daten_path())
+        # Status-Zählungen sofort frisch ausliefern, nicht erst nach TTL-Ablauf
+        cache.invalidate("orm_mirror:")
         return {"ok": True, "synced": stats}
     except Exception as e:
         raise _sanitize_500(e, "sync_orm_mirror")
@@ -124,20 +127,15 @@ def orm_mirror_status(user: dict = Depends(require_admin)):
 
     Liefert, ob die Spiegel-DB materialisiert ist, plus die Zeilenzahlen je
     Tabelle (alle 19), damit Admins die Frische des Spiegels billig einschätzen
-    können, bevor sie POST /sync auslösen.
+    können, bevor sie POST /sync auslösen. Die 19 COUNT-Abfragen laufen über
+    den TTL-Cache (60s): der Spiegel ändert sich nur per POST /sync, und der
+    invalidiert das ``orm_mirror:``-Präfix direkt nach erfolgreichem Sync.
     """
-    import sp5lib.orm as orm
-    from sqlalchemy import func, select
-
     orm_db = state_path("sp5_orm.db")
     mirror_exists = os.path.exists(orm_db)
 
-    session = _get_orm_session()
     try:
-        counts = {
-            name: session.scalar(select(func.count()).select_from(getattr(orm, model)))
-            for name, model in _MIRROR_TABLES.items()
-        }
+        counts = cache.get_or_set("orm_mirror:status:counts", _count_mirror_tables)
         return {
             "mirror_db_exists": mirror_exists,
             "table_count": len(counts),
@@ -146,6 +144,19 @@ def orm_mirror_status(user: dict = Depends(require_admin)):
         }
     except Exception as e:
         raise _sanitize_500(e, "orm_mirror_status")
+
+
+def _count_mirror_tables() -> dict[str, int]:
+    """Zählt die Zeilen aller 19 Spiegel-Tabellen in einer eigenen Session."""
+    import sp5lib.orm as orm
+    from sqlalchemy import func, select
+
+    session = _get_orm_session()
+    try:
+        return {
+            name: session.scalar(select(func.count()).select_from(getattr(orm, model)))
+            for name, model in _MIRROR_TABLES.items()
+        }
     finally:
         session.close()
 
@@ -11,6 +11,8 @@ expandierte 5CYASS, Abwesenheits-Anrechnung (3.5) und 5BOOK-Konten (3.6).
 ``contract_hours`` bleibt als HRSWEEK-Anzeige aus 5EMPL erhalten.
 """
 
+from operator import itemgetter
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ..dependencies import (
@@ -115,7 +117,7 @@ def get_overtime_summary(
     ]
 
     # Sort by difference descending (most overtime first)
-    result.sort(key=lambda x: x["difference"], reverse=True)
+    result.sort(key=itemgetter("difference"), reverse=True)
 
     return {
         "year": year,
@@ -2,6 +2,7 @@
 
 import logging as _logging
 import re
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, Query
 
@@ -14,8 +15,12 @@ router = APIRouter()
 _QUAL_SEP = re.compile(r"[,;/\n]+")
 
 
+@lru_cache(maxsize=1024)
 def _parse_qualifications(note1: str | None) -> list[str]:
-    """Parse comma/semicolon/slash-separated qualifications from NOTE1."""
+    """Parse comma/semicolon/slash-separated qualifications from NOTE1.
+
+    Memoisiert: dieselben NOTE1-Strings laufen je Request durch Matrix UND
+    Statistik, und Stammdaten ändern sich zwischen Requests selten."""
     if not note1:
         return []
     parts = _QUAL_SEP.split(note1)
@@ -53,9 +58,9 @@ def get_qualification_matrix(
     # employee_id -> first group name (employees can be in multiple groups)
     emp_group: dict[int, str] = {}
     for gid, member_ids_list in all_group_members.items():
+        group_name = group_name_map.get(gid, "")
         for eid in member_ids_list:
-            if eid not in emp_group:
-                emp_group[eid] = group_name_map.get(gid, "")
+            emp_group.setdefault(eid, group_name)
 
     # Collect all unique qualifications (sorted)
     all_quals: set[str] = set()
@@ -112,14 +117,20 @@ def get_qualification_stats(
 
     total_employees = len(employees)
 
-    # qual_name -> Liste aus {id, name}
-    qual_employees: dict[str, list[dict]] = {}
-
+    # qual_name -> Liste aus {id, name}; die MA werden EINMAL global nach
+    # Anzeigename sortiert und dann gebucketet — die Buckets kommen dadurch
+    # fertig sortiert heraus statt je Qualifikation neu zu sortieren.
+    named = []
     for e in employees:
-        eid = e.get("ID")
         firstname = (e.get("FIRSTNAME") or "").strip()
         surname = (e.get("NAME") or "").strip()
         name = f"{firstname} {surname}".strip() if firstname else surname
+        named.append((name, e))
+    named.sort(key=lambda t: t[0])
+
+    qual_employees: dict[str, list[dict]] = {}
+    for name, e in named:
+        eid = e.get("ID")
         for q in _parse_qualifications(e.get("NOTE1")):
             qual_employees.setdefault(q, []).append({"id": eid, "name": name})
 
@@ -132,7 +143,7 @@ def get_qualification_stats(
                 "name": qual,
                 "count": count,
                 "percentage": percentage,
-                "employees": sorted(emp_list, key=lambda x: x["name"]),
+                "employees": emp_list,
             }
         )
 
@@ -5,14 +5,19 @@ import csv
 import html as _html
 import io
 import logging as _logging
+import os as _os
+import re
+import time as _time
 from datetime import date
 from datetime import datetime as _dt
-from typing import Any
+from operator import itemgetter
+from typing import Any, Final
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
 from fastapi.responses import Response as _Response
 from pydantic import BaseModel, Field
 
+from .. import cache
 from ..dependencies import (
     _sanitize_500,
     enforce_wpast,
@@ -64,6 +69,112 @@ def _xlsx_response(content: bytes, filename: str) -> _Response:
     )
 
 
+# Strikte YYYY-MM-DD-Prüfung für CSV-Import-Zeilen: Regex-Schnellpfad plus
+# C-implementiertes fromisoformat statt strptime, das den Formatstring bei
+# jedem Zeilen-Aufruf neu interpretiert.
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Gemeinsamer Leer-Default für Map-Misses in Report-Schleifen: ein
+# `.get(key, {})`-Literal baut sonst je Zeile ein frisches Dict.
+# Nur lesend verwenden!
+_EMPTY: dict = {}
+
+# Konstante deutsche Monatsnamen einmal je Prozess statt als Listen-Literal
+# je Request/Export. Als Final-dict mit Monat 1-12 als Schlüssel — kein
+# Leerstring-Sentinel an Index 0, und eine spätere i18n-Tabelle je Sprache
+# braucht nur einen weiteren dict ohne Änderung der Aufrufstellen.
+_MONTHS_DE: Final[dict[int, str]] = {
+    1: "Januar",
+    2: "Februar",
+    3: "März",
+    4: "April",
+    5: "Mai",
+    6: "Juni",
+    7: "Juli",
+    8: "August",
+    9: "September",
+    10: "Oktober",
+    11: "November",
+    12: "Dezember",
+}
+_MONTHS_DE_SHORT: Final[dict[int, str]] = {
+    1: "Jan", 2: "Feb", 3: "Mär", 4: "Apr", 5: "Mai", 6: "Jun",
+    7: "Jul", 8: "Aug", 9: "Sep", 10: "Okt", 11: "Nov", 12: "Dez",
+}
+
+
+# Kalenderjahr höchstens stündlich neu bestimmen — date.today() kostet einen
+# Syscall und wird nur gebraucht, wenn der Client kein `year` mitschickt.
+_CURRENT_YEAR: tuple[float, int] = (float("-inf"), 0)
+
+
+def _current_year() -> int:
+    global _CURRENT_YEAR
+    ts, year = _CURRENT_YEAR
+    now = _time.monotonic()
+    if now - ts >= 3600.0:
+        year = date.today().year
+        _CURRENT_YEAR = (now, year)
+    return year
+
+
+def _is_iso_date(v: str) -> bool:
+    if not _ISO_DATE_RE.fullmatch(v):
+        return False
+    try:
+        date.fromisoformat(v)
+    except ValueError:
+        return False
+    return True
+
+
+def _shifts_map(db, include_hidden: bool = True) -> dict[int, dict]:
+    """ID→Schicht-Map über den TTL-Cache: praktisch jeder Report baut diese
+    Map pro Request neu auf, die Stammdaten ändern sich aber selten.
+    Schreibzugriffe in master_data invalidieren das "shifts:"-Präfix."""
+    if include_hidden:
+        key, factory = "shifts:reports:map:all", lambda: db.get_shifts(include_hidden=True)
+    else:
+        key, factory = "shifts:reports:map:visible", db.get_shifts
+    return cache.get_or_set(key, lambda: {s["ID"]: s for s in factory()})
+
+
+def _db_epoch() -> float:
+    """Jüngste DBF-mtime des Datenverzeichnisses als Cache-Schlüssel-Teil.
+
+    Plan-Schreibzugriffe invalidieren kein Cache-Präfix — tabellen-
+    abgeleitete Report-Payloads werden deshalb mit der mtime im Schlüssel
+    gecacht (gleiches Muster wie der mtime-Schlüssel von /api/stats):
+    ändert sich eine DBF-Datei, entsteht ein neuer Schlüssel."""
+    from .. import main as _main
+
+    latest = 0.0
+    try:
+        with _os.scandir(_main.DB_PATH) as it:
+            for entry in it:
+                if entry.name.upper().endswith(".DBF"):
+                    mt = entry.stat().st_mtime
+                    if mt > latest:
+                        latest = mt
+    except OSError:
+        # Verzeichnis nicht lesbar → eindeutiger Schlüssel, nicht cachen
+        return _time.time()
+    return latest
+
+
+def _employee_names(db) -> dict[int, str]:
+    """ID→Anzeige-Name-Map über den TTL-Cache: der volle 5EMPL-Scan samt
+    f-String-Aufbau lief sonst je Report-Request neu. Schreibzugriffe in
+    employees invalidieren das "employees:"-Präfix."""
+    return cache.get_or_set(
+        "employees:reports:names",
+        lambda: {
+            e["ID"]: f"{e.get('FIRSTNAME', '')} {e.get('NAME', '')}".strip()
+            for e in db.get_employees(include_hidden=False)
+        },
+    )
+
+
 # ── Monthly statistics ───────────────────────────────────────
 @router.get(
     "/api/statistics",
@@ -112,10 +223,10 @@ def get_statistics(
             group_id=group_id, date_from=date_from, date_to=date_to
         )
 
-    if year is None:
-        year = _date.today().year
-    if month is None:
-        month = _date.today().month
+    if year is None or month is None:
+        today = _date.today()
+        year = year if year is not None else today.year
+        month = month if month is not None else today.month
     if not (1 <= month <= 12):
         raise HTTPException(
             status_code=400, detail="Invalid month: must be between 1 and 12"
@@ -178,46 +289,39 @@ def get_year_summary(
     group_id: int | None = Query(None, description="Filter by group ID"),
 ):
     """Liefert aggregierte Statistiken für alle 12 Monate eines Jahres."""
-    from datetime import date as _date
-
     if year is None:
-        year = _date.today().year
+        year = _current_year()
     db = get_db()
 
-    # Statistik je Monat sammeln — ein Durchlauf, um doppelte DB-Aufrufe zu vermeiden
+    # Statistik je Monat sammeln — ein Durchlauf, um doppelte DB-Aufrufe zu
+    # vermeiden; die MA-Jahressummen laufen direkt mit, statt die Monatslisten
+    # zwischenzuspeichern und ein zweites Mal zu durchlaufen
     monthly = []
     emp_totals: dict = {}
-    all_monthly_rows: list = []
     for m in range(1, 13):
         rows = db.get_statistics(year, m, group_id=group_id)
-        all_monthly_rows.append((m, rows))
-        total_actual = sum(r.get("actual_hours", 0) or 0 for r in rows)
-        total_target = sum(r.get("target_hours", 0) or 0 for r in rows)
-        total_absences = sum(r.get("absence_days", 0) or 0 for r in rows)
-        total_vacation = sum(r.get("vacation_used", 0) or 0 for r in rows)
-        total_sick = sum(r.get("sick_days", 0) or 0 for r in rows)
-        total_shifts = sum(r.get("shifts_count", 0) or 0 for r in rows)
-        employee_count = len(rows)
-        monthly.append(
-            {
-                "month": m,
-                "actual_hours": round(total_actual, 1),
-                "target_hours": round(total_target, 1),
-                "absence_days": total_absences,
-                "vacation_days": total_vacation,
-                "sick_days": total_sick,
-                "shifts_count": total_shifts,
-                "employee_count": employee_count,
-                "overtime": round(total_actual - total_target, 1),
-            }
-        )
-
-    # Per-employee year totals (re-use already-fetched rows)
-    for m, rows in all_monthly_rows:
+        # Monatssummen und MA-Jahressummen in EINEM Durchlauf — vorher liefen
+        # sechs getrennte sum()-Scans plus der Totals-Loop über dieselbe Liste
+        total_actual = total_target = 0.0
+        total_absences = total_vacation = total_sick = total_shifts = 0
         for r in rows:
+            actual = r.get("actual_hours", 0) or 0
+            target = r.get("target_hours", 0) or 0
+            absences = r.get("absence_days", 0) or 0
+            vacation = r.get("vacation_used", 0) or 0
+            sick = r.get("sick_days", 0) or 0
+            shifts = r.get("shifts_count", 0) or 0
+            total_actual += actual
+            total_target += target
+            total_absences += absences
+            total_vacation += vacation
+            total_sick += sick
+            total_shifts += shifts
+
             eid = r.get("employee_id")
-            if eid not in emp_totals:
-                emp_totals[eid] = {
+            tot = emp_totals.get(eid)
+            if tot is None:
+                tot = emp_totals[eid] = {
                     "employee_id": eid,
                     "name": r.get("employee_name", r.get("name", "")),
                     "group": r.get("group_name", r.get("group", "")),
@@ -229,18 +333,30 @@ def get_year_summary(
                     "shifts_count": 0,
                     "monthly_hours": [0.0] * 12,
                 }
-            emp_totals[eid]["actual_hours"] += r.get("actual_hours", 0) or 0
-            emp_totals[eid]["target_hours"] += r.get("target_hours", 0) or 0
-            emp_totals[eid]["absence_days"] += r.get("absence_days", 0) or 0
-            emp_totals[eid]["vacation_days"] += r.get("vacation_used", 0) or 0
-            emp_totals[eid]["sick_days"] += r.get("sick_days", 0) or 0
-            emp_totals[eid]["shifts_count"] += r.get("shifts_count", 0) or 0
-            emp_totals[eid]["monthly_hours"][m - 1] = round(
-                r.get("actual_hours", 0) or 0, 1
-            )
+            tot["actual_hours"] += actual
+            tot["target_hours"] += target
+            tot["absence_days"] += absences
+            tot["vacation_days"] += vacation
+            tot["sick_days"] += sick
+            tot["shifts_count"] += shifts
+            tot["monthly_hours"][m - 1] = round(actual, 1)
+
+        monthly.append(
+            {
+                "month": m,
+                "actual_hours": round(total_actual, 1),
+                "target_hours": round(total_target, 1),
+                "absence_days": total_absences,
+                "vacation_days": total_vacation,
+                "sick_days": total_sick,
+                "shifts_count": total_shifts,
+                "employee_count": len(rows),
+                "overtime": round(total_actual - total_target, 1),
+            }
+        )
 
     employees = sorted(
-        emp_totals.values(), key=lambda x: x["actual_hours"], reverse=True
+        emp_totals.values(), key=itemgetter("actual_hours"), reverse=True
     )
     for e in employees:
         e["actual_hours"] = round(e["actual_hours"], 1)
@@ -269,6 +385,65 @@ def get_year_summary(
 
 
 # ── Employee detailed statistics ─────────────────────────────
+@router.get(
+    "/api/statistics/employee/batch",
+    tags=["Statistics"],
+    summary="Employee statistics for multiple employees",
+    description=(
+        "Return statistics for several employees in one call, keyed by employee ID. "
+        "Amortisiert den Request-Overhead von N Einzelabrufen; die DBF-Reads "
+        "teilen sich den Fassaden-Cache. Unknown IDs map to null.\n\n"
+        "Without `month`: 12-month yearly breakdown per employee. "
+        "With `month`: daily schedule details for that month.\n\n"
+        "**Required role:** Leser"
+    ),
+)
+def get_employee_statistics_batch(
+    ids: str = Query(
+        ..., description="Comma-separated employee IDs (max 50), e.g. '1,2,3'"
+    ),
+    year: int | None = Query(
+        None, description="Year (YYYY), defaults to current year"
+    ),
+    month: int | None = Query(
+        None, description="Month (1-12); if omitted returns full year overview"
+    ),
+):
+    wanted: list[int] = []
+    for part in ids.split(","):
+        part = part.strip()
+        if not part.isdigit():
+            raise HTTPException(
+                status_code=400, detail=f"Invalid employee ID '{part}'"
+            )
+        eid = int(part)
+        if eid not in wanted:
+            wanted.append(eid)
+    if not wanted:
+        raise HTTPException(status_code=400, detail="No employee IDs given")
+    if len(wanted) > 50:
+        raise HTTPException(status_code=400, detail="At most 50 employees per call")
+    if month is not None and not (1 <= month <= 12):
+        raise HTTPException(
+            status_code=400, detail="Invalid month: must be between 1 and 12"
+        )
+    if year is None:
+        year = _current_year()
+    db = get_db()
+    result: dict[int, dict | None] = {}
+    for eid in wanted:
+        if db.get_employee(eid) is None:
+            # Unbekannte ID macht nicht den ganzen Batch zum 404
+            result[eid] = None
+        elif month is not None:
+            result[eid] = db.get_employee_stats_month(eid, year, month)
+        else:
+            result[eid] = db.get_employee_stats_year(eid, year)
+    return result
+
+
+# Achtung: muss NACH /api/statistics/employee/batch registriert bleiben,
+# sonst fängt {emp_id} den "batch"-Pfad ab.
 @router.get(
     "/api/statistics/employee/{emp_id}",
     tags=["Statistics"],
@@ -294,10 +469,8 @@ def get_employee_statistics(
     Without month: returns 12-month yearly breakdown.
     With month: returns stats for that specific month only.
     """
-    from datetime import date as _date
-
     if year is None:
-        year = _date.today().year
+        year = _current_year()
     db = get_db()
     emp = db.get_employee(emp_id)
     if emp is None:
@@ -342,10 +515,8 @@ def get_sickness_statistics(
     - per_weekday: 7 Einträge {weekday, weekday_name, sick_days}
     - totals: total_sick_days, affected_employees, total_employees
     """
-    from datetime import date as _date
-
     if year is None:
-        year = _date.today().year
+        year = _current_year()
     return get_db().get_sickness_statistics(year)
 
 
@@ -382,7 +553,7 @@ def get_shift_statistics(
     from datetime import date as _date
 
     db = get_db()
-    shifts_map = {s["ID"]: s for s in db.get_shifts(include_hidden=True)}
+    shifts_map = _shifts_map(db)
 
     if group_id is not None:
         member_ids = set(db.get_group_members(group_id))
@@ -404,13 +575,17 @@ def get_shift_statistics(
             y -= 1
     periods.reverse()
 
-    shift_month_counts: dict = defaultdict(lambda: defaultdict(int))
+    # Je Schichtart eine flache Zählerspalte (Index = Periodenposition) statt
+    # verschachtelter dicts mit (Jahr, Monat)-Tupelschlüsseln: das Zählen in
+    # der heißen Schleife ist damit ein Listen-Inkrement ohne Tupel-Hashing.
+    n_periods = len(periods)
+    shift_month_counts: dict[int, list[int]] = {}
     emp_shift_counts: dict = defaultdict(lambda: defaultdict(int))
 
     # Einteilungen je Schichtart (Spec 3.9.3 Nr. 4, Gap C-5): über die
     # Fassade statt rohem 5MASHI — enthält expandierte 5CYASS-Zyklusdienste
     # (kind == "shift"); Sonderdienste zählen wie bisher nicht mit.
-    for ry, rm in periods:
+    for p_idx, (ry, rm) in enumerate(periods):
         for e in db.get_schedule(year=ry, month=rm):
             if e.get("kind") != "shift":
                 continue
@@ -420,7 +595,10 @@ def get_shift_statistics(
             sid = e.get("shift_id")
             if not sid:
                 continue
-            shift_month_counts[sid][(ry, rm)] += 1
+            counts = shift_month_counts.get(sid)
+            if counts is None:
+                counts = shift_month_counts[sid] = [0] * n_periods
+            counts[p_idx] += 1
             emp_shift_counts[eid][sid] += 1
 
     def categorize_shift(s: dict) -> str:
@@ -451,14 +629,21 @@ def get_shift_statistics(
             return "Nacht"
         return "Sonstige"
 
+    # Kategorie einmal je Schichtart bestimmen (STARTEND0-Parsing + Namens-
+    # Matching sind reine Funktionen der Schicht) statt je (MA, Schicht)-Paar
+    # in der Verteilungs-Schleife unten erneut zu rechnen.
+    category_by_sid = {
+        sid: categorize_shift(shifts_map.get(sid, {})) for sid in shift_month_counts
+    }
+
     shift_usage = []
-    for sid, month_map in shift_month_counts.items():
+    for sid, counts in shift_month_counts.items():
         s = shifts_map.get(sid, {})
         monthly = [
-            {"year": ry, "month": rm, "count": month_map.get((ry, rm), 0)}
-            for (ry, rm) in periods
+            {"year": ry, "month": rm, "count": counts[i]}
+            for i, (ry, rm) in enumerate(periods)
         ]
-        total = sum(month_map.values())
+        total = sum(counts)
         shift_usage.append(
             {
                 "shift_id": sid,
@@ -466,12 +651,12 @@ def get_shift_statistics(
                 "short": s.get("SHORTNAME", ""),
                 "color_bk": s.get("COLORBK", None),
                 "color_text": s.get("COLORTEXT", None),
-                "category": categorize_shift(s),
+                "category": category_by_sid[sid],
                 "monthly_counts": monthly,
                 "total": total,
             }
         )
-    shift_usage.sort(key=lambda x: -x["total"])
+    shift_usage.sort(key=itemgetter("total"), reverse=True)
 
     cat_counts_global: dict = defaultdict(int)
     emp_distribution = []
@@ -481,7 +666,7 @@ def get_shift_statistics(
             continue
         by_category: dict = defaultdict(int)
         for sid, cnt in shift_counts.items():
-            cat = categorize_shift(shifts_map.get(sid, {}))
+            cat = category_by_sid.get(sid) or categorize_shift(shifts_map.get(sid, {}))
             by_category[cat] += cnt
             cat_counts_global[cat] += cnt
         emp_distribution.append(
@@ -495,25 +680,10 @@ def get_shift_statistics(
                 "by_category": dict(by_category),
             }
         )
-    emp_distribution.sort(key=lambda x: -x["total_shifts"])
-
-    month_names_short = [
-        "",
-        "Jan",
-        "Feb",
-        "Mär",
-        "Apr",
-        "Mai",
-        "Jun",
-        "Jul",
-        "Aug",
-        "Sep",
-        "Okt",
-        "Nov",
-        "Dez",
-    ]
+    emp_distribution.sort(key=itemgetter("total_shifts"), reverse=True)
+
     period_labels = [
-        {"year": ry, "month": rm, "label": f"{month_names_short[rm]} {ry}"}
+        {"year": ry, "month": rm, "label": f"{_MONTHS_DE_SHORT[rm]} {ry}"}
         for (ry, rm) in periods
     ]
 
@@ -528,6 +698,7 @@ def get_shift_statistics(
 # ── Export endpoints ─────────────────────────────────────────
 
 from fastapi.responses import Response as _Response  # noqa: E402
+from fastapi.responses import StreamingResponse as _StreamingResponse  # noqa: E402
 
 
 def _int_to_rgb(color_int: int) -> str:
@@ -553,6 +724,33 @@ def _csv_response(rows: list, filename: str) -> _Response:
     )
 
 
+def _csv_stream_response(rows: list, filename: str) -> _Response:
+    """Wie _csv_response, aber blockweise gestreamt: f\u00fcr Exporte \u00fcber ganze
+    Tabellen h\u00e4lt der Server so nie den kompletten CSV-Text als einen String
+    im Speicher, und das erste Byte geht raus, sobald der erste Block
+    serialisiert ist."""
+    if not rows:
+        return _csv_response(rows, filename)
+
+    def _gen():
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=rows[0].keys(), lineterminator="\r\n")
+        writer.writeheader()
+        # UTF-8 BOM wie in _csv_response, damit Excel das Encoding erkennt
+        yield ("\ufeff" + buf.getvalue()).encode("utf-8")
+        for start in range(0, len(rows), 1000):
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows(rows[start : start + 1000])
+            yield buf.getvalue().encode("utf-8")
+
+    return _StreamingResponse(
+        _gen(),
+        media_type="text/csv; charset=utf-8-sig",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get(
     "/api/export/schedule",
     tags=["Export"],
@@ -599,14 +797,18 @@ def export_schedule(
         employees = [e for e in employees if e["ID"] in member_ids]
     employees.sort(key=lambda x: x.get("POSITION", 0))
 
-    # Build lookup: (emp_id, date) -> entry
+    # Lookup: (MA, Monatstag als int) → Eintrag. Int-Schlüssel statt
+    # Datums-Strings — erspart je MA × Tag das Formatieren/Splitten des
+    # ISO-Datums in den Export-Schleifen unten.
     entry_map: dict = {}
     for _entry in entries:
-        key = (_entry["employee_id"], _entry["date"])
-        entry_map[key] = _entry
+        try:
+            day_num = int(_entry["date"][8:10])
+        except (KeyError, ValueError, IndexError):
+            continue
+        entry_map[(_entry["employee_id"], day_num)] = _entry
 
     num_days = _calendar.monthrange(year, mon)[1]
-    days = [f"{year:04d}-{mon:02d}-{d:02d}" for d in range(1, num_days + 1)]
 
     if format == "xlsx":
         try:
@@ -615,23 +817,9 @@ def export_schedule(
             from openpyxl.utils import get_column_letter
         except ImportError:
             raise HTTPException(status_code=500, detail="openpyxl nicht installiert.")
-        _month_names_de = [
-            "Januar",
-            "Februar",
-            "März",
-            "April",
-            "Mai",
-            "Juni",
-            "Juli",
-            "August",
-            "September",
-            "Oktober",
-            "November",
-            "Dezember",
-        ]
         wb = openpyxl.Workbook()
         ws = wb.active
-        ws.title = f"{_month_names_de[mon - 1]} {year}"
+        ws.title = f"{_MONTHS_DE[mon]} {year}"
         # Header row
         thin = Side(border_style="thin", color="CBD5E1")
         border = Border(left=thin, right=thin, top=thin, bottom=thin)
@@ -662,6 +850,10 @@ def export_schedule(
             cell.border = border
             ws.column_dimensions[get_column_letter(col)].width = 4.5
         ws.row_dimensions[1].height = 28
+        # Wochenend-Spalten einmal je Monatstag bestimmen statt je MA × Tag
+        xlsx_day_weekend = [
+            _dt(year, mon, d).weekday() >= 5 for d in range(1, num_days + 1)
+        ]
         # Data rows
         for r_idx, emp in enumerate(employees, start=2):
             emp_name = f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(", ")
@@ -691,10 +883,8 @@ def export_schedule(
             short_cell.border = border
             for d in range(1, num_days + 1):
                 col = d + 2
-                date_str = f"{year:04d}-{mon:02d}-{d:02d}"
-                wd = _dt(year, mon, d).weekday()
-                is_weekend = wd >= 5
-                e = entry_map.get((emp["ID"], date_str))  # type: ignore[assignment]
+                is_weekend = xlsx_day_weekend[d - 1]
+                e = entry_map.get((emp["ID"], d))  # type: ignore[assignment]
                 cell = ws.cell(r_idx, col)
                 if e:
                     bg = e.get("color_bk", "#4A90D9").lstrip("#")
@@ -715,6 +905,8 @@ def export_schedule(
         return _xlsx_response(buf.getvalue(), f"dienstplan_{month}.xlsx")
 
     if format == "csv":
+        # Spaltenlabels einmal formatieren, nicht je MA × Tag
+        day_labels = [str(d) for d in range(1, num_days + 1)]
         rows = []
         for emp in employees:
             row: dict = {
@@ -723,50 +915,48 @@ def export_schedule(
                 ),
                 "Kürzel": emp.get("SHORTNAME", ""),
             }
-            for date in days:
-                day_num = int(date.split("-")[2])
-                e = entry_map.get((emp["ID"], date))  # type: ignore[assignment]
-                row[str(day_num)] = e["display_name"] if e else ""
+            for d, label in enumerate(day_labels, start=1):
+                e = entry_map.get((emp["ID"], d))  # type: ignore[assignment]
+                row[label] = e["display_name"] if e else ""
             rows.append(row)
         return _csv_response(rows, f"dienstplan_{month}.csv")
     else:
         # HTML export
-        _month_names_de = [
-            "Januar",
-            "Februar",
-            "März",
-            "April",
-            "Mai",
-            "Juni",
-            "Juli",
-            "August",
-            "September",
-            "Oktober",
-            "November",
-            "Dezember",
+        month_name = f"{_MONTHS_DE[mon]} {year}"
+        # Wochentage je Monatstag EINMAL bestimmen (statt je MA × Tag) und die
+        # HTML-Fragmente in Listen sammeln — jedes += auf einem wachsenden
+        # String kopiert sonst den kompletten bisherigen Puffer.
+        wd_abbrs = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+        day_weekend = [
+            _dt(year, mon, d).weekday() >= 5 for d in range(1, num_days + 1)
         ]
-        month_name = f"{_month_names_de[mon - 1]} {year}"
-        day_headers = ""
+        header_parts = []
         for d in range(1, num_days + 1):
             wd = _dt(year, mon, d).weekday()
-            wd_abbr = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"][wd]
-            is_weekend = wd >= 5
-            cls = "weekend" if is_weekend else ""
-            day_headers += f'<th class="day-header {cls}">{d}<br><span style="font-weight:normal;font-size:9px">{wd_abbr}</span></th>'
+            cls = "weekend" if day_weekend[d - 1] else ""
+            header_parts.append(
+                f'<th class="day-header {cls}">{d}<br><span style="font-weight:normal;font-size:9px">{wd_abbrs[wd]}</span></th>'
+            )
+        day_headers = "".join(header_parts)
 
         # Build shift legend
         shifts_all = db.get_shifts(include_hidden=False)
         db.get_leave_types(include_hidden=False)
-        legend_html = '<div class="no-print" style="margin-top:12px;display:flex;flex-wrap:wrap;gap:6px;align-items:center"><strong style="font-size:11px;color:#334155">Legende:</strong>'
+        legend_parts = [
+            '<div class="no-print" style="margin-top:12px;display:flex;flex-wrap:wrap;gap:6px;align-items:center"><strong style="font-size:11px;color:#334155">Legende:</strong>'
+        ]
         for s in shifts_all:
             bg = s.get("COLORBK_HEX", "#fff")
             fg = s.get("COLORTEXT_HEX", "#000")
             name = s.get("NAME", "")
             short = s.get("SHORTNAME", "")
-            legend_html += f'<span style="background:{bg};color:{fg};padding:2px 6px;border:1px solid #ccc;border-radius:3px;font-size:10px;font-weight:bold" title="{_html.escape(name)}">{_html.escape(short)}</span>'
-        legend_html += "</div>"
+            legend_parts.append(
+                f'<span style="background:{bg};color:{fg};padding:2px 6px;border:1px solid #ccc;border-radius:3px;font-size:10px;font-weight:bold" title="{_html.escape(name)}">{_html.escape(short)}</span>'
+            )
+        legend_parts.append("</div>")
+        legend_html = "".join(legend_parts)
 
-        rows_html = ""
+        row_parts = []
         for emp in employees:
             emp_name = f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(", ")
             short = emp.get("SHORTNAME", "")
@@ -781,20 +971,25 @@ def export_schedule(
                 )
             else:
                 emp_style = f"background:#f8fafc;{bold_style}"
-            rows_html += f'<tr><td class="emp-name" style="{emp_style}">{_html.escape(emp_name)}</td><td class="emp-short">{_html.escape(short)}</td>'
-            for date in days:
-                wd = _dt(year, mon, int(date.split("-")[2])).weekday()
-                is_weekend = wd >= 5
-                e = entry_map.get((emp["ID"], date))  # type: ignore[assignment]
+            row_parts.append(
+                f'<tr><td class="emp-name" style="{emp_style}">{_html.escape(emp_name)}</td><td class="emp-short">{_html.escape(short)}</td>'
+            )
+            for day_idx in range(num_days):
+                e = entry_map.get((emp["ID"], day_idx + 1))  # type: ignore[assignment]
                 if e:
                     bg = e.get("color_bk", "#4A90D9")
                     fg = e.get("color_text", "#FFFFFF")
                     display = e.get("display_name", "")
-                    rows_html += f'<td class="day-cell" style="background:{bg};color:{fg}"><span title="{_html.escape(str(e.get("shift_name", e.get("leave_name", display))))}">{_html.escape(str(display))}</span></td>'
+                    row_parts.append(
+                        f'<td class="day-cell" style="background:{bg};color:{fg}"><span title="{_html.escape(str(e.get("shift_name", e.get("leave_name", display))))}">{_html.escape(str(display))}</span></td>'
+                    )
                 else:
-                    weekend_style = "background:#f0f0f0;" if is_weekend else ""
-                    rows_html += f'<td class="day-cell" style="{weekend_style}"></td>'
-            rows_html += "</tr>\n"
+                    weekend_style = (
+                        "background:#f0f0f0;" if day_weekend[day_idx] else ""
+                    )
+                    row_parts.append(f'<td class="day-cell" style="{weekend_style}"></td>')
+            row_parts.append("</tr>\n")
+        rows_html = "".join(row_parts)
 
         html = f"""<!DOCTYPE html>
 <html lang="de">
@@ -956,10 +1151,9 @@ def export_statistics(
             cell.alignment = Alignment(horizontal="left")
             cell.border = border
             ws_det.column_dimensions[get_column_letter(c)].width = w
-        MONTHS_DE_XLSX = ["", "Januar", "Februar", "M\u00e4rz", "April", "Mai", "Juni", "Juli", "August", "September", "Oktober", "November", "Dezember"]
         for r_idx, row in enumerate(rows_data, start=2):
             fill_color = "F8FAFC" if r_idx % 2 == 0 else "FFFFFF"
-            vals = [MONTHS_DE_XLSX[row["Monat"]], row["Mitarbeiter"], row["K\u00fcrzel"], row["Soll (h)"], row["Ist (h)"], row["\u00dcberstunden (h)"], row["Abwesenheitstage"], row["Urlaubstage"]]
+            vals = [_MONTHS_DE[row["Monat"]], row["Mitarbeiter"], row["K\u00fcrzel"], row["Soll (h)"], row["Ist (h)"], row["\u00dcberstunden (h)"], row["Abwesenheitstage"], row["Urlaubstage"]]
             for c, val in enumerate(vals, start=1):
                 cell = ws_det.cell(r_idx, c, val)
                 cell.font = Font(size=9)
@@ -973,22 +1167,6 @@ def export_statistics(
     if format == "csv":
         return _csv_response(rows_data, f"statistiken_{year}.csv")
     else:
-        MONTHS_DE = [
-            "",
-            "Januar",
-            "Februar",
-            "März",
-            "April",
-            "Mai",
-            "Juni",
-            "Juli",
-            "August",
-            "September",
-            "Oktober",
-            "November",
-            "Dezember",
-        ]
-
         # Build summary table rows
         summary_rows = ""
         for s in summary.values():
@@ -1013,7 +1191,7 @@ def export_statistics(
             ot_color = "#16a34a" if ot >= 0 else "#dc2626"
             detail_rows += (
                 f"<tr>"
-                f'<td class="center">{_html.escape(str(MONTHS_DE[r["Monat"]]))}</td>'
+                f'<td class="center">{_html.escape(str(_MONTHS_DE[r["Monat"]]))}</td>'
                 f'<td class="name">{_html.escape(str(r["Mitarbeiter"]))}</td>'
                 f'<td class="center">{_html.escape(str(r["Kürzel"]))}</td>'
                 f'<td class="num">{r["Soll (h)"]:.1f}</td>'
@@ -1125,21 +1303,21 @@ def export_employees(
     from datetime import date as _date_today
 
     _today_str = _date_today.today().strftime("%Y-%m-%d")
-    rows = []
-    for emp in employees:
-        rows.append(
-            {
-                "ID": emp.get("ID", ""),
-                "Name": emp.get("NAME", ""),
-                "Vorname": emp.get("FIRSTNAME", ""),
-                "Kürzel": emp.get("SHORTNAME", ""),
-                "Personalnummer": emp.get("NUMBER", ""),
-                "Std/Tag": emp.get("HRSDAY", 0),
-                "Std/Woche": emp.get("HRSWEEK", 0),
-                "Std/Monat": emp.get("HRSMONTH", 0),
-                "Arbeitstage": emp.get("WORKDAYS", ""),
-            }
-        )
+    # Reine 1:1-Transformation → Comprehension statt append-Schleife
+    rows = [
+        {
+            "ID": emp.get("ID", ""),
+            "Name": emp.get("NAME", ""),
+            "Vorname": emp.get("FIRSTNAME", ""),
+            "Kürzel": emp.get("SHORTNAME", ""),
+            "Personalnummer": emp.get("NUMBER", ""),
+            "Std/Tag": emp.get("HRSDAY", 0),
+            "Std/Woche": emp.get("HRSWEEK", 0),
+            "Std/Monat": emp.get("HRSMONTH", 0),
+            "Arbeitstage": emp.get("WORKDAYS", ""),
+        }
+        for emp in employees
+    ]
     if format == "html":
         headers_html = (
             "".join(f"<th>{_html.escape(str(h))}</th>" for h in rows[0].keys())
@@ -1249,37 +1427,50 @@ def export_absences(
         if group_id is not None:
             member_ids = set(db.get_group_members(group_id))
             emp_map = {k: v for k, v in emp_map.items() if k in member_ids}
-        year_str = str(year)
-        raw_absences = db._read("ABSEN")
+        # Monats-Index der Fassade statt Voll-Scan: nur die zwölf
+        # Jahres-Buckets ziehen, statt die komplette 5ABSEN-Tabelle je
+        # Request mit startswith() zu filtern
+        abs_by_month = db._read_by_month("ABSEN")
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Datenbankfehler beim Export: {exc}"
         )
 
-    rows = []
-    for r in raw_absences:
-        d = r.get("DATE", "")
-        if not (d and d.startswith(year_str)):
-            continue
-        eid = r.get("EMPLOYEEID")
-        if eid not in emp_map:
-            continue
-        emp = emp_map[eid]
-        ltid = r.get("LEAVETYPID")
-        lt = lt_map.get(ltid) if ltid else None
-        rows.append(
-            {
-                "Datum": d,
-                "Mitarbeiter": f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(
-                    ", "
-                ),
-                "Kürzel": emp.get("SHORTNAME", ""),
-                "Abwesenheitsart": lt.get("NAME", "") if lt else "",
-                "Kürzel Art": lt.get("SHORTNAME", "") if lt else "",
-            }
+    # Anzeige-Spalten je MA/Abwesenheitsart einmal formatieren, bevor
+    # unten die Monats-Buckets des Jahres durchlaufen werden.
+    emp_cols = {
+        eid: (
+            f"{e.get('NAME', '')}, {e.get('FIRSTNAME', '')}".strip(", "),
+            e.get("SHORTNAME", ""),
         )
+        for eid, e in emp_map.items()
+    }
+    lt_cols = {
+        ltid: (lt.get("NAME", ""), lt.get("SHORTNAME", ""))
+        for ltid, lt in lt_map.items()
+    }
 
-    rows.sort(key=lambda x: (x["Datum"], x["Mitarbeiter"]))
+    rows = []
+    for m in range(1, 13):
+        month_rows = abs_by_month.get(f"{year:04d}-{m:02d}", ())
+        for r in month_rows:
+            d = r.get("DATE", "")
+            cols = emp_cols.get(r.get("EMPLOYEEID"))
+            if cols is None:
+                continue
+            ltid = r.get("LEAVETYPID")
+            lt_name, lt_short = (lt_cols.get(ltid) if ltid else None) or ("", "")
+            rows.append(
+                {
+                    "Datum": d,
+                    "Mitarbeiter": cols[0],
+                    "Kürzel": cols[1],
+                    "Abwesenheitsart": lt_name,
+                    "Kürzel Art": lt_short,
+                }
+            )
+
+    rows.sort(key=itemgetter("Datum", "Mitarbeiter"))
     if format == "html":
         headers_html = (
             "".join(f"<th>{_html.escape(str(h))}</th>" for h in rows[0].keys())
@@ -1355,7 +1546,8 @@ def export_absences(
         buf = io.BytesIO()
         wb.save(buf)
         return _xlsx_response(buf.getvalue(), f"abwesenheiten_{year}.xlsx")
-    return _csv_response(rows, f"abwesenheiten_{year}.csv")
+    # Einziger Export über eine ganze Tabelle — blockweise streamen
+    return _csv_stream_response(rows, f"abwesenheiten_{year}.csv")
 
 
 # ── Monatsabschluss-Report ───────────────────────────────────
@@ -1422,22 +1614,7 @@ def get_monthly_report(
 
     from datetime import datetime as _dt
 
-    MONTHS_DE = [
-        "",
-        "Januar",
-        "Februar",
-        "März",
-        "April",
-        "Mai",
-        "Juni",
-        "Juli",
-        "August",
-        "September",
-        "Oktober",
-        "November",
-        "Dezember",
-    ]
-    month_label = f"{MONTHS_DE[month]} {year}"
+    month_label = f"{_MONTHS_DE[month]} {year}"
 
     db = get_db()
 
@@ -1484,8 +1661,10 @@ def get_monthly_report(
             "Urlaubstage": s["vacation_used"],
             "Kranktage": s.get("sick_days", 0),
         }
+        # Zuschlags-Map des MA einmal auflösen statt je Zuschlagsart doppelt
+        emp_xc = xc_by_emp.get(eid, _EMPTY)
         for cn in all_charge_names:
-            row[f"Zuschlag: {cn}"] = round(xc_by_emp.get(eid, {}).get(cn, 0.0), 2)
+            row[f"Zuschlag: {cn}"] = round(emp_xc.get(cn, 0.0), 2)
         rows.append(row)
 
     filename_base = f"monatsabschluss_{year}_{month:02d}"
@@ -1891,7 +2070,7 @@ def get_monthly_report(
     col_idx += 1  # noqa: E702
     for cn in all_charge_names[:3]:
         total_xc = round(
-            sum(xc_by_emp.get(s["employee_id"], {}).get(cn, 0.0) for s in stats), 1
+            sum(xc_by_emp.get(s["employee_id"], _EMPTY).get(cn, 0.0) for s in stats), 1
         )
         pdf.cell(
             all_cols[col_idx][1],
@@ -2151,10 +2330,16 @@ def get_zeitkonto_summary(
     group_id: int | None = Query(None, description="Filter by group ID"),
 ):
     rows = get_db().get_zeitkonto(year=year, group_id=group_id)
-    total_target = sum(r["total_target_hours"] for r in rows)
-    total_actual = sum(r["total_actual_hours"] for r in rows)
-    total_saldo = sum(r["total_saldo"] for r in rows)
-    pos = sum(1 for r in rows if r["total_saldo"] >= 0)
+    # Summen und Plus-Zähler in EINEM Durchlauf statt vier Teil-Scans
+    total_target = total_actual = total_saldo = 0
+    pos = 0
+    for r in rows:
+        total_target += r["total_target_hours"]
+        total_actual += r["total_actual_hours"]
+        saldo = r["total_saldo"]
+        total_saldo += saldo
+        if saldo >= 0:
+            pos += 1
     neg = len(rows) - pos
     return {
         "year": year,
@@ -2636,11 +2821,7 @@ async def import_absences(
             skipped += 1
             continue
 
-        try:
-            from datetime import datetime
-
-            datetime.strptime(date_raw, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(date_raw):
             errors.append(
                 {
                     "row": i,
@@ -2695,11 +2876,7 @@ async def import_holidays(
             skipped += 1
             continue
 
-        try:
-            from datetime import datetime
-
-            datetime.strptime(date_raw, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(date_raw):
             errors.append(
                 {
                     "row": i,
@@ -2779,9 +2956,8 @@ async def import_bookings_actual(
             continue
 
         try:
-            from datetime import datetime as _dt
-
-            _dt.strptime(date_raw, "%Y-%m-%d")
+            if not _is_iso_date(date_raw):
+                raise ValueError(f"invalid date '{date_raw}'")
             stunden = float(stunden_raw.replace(",", "."))
             db.create_booking(emp["ID"], date_raw, 0, stunden, notiz)
             imported += 1
@@ -2847,9 +3023,8 @@ async def import_bookings_nominal(
             continue
 
         try:
-            from datetime import datetime as _dt
-
-            _dt.strptime(date_raw, "%Y-%m-%d")
+            if not _is_iso_date(date_raw):
+                raise ValueError(f"invalid date '{date_raw}'")
             stunden = float(stunden_raw.replace(",", "."))
             db.create_booking(emp["ID"], date_raw, 1, stunden, notiz)
             imported += 1
@@ -3022,9 +3197,8 @@ async def import_absences_csv(
             continue
 
         try:
-            from datetime import datetime as _dt
-
-            _dt.strptime(date_raw, "%Y-%m-%d")
+            if not _is_iso_date(date_raw):
+                raise ValueError(f"invalid date '{date_raw}'")
             db.add_absence(emp["ID"], date_raw, lt["ID"])
             imported += 1
         except Exception as e:
@@ -3162,16 +3336,20 @@ def get_overtime_summary(
     group_id: int | None = Query(None, description="Filter by group"),
 ):
     """Liefert die Überstunden-Übersicht je Mitarbeiter für ein Jahr."""
-    from datetime import date as _date
-
     if year is None:
-        year = _date.today().year
+        year = _current_year()
     rows = get_db().get_overtime_summary(year=year, group_id=group_id)
-    total_soll = sum(r["soll"] for r in rows)
-    total_ist = sum(r["ist"] for r in rows)
+    # Summen und Plus/Minus-Zähler in EINEM Durchlauf statt vier Teil-Scans
+    total_soll = total_ist = 0
+    plus_count = minus_count = 0
+    for r in rows:
+        total_soll += r["soll"]
+        total_ist += r["ist"]
+        if r["delta"] >= 0:
+            plus_count += 1
+        else:
+            minus_count += 1
     total_delta = round(total_ist - total_soll, 2)
-    plus_count = sum(1 for r in rows if r["delta"] >= 0)
-    minus_count = sum(1 for r in rows if r["delta"] < 0)
     return {
         "year": year,
         "group_id": group_id,
@@ -3213,7 +3391,6 @@ def get_warnings(
     - understaffing: Besetzung unter dem Minimum an einem Tag
     - conflict: Dienst-+Abwesenheits-Konflikt eines MA
     """
-    import calendar as _cal
     from datetime import date as _date
 
     today = _date.today()
@@ -3238,7 +3415,7 @@ def get_warnings(
 
     # ── 1. Next month not yet planned ─────────────────────
     # Laufender Monat → warnen bei < 7 Tagen bis Monatsende ohne Folgemonats-Plan
-    last_day = _cal.monthrange(year, month)[1]
+    last_day = _calendar.monthrange(year, month)[1]
     month_end = _date(year, month, last_day)
     days_until_end = (month_end - today).days
 
@@ -3257,21 +3434,7 @@ def get_warnings(
         )
 
         if next_month_planned == 0:
-            month_names_de = [
-                "Januar",
-                "Februar",
-                "März",
-                "April",
-                "Mai",
-                "Juni",
-                "Juli",
-                "August",
-                "September",
-                "Oktober",
-                "November",
-                "Dezember",
-            ]
-            next_month_name = month_names_de[next_month - 1]
+            next_month_name = _MONTHS_DE[next_month]
             warnings.append(
                 {
                     "id": make_id(),
@@ -3312,7 +3475,7 @@ def get_warnings(
     # db.get_utilization: 5SHDEM je Tagindex (Ft=7), 5SPDEM-Override,
     # MA-distinct-Zählung je Gruppe inkl. expandierter 5CYASS (B-2/D5).
     try:
-        shifts_map = {s["ID"]: s for s in db.get_shifts(include_hidden=True)}
+        shifts_map = _shifts_map(db)
         for day in db.get_utilization(year, month):
             for cell in day["cells"]:
                 if cell["status"] != "under":
@@ -3370,6 +3533,24 @@ def get_warnings(
 
 
 # ── Fairness-Score ───────────────────────────────────────────────
+def _cv_score(values: list[int]) -> float:
+    """Fairness-Kernel: 100 − Variationskoeffizient·100, geklemmt auf [0, 100].
+
+    Modulweit statt als Closure je Request — der Kernel läuft viermal je
+    Fairness-Aufruf (weekend/night/holiday/total) über dieselben Spalten.
+    """
+    import math
+
+    if len(values) < 2:
+        return 100.0
+    mean = sum(values) / len(values)
+    if mean == 0:
+        return 100.0
+    variance = sum((x - mean) ** 2 for x in values) / len(values)
+    cv = math.sqrt(variance) / mean  # coefficient of variation
+    return round(min(100.0, max(0, 100 - cv * 100)), 1)
+
+
 @router.get(
     "/api/fairness",
     tags=["Statistics"],
@@ -3393,7 +3574,6 @@ def get_fairness_score(
     Calculates the fairness score: How evenly are weekend, night,
     Sonntags- und Feiertags-Diensttage unter den Mitarbeitern verteilt?
     """
-    import math
 
     from sp5lib import calculations as calc
 
@@ -3403,7 +3583,13 @@ def get_fairness_score(
         members = set(db.get_group_members(group_id))
         employees = [e for e in employees if e["ID"] in members]
 
-    shifts_map = {s["ID"]: s for s in db.get_shifts()}
+    # Leer-Mandant/leere Gruppe: ohne MA kann kein Eintrag zählen — dieselbe
+    # Leer-Antwort wie unten, aber ohne Schicht-/Feiertags-Reads und ohne die
+    # zwölf get_schedule-Monatsläufe.
+    if not employees:
+        return {"year": year, "employees": [], "fairness": {}}
+
+    shifts_map = _shifts_map(db, include_hidden=False)
     holidays_raw = db.get_holidays(year=year)
     holiday_dates = set()
     for h in holidays_raw:
@@ -3422,100 +3608,125 @@ def get_fairness_score(
 
     night_shift_ids = {sid for sid, s in shifts_map.items() if is_night(s)}
 
-    # Alle Planeinträge des Jahres sammeln (Monat für Monat)
-    all_entries: list[dict] = []
-    for month in range(1, 13):
-        entries = db.get_schedule(year=year, month=month, group_id=group_id)
-        all_entries.extend(entries)
-
-    # Diensttage je MA sammeln (Spec 3.4.5: Tage, nicht Einträge; Dienste an
-    # Abwesenheitstagen zählen mit — keine Absence-Unterdrückung, Befund D10)
-    emp_duty_days: dict[int, set] = {}
-    emp_night_days: dict[int, set] = {}
+    # Diensttage je MA in EINEM Durchlauf zählen (Spec 3.4.5: Tage, nicht
+    # Einträge; Dienste an Abwesenheitstagen zählen mit — keine Absence-
+    # Unterdrückung, Befund D10). Statt das ganze Jahr als Eintrags-dicts plus
+    # date-Objekt-Sets je MA zu materialisieren, werden kompakte Zählerspalten
+    # je MA geführt; (MA, Datum)-Sets dedupen Mehrfach-Dienste am selben Tag.
+    COL_TOTAL, COL_WEEKEND, COL_SUNDAY, COL_HOLIDAY, COL_NIGHT = range(5)
+    emp_counts: dict[int, list[int]] = {}
+    seen_duty: set[tuple[int, str]] = set()
+    seen_night: set[tuple[int, str]] = set()
+    weekday_cache: dict[str, int] = {}
     known_ids = {emp["ID"] for emp in employees}
-    for entry in all_entries:
-        eid = entry.get("employee_id")
-        if eid not in known_ids:
-            continue
-        if entry.get("kind") not in ("shift", "special_shift"):
-            continue
-        date_str = str(entry.get("date", ""))[:10]
-        try:
-            d = date.fromisoformat(date_str)
-        except Exception:
-            continue
-        emp_duty_days.setdefault(eid, set()).add(d)
-        if entry.get("shift_id") in night_shift_ids:
-            emp_night_days.setdefault(eid, set()).add(d)
+    # Attribut-Lookups einmal binden — die Schleife sieht jeden Planeintrag
+    # des Jahres, da summieren sich die wiederholten Methodenauflösungen.
+    weekday_get = weekday_cache.get
+    counts_setdefault = emp_counts.setdefault
+    seen_duty_add = seen_duty.add
+    seen_night_add = seen_night.add
+    for month in range(1, 13):
+        for entry in db.get_schedule(year=year, month=month, group_id=group_id):
+            eid = entry.get("employee_id")
+            if eid not in known_ids:
+                continue
+            if entry.get("kind") not in ("shift", "special_shift"):
+                continue
+            date_str = str(entry.get("date", ""))[:10]
+            wd = weekday_get(date_str)
+            if wd is None:
+                try:
+                    wd = date.fromisoformat(date_str).weekday()
+                except Exception:
+                    continue
+                weekday_cache[date_str] = wd
+            key = (eid, date_str)
+            counts = counts_setdefault(eid, [0, 0, 0, 0, 0])
+            if key not in seen_duty:
+                seen_duty_add(key)
+                counts[COL_TOTAL] += 1
+                if wd >= 5:
+                    counts[COL_WEEKEND] += 1
+                # Original-Zähler (3.4.5 Nr. 15): So-Dienst an einem Feiertag
+                # zählt in Sonntag UND Feiertag
+                if wd == 6:
+                    counts[COL_SUNDAY] += 1
+                if date_str in holiday_dates:
+                    counts[COL_HOLIDAY] += 1
+            if entry.get("shift_id") in night_shift_ids and key not in seen_night:
+                seen_night_add(key)
+                counts[COL_NIGHT] += 1
 
-    # Count per employee
-    stats: dict[int, dict] = {}
+    result = []
     for emp in employees:
-        eid = emp["ID"]
-        duty_days = emp_duty_days.get(eid, set())
-        stats[eid] = {
-            "employee_id": eid,
-            "name": f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip(),
-            "shortname": emp.get("SHORTNAME", ""),
-            "total": len(duty_days),
-            "weekend": sum(1 for d in duty_days if d.weekday() >= 5),
-            "night": len(emp_night_days.get(eid, set())),
-            # Original-Zähler (3.4.5 Nr. 15): So-Dienst an einem Feiertag
-            # zählt in Sonntag UND Feiertag
-            "sunday": sum(1 for d in duty_days if d.weekday() == 6),
-            "holiday": sum(1 for d in duty_days if d.isoformat() in holiday_dates),
-        }
-
-    result = [v for v in stats.values() if v["total"] > 0]
+        counts = emp_counts.get(emp["ID"])
+        if not counts or not counts[COL_TOTAL]:
+            continue
+        result.append(
+            {
+                "employee_id": emp["ID"],
+                "name": f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip(),
+                "shortname": emp.get("SHORTNAME", ""),
+                "total": counts[COL_TOTAL],
+                "weekend": counts[COL_WEEKEND],
+                "night": counts[COL_NIGHT],
+                "sunday": counts[COL_SUNDAY],
+                "holiday": counts[COL_HOLIDAY],
+            }
+        )
     if not result:
         return {"year": year, "employees": [], "fairness": {}}
 
     # Compute fairness metrics (std-dev based, lower = more fair)
-    def score(values):
-        if len(values) < 2:
-            return 100.0
-        mean = sum(values) / len(values)
-        if mean == 0:
-            return 100.0
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        cv = math.sqrt(variance) / mean  # coefficient of variation
-        return round(max(0, 100 - cv * 100), 1)
-
     weekend_vals = [r["weekend"] for r in result]
     night_vals = [r["night"] for r in result]
     holiday_vals = [r["holiday"] for r in result]
     total_vals = [r["total"] for r in result]
 
+    # Jeden Score genau einmal rechnen — overall braucht dieselben Werte
+    weekend_score = _cv_score(weekend_vals)
+    night_score = _cv_score(night_vals)
+    holiday_score = _cv_score(holiday_vals)
+    total_score = _cv_score(total_vals)
+
+    # Jede Spaltensumme nur einmal reduzieren (night/holiday brauchten die
+    # Summe bisher doppelt: Bedingung + Mittelwert)
+    n = len(result)
+    night_sum = sum(night_vals)
+    holiday_sum = sum(holiday_vals)
+
     fairness = {
-        "weekend_score": score(weekend_vals),
-        "night_score": score(night_vals),
-        "holiday_score": score(holiday_vals),
-        "total_score": score(total_vals),
-        "overall": round(
-            (score(weekend_vals) + score(night_vals) + score(total_vals)) / 3, 1
-        ),
-        "avg_weekend": round(sum(weekend_vals) / len(weekend_vals), 1),
-        "avg_night": round(sum(night_vals) / len(night_vals), 1)
-        if sum(night_vals)
-        else 0,
-        "avg_holiday": round(sum(holiday_vals) / len(holiday_vals), 1)
-        if sum(holiday_vals)
-        else 0,
-        "avg_total": round(sum(total_vals) / len(total_vals), 1),
+        "weekend_score": weekend_score,
+        "night_score": night_score,
+        "holiday_score": holiday_score,
+        "total_score": total_score,
+        "overall": round((weekend_score + night_score + total_score) / 3, 1),
+        "avg_weekend": round(sum(weekend_vals) / n, 1),
+        "avg_night": round(night_sum / n, 1) if night_sum else 0,
+        "avg_holiday": round(holiday_sum / n, 1) if holiday_sum else 0,
+        "avg_total": round(sum(total_vals) / n, 1),
     }
 
-    result.sort(key=lambda x: x["name"])
+    result.sort(key=itemgetter("name"))
     return {"year": year, "employees": result, "fairness": fairness}
 
 
 # ── Capacity Forecast ──────────────────────────────────────────
+
+# Async-Singleflight für die Prognose: gleichzeitige identische Anfragen
+# (Dashboard-Clients laden gern mehrere Ansichten desselben Monats parallel)
+# teilen sich EINE laufende Berechnung statt sie zu duplizieren — das
+# Gegenstück zum Per-Key-Lock von cache.get_or_set für async-Handler.
+_forecast_inflight: dict[tuple, Any] = {}
+
+
 @router.get(
     "/api/capacity-forecast",
     tags=["Statistics"],
     summary="Capacity forecast",
     description="Return monthly capacity forecast with understaffing risk analysis.",
 )
-def get_capacity_forecast(
+async def get_capacity_forecast(
     year: int = Query(..., description="Year (YYYY)"),
     month: int = Query(..., description="Month (1-12)"),
     group_id: int | None = Query(None, description="Filter by group"),
@@ -3535,7 +3746,7 @@ def get_capacity_forecast(
     - coverage_status: ok | low | critical | unplanned
     - conflict_flag: True if absent_count is unusually high relative to total employees
     """
-    import calendar as _cal
+    import asyncio
     from collections import defaultdict
 
     if not (1 <= month <= 12):
@@ -3543,180 +3754,182 @@ def get_capacity_forecast(
             status_code=400, detail="Invalid month: must be between 1 and 12"
         )
 
-    db = get_db()
-    num_days = _cal.monthrange(year, month)[1]
-
-    # Get all employees (optionally filtered by group)
-    all_employees = db.get_employees()
-    if group_id:
-        member_ids = set(db.get_group_members(group_id))
-        all_employees = [
-            e for e in all_employees if (e.get("id") or e.get("ID")) in member_ids
-        ]
-    total_emp = len(all_employees)
-
-    def _eid(e):
-        return e.get("id") or e.get("ID")
-
-    emp_by_id = {_eid(e): e for e in all_employees}
-
-    # Build employee name lookup
-    emp_name_by_id = {
-        _eid(
-            e
-        ): f"{e.get('firstname', e.get('FIRSTNAME', ''))} {e.get('lastname', e.get('NAME', ''))}".strip()
-        for e in all_employees
-    }
-
-    # Abwesenheitsarten für die Beschriftungen holen
-    leave_types_list = db.get_leave_types()
-    leave_label_by_id = {
-        lt.get("id", lt.get("ID")): lt.get(
-            "short", lt.get("SHORTNAME", lt.get("name", lt.get("NAME", "?")))
+    async def _compute() -> dict:
+        db = get_db()
+        num_days = _calendar.monthrange(year, month)[1]
+
+        # Die vier Tabellen-Reads sind unabhängig — parallel in Worker-Threads
+        # lesen statt sequenziell (gleiches Muster wie im Dashboard-Summary).
+        all_employees, leave_types_list, util_days, entries = await asyncio.gather(
+            asyncio.to_thread(db.get_employees),
+            asyncio.to_thread(db.get_leave_types),
+            asyncio.to_thread(db.get_utilization, year, month, group_id=group_id),
+            asyncio.to_thread(db.get_schedule, year, month),
         )
-        for lt in leave_types_list
-    }
-
-    # Echte Bedarfslinie je Tag (5SHDEM/5SPDEM je Tagindex inkl. Ft=7)
-    util_by_day = {
-        u["day"]: u for u in db.get_utilization(year, month, group_id=group_id)
-    }
-
-    # Einteilung/Abwesenheiten über die Fassade (inkl. 5CYASS-Expansion)
-    entries = db.get_schedule(year, month)
-
-    # Per-day aggregation
-    day_scheduled: dict = defaultdict(set)  # day -> set of emp_ids
-    day_absent: dict = defaultdict(list)  # day -> [{id, name, type}]
-
-    # Build absence set per employee-day first (to exclude from scheduled count)
-    absent_emp_days: set = set()  # (employee_id, day)
-    for e in entries:
-        if e.get("kind") != "absence":
-            continue
-        eid = e.get("employee_id")
-        if eid not in emp_by_id:
-            continue
-        day = int(e["date"][8:10])
-        absent_emp_days.add((eid, day))
-        day_absent[day].append(
-            {
-                "id": eid,
-                "name": emp_name_by_id.get(eid, f"MA {eid}"),
-                "absence_type": leave_label_by_id.get(e.get("leave_type_id"), "Abw"),
+        if group_id:
+            member_ids = set(await asyncio.to_thread(db.get_group_members, group_id))
+            all_employees = [
+                e for e in all_employees if (e.get("id") or e.get("ID")) in member_ids
+            ]
+        total_emp = len(all_employees)
+
+        # Die Aggregation selbst ist reines CPU-Bound-Python und lief bisher
+        # inline im async-Handler — in einen Worker-Thread auslagern, damit
+        # der Event-Loop andere Requests weiterbedient (gleiches Muster wie
+        # _aggregate im Dashboard-Summary).
+        def _aggregate() -> dict:
+            def _eid(e):
+                return e.get("id") or e.get("ID")
+
+            emp_by_id = {_eid(e): e for e in all_employees}
+
+            # Build employee name lookup
+            emp_name_by_id = {
+                _eid(
+                    e
+                ): f"{e.get('firstname', e.get('FIRSTNAME', ''))} {e.get('lastname', e.get('NAME', ''))}".strip()
+                for e in all_employees
             }
-        )
 
-    for e in entries:
-        if e.get("kind") not in ("shift", "special_shift"):
-            continue
-        eid = e.get("employee_id")
-        if eid not in emp_by_id:
-            continue
-        day = int(e["date"][8:10])
-        # Nicht als eingeteilt zählen, wenn der MA an dem Tag abwesend ist
-        if (eid, day) not in absent_emp_days:
-            day_scheduled[day].add(eid)
-
-    result = []
-    for day in range(1, num_days + 1):
-        import datetime as _dt
-
-        check_date = _dt.date(year, month, day)
-        weekday = check_date.weekday()  # 0=Mon
-
-        scheduled = len(day_scheduled.get(day, set()))
-        absent_list = day_absent.get(day, [])
-        absent_count = len(absent_list)
+            # Abwesenheitsarten für die Beschriftungen
+            leave_label_by_id = {
+                lt.get("id", lt.get("ID")): lt.get(
+                    "short", lt.get("SHORTNAME", lt.get("name", lt.get("NAME", "?")))
+                )
+                for lt in leave_types_list
+            }
 
-        # Summe der definierten Tages-Minima; 0 = kein Bedarf gepflegt
-        required_min = util_by_day.get(day, {}).get("required_count") or 0
+            # Echte Bedarfslinie je Tag (5SHDEM/5SPDEM je Tagindex inkl. Ft=7)
+            util_by_day = {u["day"]: u for u in util_days}
+
+            # Per-day aggregation
+            day_scheduled: dict = defaultdict(set)  # day -> set of emp_ids
+            day_absent: dict = defaultdict(list)  # day -> [{id, name, type}]
+
+            # Felder je Eintrag nur EINMAL aus den Zeilen-dicts ziehen: Abwesenheiten
+            # direkt verbuchen, Dienste als kompakte (MA, Tag)-Paare puffern — der
+            # zweite Durchlauf läuft dann über Tupel statt nochmal über alle dicts.
+            absent_emp_days: set = set()  # (employee_id, day)
+            scheduled_pairs: list[tuple[int, int]] = []
+            for e in entries:
+                eid = e.get("employee_id")
+                if eid not in emp_by_id:
+                    continue
+                kind = e.get("kind")
+                if kind == "absence":
+                    day = int(e["date"][8:10])
+                    absent_emp_days.add((eid, day))
+                    day_absent[day].append(
+                        {
+                            "id": eid,
+                            "name": emp_name_by_id.get(eid, f"MA {eid}"),
+                            "absence_type": leave_label_by_id.get(e.get("leave_type_id"), "Abw"),
+                        }
+                    )
+                elif kind in ("shift", "special_shift"):
+                    scheduled_pairs.append((eid, int(e["date"][8:10])))
+
+            for eid, day in scheduled_pairs:
+                # Nicht als eingeteilt zählen, wenn der MA an dem Tag abwesend ist
+                if (eid, day) not in absent_emp_days:
+                    day_scheduled[day].add(eid)
+
+            import datetime as _dt
+
+            # Geteilte Kennzahlen einmal je Request statt je Tag: Urlaubskonflikt-
+            # Schwelle (mehr als 30 % des Teams abwesend, mindestens 2) und der
+            # Leerteam-Kurzschluss für das Konflikt-Flag
+            conflict_threshold = max(2, total_emp * 0.3)
+            has_team = total_emp > 0
+
+            result = []
+            for day in range(1, num_days + 1):
+                check_date = _dt.date(year, month, day)
+                weekday = check_date.weekday()  # 0=Mon
+
+                scheduled = len(day_scheduled.get(day, set()))
+                absent_list = day_absent.get(day, [])
+                absent_count = len(absent_list)
+
+                # Summe der definierten Tages-Minima; 0 = kein Bedarf gepflegt
+                required_min = util_by_day.get(day, _EMPTY).get("required_count") or 0
+
+                # Coverage status
+                if required_min > 0:
+                    diff = scheduled - required_min
+                    if diff >= 0:
+                        status = "ok"
+                    elif diff == -1:
+                        status = "low"
+                    else:
+                        status = "critical"
+                else:
+                    # No requirement set — judge by absolute count
+                    if scheduled >= 3:
+                        status = "ok"
+                    elif scheduled >= 1:
+                        status = "low"
+                    elif scheduled == 0:
+                        status = "unplanned"
+                    else:
+                        status = "unknown"
+
+                # Urlaubskonflikt-Flag: mehr als 30 % des Teams abwesend
+                conflict_flag = has_team and absent_count >= conflict_threshold
+
+                result.append(
+                    {
+                        "day": day,
+                        "date": check_date.isoformat(),
+                        "weekday": weekday,  # 0=Mon
+                        "scheduled_count": scheduled,
+                        "absent_count": absent_count,
+                        "absent_employees": absent_list,
+                        "required_min": required_min,
+                        "coverage_status": status,
+                        "conflict_flag": conflict_flag,
+                        "total_employees": total_emp,
+                    }
+                )
 
-        # Coverage status
-        if required_min > 0:
-            diff = scheduled - required_min
-            if diff >= 0:
-                status = "ok"
-            elif diff == -1:
-                status = "low"
-            else:
-                status = "critical"
-        else:
-            # No requirement set — judge by absolute count
-            if scheduled >= 3:
-                status = "ok"
-            elif scheduled >= 1:
-                status = "low"
-            elif scheduled == 0:
-                status = "unplanned"
-            else:
-                status = "unknown"
+            # Summary stats — ein Zähl-Durchlauf statt fünf Listen-Comprehensions
+            from collections import Counter
 
-        # Urlaubskonflikt-Flag: mehr als 30 % des Teams abwesend
-        conflict_flag = total_emp > 0 and absent_count >= max(2, total_emp * 0.3)
+            status_counts = Counter(r["coverage_status"] for r in result)
+            conflict_count = sum(1 for r in result if r["conflict_flag"])
 
-        result.append(
-            {
-                "day": day,
-                "date": check_date.isoformat(),
-                "weekday": weekday,  # 0=Mon
-                "scheduled_count": scheduled,
-                "absent_count": absent_count,
-                "absent_employees": absent_list,
-                "required_min": required_min,
-                "coverage_status": status,
-                "conflict_flag": conflict_flag,
+            return {
+                "year": year,
+                "month": month,
                 "total_employees": total_emp,
+                "days": result,
+                "summary": {
+                    "critical_count": status_counts["critical"],
+                    "low_count": status_counts["low"],
+                    "conflict_count": conflict_count,
+                    "unplanned_count": status_counts["unplanned"],
+                    "ok_count": status_counts["ok"],
+                },
             }
-        )
 
-    # Summary stats
-    critical_days = [r for r in result if r["coverage_status"] == "critical"]
-    low_days = [r for r in result if r["coverage_status"] == "low"]
-    conflict_days = [r for r in result if r["conflict_flag"]]
-    unplanned_days = [r for r in result if r["coverage_status"] == "unplanned"]
+        return await asyncio.to_thread(_aggregate)
 
-    return {
-        "year": year,
-        "month": month,
-        "total_employees": total_emp,
-        "days": result,
-        "summary": {
-            "critical_count": len(critical_days),
-            "low_count": len(low_days),
-            "conflict_count": len(conflict_days),
-            "unplanned_count": len(unplanned_days),
-            "ok_count": len([r for r in result if r["coverage_status"] == "ok"]),
-        },
-    }
+    loop = asyncio.get_running_loop()
+    key = (year, month, group_id)
+    task = _forecast_inflight.get(key)
+    if task is None:
+        task = loop.create_task(_compute())
+        _forecast_inflight[key] = task
+        task.add_done_callback(lambda _t: _forecast_inflight.pop(key, None))
+    # shield: der Abbruch EINES Clients darf die geteilte Berechnung der
+    # übrigen Warter nicht mitcanceln
+    return await asyncio.shield(task)
 
 
 # ── Annual Capacity Overview ───────────────────────────────────────────────
-@router.get(
-    "/api/capacity-year",
-    tags=["Statistics"],
-    summary="Yearly capacity overview",
-    description="Return yearly capacity overview with monthly aggregates.",
-)
-def get_capacity_year(
-    year: int = Query(..., description="Year (YYYY)"),
-    group_id: int | None = Query(None, description="Filter by group"),
-    _cur_user: dict = Depends(require_auth),
-):
-    """Liefert die Kapazitäts-Zusammenfassung je Monat eines Jahres (Heatmap).
-
-    api-Erweiterung ohne Original-Pendant; Einteilung und Bedarfslinie kommen
-    aus db.get_utilization (5SHDEM/5SPDEM je Tagindex inkl. Ft=7, Einteilung
-    inkl. expandierter 5CYASS — Spec 3.9.4).
-
-    Je Monat:
-    - avg_staffing: mittlere Tagesbesetzung (nur geplante Tage)
-    - ok_days, low_days, critical_days, unplanned_days
-    - coverage_pct: avg_staffing / total_employees * 100
-    - worst_status: Gesamtstatus des Monats
-    """
-    import calendar as _cal
-
+def _capacity_year_payload(year: int, group_id: int | None) -> dict:
+    """Berechnet die Jahres-Kapazitätsübersicht (zwölf get_utilization-Läufe)
+    — ausgelagert, damit der Endpunkt die Payload mtime-gecacht liefern kann."""
     db = get_db()
     all_employees = db.get_employees()
     if group_id:
@@ -3728,7 +3941,7 @@ def get_capacity_year(
 
     months_result = []
     for month in range(1, 13):
-        num_days = _cal.monthrange(year, month)[1]
+        num_days = _calendar.monthrange(year, month)[1]
         util_by_day = {
             u["day"]: u for u in db.get_utilization(year, month, group_id=group_id)
         }
@@ -3738,7 +3951,7 @@ def get_capacity_year(
         planned_days = 0
 
         for day in range(1, num_days + 1):
-            util = util_by_day.get(day, {})
+            util = util_by_day.get(day, _EMPTY)
             scheduled = util.get("scheduled_count", 0)
             # Summe der definierten Tages-Minima; 0 = kein Bedarf gepflegt
             required_min = util.get("required_count") or 0
@@ -3804,8 +4017,57 @@ def get_capacity_year(
     }
 
 
+@router.get(
+    "/api/capacity-year",
+    tags=["Statistics"],
+    summary="Yearly capacity overview",
+    description="Return yearly capacity overview with monthly aggregates.",
+)
+def get_capacity_year(
+    year: int = Query(..., description="Year (YYYY)"),
+    group_id: int | None = Query(None, description="Filter by group"),
+    _cur_user: dict = Depends(require_auth),
+):
+    """Liefert die Kapazitäts-Zusammenfassung je Monat eines Jahres (Heatmap).
+
+    api-Erweiterung ohne Original-Pendant; Einteilung und Bedarfslinie kommen
+    aus db.get_utilization (5SHDEM/5SPDEM je Tagindex inkl. Ft=7, Einteilung
+    inkl. expandierter 5CYASS — Spec 3.9.4).
+
+    Je Monat:
+    - avg_staffing: mittlere Tagesbesetzung (nur geplante Tage)
+    - ok_days, low_days, critical_days, unplanned_days
+    - coverage_pct: avg_staffing / total_employees * 100
+    - worst_status: Gesamtstatus des Monats
+
+    Die schwerste Aggregation der Kapazitäts-Endpunkte (ein voller
+    Jahres-Scan je Aufruf) — Payload über den TTL-Cache mit DBF-mtime im
+    Schlüssel, wiederholte Aufrufe kosten nur den Verzeichnis-stat().
+    """
+    return cache.get_or_set(
+        f"reports:capacity_year:{year}:{group_id}:{_db_epoch()}",
+        lambda: _capacity_year_payload(year, group_id),
+    )
+
+
 # ── Quality Report ─────────────────────────────────────────────────────────
 
+# Notenskala des Qualitätsberichts — konstante Vorlage einmal je Prozess statt
+# je Request: (Mindest-Score, Note, Label, Farbe), absteigend geprüft.
+_QUALITY_GRADES = (
+    (90, "A", "Ausgezeichnet", "green"),
+    (75, "B", "Gut", "blue"),
+    (60, "C", "Verbesserungsbedarf", "yellow"),
+    (0, "D", "Kritisch", "red"),
+)
+
+# Leer-Befund als Vorlage; wird nur kopiert angehängt, nie mutiert.
+_NO_FINDINGS = {
+    "severity": "ok",
+    "category": "Allgemein",
+    "message": "No issues found — month can be closed.",
+}
+
 
 @router.get(
     "/api/quality-report",
@@ -3818,16 +4080,14 @@ def get_quality_report(
     month: int = Query(...),
 ):
     """Monthly quality report: staffing, hours compliance, conflicts, score."""
-    import calendar as _cal
-
     if not (1 <= month <= 12):
         raise HTTPException(
             status_code=400, detail="Invalid month: must be between 1 and 12"
         )
 
     db = get_db()
-    num_days = _cal.monthrange(year, month)[1]
-    month_name = _cal.month_name[month]
+    num_days = _calendar.monthrange(year, month)[1]
+    month_name = _calendar.month_name[month]
 
     # ── Mitarbeiter laden ───────────────────────────────────────────────────
     employees = {e["ID"]: e for e in db._read("EMPL") if not e.get("HIDE", 0)}
@@ -3843,10 +4103,16 @@ def get_quality_report(
     low_days: list = []  # mit echtem Bedarf gibt es keine Zwischenstufe mehr
     ok_days = []
     unplanned_days = []
+    # Score-Eingangsgrößen direkt im Tages-Durchlauf mitzählen statt unten
+    # zwei weitere Listen-Durchläufe zu machen
+    work_days_count = 0
+    covered_work_days = 0
 
+    # Jahr/Monat sind je Request konstant — das Präfix einmal formatieren
+    month_prefix = f"{year:04d}-{month:02d}-"
     for day in range(1, num_days + 1):
-        date_obj = f"{year:04d}-{month:02d}-{day:02d}"
-        wd = _cal.weekday(year, month, day)  # 0=Mon
+        date_obj = f"{month_prefix}{day:02d}"
+        wd = _calendar.weekday(year, month, day)  # 0=Mon
         is_weekend = wd >= 5
         util = util_by_day.get(day, {})
         scheduled = util.get("scheduled_count", 0)
@@ -3862,6 +4128,11 @@ def get_quality_report(
             status = "ok"
             ok_days.append(day)
 
+        if not is_weekend:
+            work_days_count += 1
+            if status in ("ok", "low"):
+                covered_work_days += 1
+
         coverage_days.append(
             {
                 "day": day,
@@ -3928,10 +4199,6 @@ def get_quality_report(
 
     # ── Score berechnen ──────────────────────────────────────────────────────
     # Formel: Gewichte Coverage 50%, Hours 30%, Konflikte 20%
-    work_days_count = sum(1 for d in coverage_days if not d["is_weekend"])
-    covered_work_days = sum(
-        1 for d in coverage_days if not d["is_weekend"] and d["status"] in ("ok", "low")
-    )
     coverage_score = (
         (covered_work_days / work_days_count * 100) if work_days_count else 100
     )
@@ -3943,22 +4210,9 @@ def get_quality_report(
     overall_score = round(
         coverage_score * 0.5 + hours_score * 0.3 + conflict_score * 0.2
     )
-    if overall_score >= 90:
-        grade = "A"
-        grade_label = "Ausgezeichnet"
-        grade_color = "green"
-    elif overall_score >= 75:
-        grade = "B"
-        grade_label = "Gut"
-        grade_color = "blue"
-    elif overall_score >= 60:
-        grade = "C"
-        grade_label = "Verbesserungsbedarf"
-        grade_color = "yellow"
-    else:
-        grade = "D"
-        grade_label = "Kritisch"
-        grade_color = "red"
+    grade, grade_label, grade_color = next(
+        g[1:] for g in _QUALITY_GRADES if overall_score >= g[0]
+    )
 
     # ── Issues-Liste zusammenstellen ─────────────────────────────────────────
     findings = []
@@ -4010,13 +4264,7 @@ def get_quality_report(
             }
         )
     if not findings:
-        findings.append(
-            {
-                "severity": "ok",
-                "category": "Allgemein",
-                "message": "No issues found — month can be closed.",
-            }
-        )
+        findings.append(_NO_FINDINGS.copy())
 
     return {
         "year": year,
@@ -4081,7 +4329,7 @@ def get_availability_matrix(
 
     db = get_db()
     employees = db.get_employees(include_hidden=False)
-    shifts_map = {s["ID"]: s for s in db.get_shifts(include_hidden=True)}
+    shifts_map = _shifts_map(db)
     groups_map = {g["ID"]: g["NAME"] for g in db.get_groups()}
     # Fetch all group memberships in one pass (avoids N+1 in per-employee group lookup)
     all_group_members = db.get_all_group_members()  # {group_id: [employee_ids]}
@@ -4091,38 +4339,43 @@ def get_availability_matrix(
         employees = [e for e in employees if e["ID"] in members]
 
     if year is None:
-        year = datetime.date.today().year
+        year = _current_year()
 
     # Alle Planeinträge des angefragten Bereichs sammeln
     # Monatsbereich: die letzten `months` Monate bis Ende `year`
-    datetime.date.today()
     end_date = datetime.date(year, 12, 31)
     start_date = (end_date - datetime.timedelta(days=months * 30)).replace(day=1)
 
     # Build per-employee, per-weekday, per-shift counts
-    # weekday: 0=Mo .. 6=So
-    emp_wd_shift: dict[int, dict[int, dict]] = defaultdict(
-        lambda: defaultdict(lambda: defaultdict(int))
+    # weekday: 0=Mo .. 6=So — eine dichte 0..6-Dimension. Je Mitarbeiter ein
+    # fester 7-Slot-Vektor (Listenindex) statt einer weiteren Hash-Ebene pro
+    # Eintrag; nur die sparse Schicht-Dimension bleibt ein Dict.
+    emp_wd_shift: dict[int, list[dict]] = defaultdict(
+        lambda: [defaultdict(int) for _ in range(7)]
     )
     emp_shift_total: dict[int, dict] = defaultdict(lambda: defaultdict(int))
-    emp_day_total: dict[int, dict] = defaultdict(lambda: defaultdict(int))
+    emp_day_total: dict[int, list[int]] = defaultdict(lambda: [0] * 7)
 
     # Scan months
+    # Viele Einträge teilen sich dasselbe Datum (ein Tag × alle MA) — das
+    # ISO-Parsing + weekday() je Datum cachen statt je Eintrag rechnen.
+    day_cache: dict[str, tuple[datetime.date, int]] = {}
     cur = start_date.replace(day=1)
     while cur <= end_date:
         entries = db.get_schedule(cur.year, cur.month)
         for e in entries:
-            d = datetime.date.fromisoformat(e["date"])
+            date_str = e["date"]
+            cached = day_cache.get(date_str)
+            if cached is None:
+                d = datetime.date.fromisoformat(date_str)
+                cached = (d, d.weekday())  # 0=Mo
+                day_cache[date_str] = cached
+            d, wd = cached
             if d < start_date or d > end_date:
                 continue
             eid = e["employee_id"]
-            wd = d.weekday()  # 0=Mo
             sid = e.get("shift_id")
             if e.get("kind") in ("shift", "special_shift") and sid:
-                shift = shifts_map.get(sid)
-                short = shift.get("SHORTNAME", "?") if shift else "?"
-                name = shift.get("NAME", "?") if shift else "?"
-                shift.get("COLORBK_HEX", "#888") if shift else "#888"
                 emp_wd_shift[eid][wd][sid] += 1
                 emp_shift_total[eid][sid] += 1
                 emp_day_total[eid][wd] += 1
@@ -4145,11 +4398,13 @@ def get_availability_matrix(
         short = emp.get("SHORTNAME", "")
         workdays = emp.get("WORKDAYS_LIST", [True] * 5 + [False, False])
 
-        # Per-weekday breakdown
+        # Per-weekday breakdown (get statt [] — MA ohne Einträge nicht anlegen)
+        wd_rows = emp_wd_shift.get(eid)
+        day_totals = emp_day_total.get(eid)
         weekday_data = []
         for wd in range(7):
-            shift_counts = dict(emp_wd_shift[eid].get(wd, {}))
-            total_for_day = emp_day_total[eid].get(wd, 0)
+            shift_counts = wd_rows[wd] if wd_rows else {}
+            total_for_day = day_totals[wd] if day_totals else 0
             # Schichtliste absteigend nach Anzahl sortiert bauen
             shifts_list = []
             for sid, cnt in sorted(shift_counts.items(), key=lambda x: -x[1]):
@@ -4193,9 +4448,10 @@ def get_availability_matrix(
             )
 
         # Overall shift mix
-        total_shifts = sum(v for k, v in emp_shift_total[eid].items() if k != "absence")
+        shift_totals = emp_shift_total.get(eid) or {}
+        total_shifts = sum(v for k, v in shift_totals.items() if k != "absence")
         shift_mix = []
-        for sid, cnt in sorted(emp_shift_total[eid].items(), key=lambda x: -x[1]):
+        for sid, cnt in sorted(shift_totals.items(), key=lambda x: -x[1]):
             if sid == "absence":
                 continue
             shift = shifts_map.get(sid)
@@ -4254,22 +4510,28 @@ def get_availability_matrix(
             }
         )
 
-    # Coverage per weekday (how many employees available)
-    weekday_coverage = []
-    for wd in range(7):
-        configured = sum(
-            1
-            for emp in employees
-            if wd < len(emp.get("WORKDAYS_LIST", [])) and emp["WORKDAYS_LIST"][wd]
-        )
-        actual = sum(1 for e in result_employees if e["weekdays"][wd]["total"] > 0)
-        weekday_coverage.append(
-            {
-                "weekday": wd,
-                "configured": configured,
-                "actual_data": actual,
-            }
-        )
+    # Coverage per weekday (how many employees available) — beide Zähler in
+    # je EINEM Durchlauf statt sieben Teil-Scans pro Liste
+    configured_by_wd = [0] * 7
+    for emp in employees:
+        wdl = emp.get("WORKDAYS_LIST", [])
+        for wd in range(min(7, len(wdl))):
+            if wdl[wd]:
+                configured_by_wd[wd] += 1
+    actual_by_wd = [0] * 7
+    for e in result_employees:
+        wds = e["weekdays"]
+        for wd in range(7):
+            if wds[wd]["total"] > 0:
+                actual_by_wd[wd] += 1
+    weekday_coverage = [
+        {
+            "weekday": wd,
+            "configured": configured_by_wd[wd],
+            "actual_data": actual_by_wd[wd],
+        }
+        for wd in range(7)
+    ]
 
     return {
         "year": year,
@@ -4316,19 +4578,22 @@ def run_simulation(body: SimulationRequest, _cur_user: dict = Depends(require_pl
     Schichtplan-Simulation: Was passiert wenn Mitarbeiter ausfallen?
     Vergleicht Ist-Besetzung mit simulierter Besetzung nach Ausfall.
     """
-    import calendar as _cal
-
     db = get_db()
     year, month = body.year, body.month
     entries = db.get_schedule(year=year, month=month)
     employees = db.get_employees(include_hidden=False)
-    shifts = db.get_shifts(include_hidden=True)
     emp_map = {e["ID"]: e for e in employees}
-    {s["ID"]: s for s in shifts}
+    # Anzeige-Name je MA aus dem geteilten TTL-Cache — die Tages-Loops unten
+    # bauen sonst für jeden Eintrag denselben f-String neu.
+    name_by_id = _employee_names(db)
+    short_by_id = {
+        eid: e.get("SHORTNAME", str(eid)) for eid, e in emp_map.items()
+    }
 
-    # Days in month
-    days_in_month = _cal.monthrange(year, month)[1]
-    date_strs = [f"{year}-{month:02d}-{d:02d}" for d in range(1, days_in_month + 1)]
+    # Days in month (Monats-Präfix einmal formatieren statt je Tag)
+    days_in_month = _calendar.monthrange(year, month)[1]
+    month_prefix = f"{year}-{month:02d}-"
+    date_strs = [f"{month_prefix}{d:02d}" for d in range(1, days_in_month + 1)]
 
     # Build absent set: {emp_id: set(dates)}
     absent_map: dict = {}
@@ -4341,6 +4606,16 @@ def run_simulation(body: SimulationRequest, _cur_user: dict = Depends(require_pl
             dates_set = set(dates_raw)
         absent_map[emp_id] = dates_set
 
+    # Schicht-Einträge einmal nach Datum bzw. Mitarbeiter gruppieren, statt
+    # die komplette Monatsliste je Tag (und je abwesendem MA) neu zu filtern.
+    entries_by_date: dict[str, list] = {}
+    entries_by_emp: dict[int, list] = {}
+    for e in entries:
+        if e["kind"] != "shift":
+            continue
+        entries_by_date.setdefault(e["date"], []).append(e)
+        entries_by_emp.setdefault(e["employee_id"], []).append(e)
+
     # Per-day analysis
     day_stats = []
     total_lost_shifts = 0
@@ -4348,9 +4623,7 @@ def run_simulation(body: SimulationRequest, _cur_user: dict = Depends(require_pl
     affected_employees = set(absent_map.keys())
 
     for date_str in date_strs:
-        day_entries = [
-            e for e in entries if e["date"] == date_str and e["kind"] == "shift"
-        ]
+        day_entries = entries_by_date.get(date_str, [])
         baseline_count = len(day_entries)
 
         # Einträge abwesender MA an diesem Datum entfernen
@@ -4371,30 +4644,31 @@ def run_simulation(body: SimulationRequest, _cur_user: dict = Depends(require_pl
         for e in day_entries:
             eid = e["employee_id"]
             if eid in absent_map and date_str in absent_map[eid]:
-                emp = emp_map.get(eid, {})
                 missing_emps.append(
                     {
                         "emp_id": eid,
-                        "name": f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip(),
-                        "shortname": emp.get("SHORTNAME", str(eid)),
+                        "name": name_by_id.get(eid, ""),
+                        "shortname": short_by_id.get(eid, str(eid)),
                         "shift_id": e.get("shift_id"),
                         "shift_name": e.get("display_name", ""),
                     }
                 )
 
-        # Mögliche Vertretungen: an dem Tag eingeteilte, NICHT abwesende MA
+        # Mögliche Vertretungen: an dem Tag eingeteilte, NICHT abwesende MA.
+        # Nur die ersten 5 — mehr landet ohnehin nicht in der Antwort.
         cover_candidates = []
         for e in day_entries:
             eid = e["employee_id"]
             if eid not in absent_map or date_str not in absent_map.get(eid, set()):
-                emp = emp_map.get(eid, {})
                 cover_candidates.append(
                     {
                         "emp_id": eid,
-                        "name": f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip(),
-                        "shortname": emp.get("SHORTNAME", str(eid)),
+                        "name": name_by_id.get(eid, ""),
+                        "shortname": short_by_id.get(eid, str(eid)),
                     }
                 )
+                if len(cover_candidates) == 5:
+                    break
 
         # Status
         if sim_count == 0 and baseline_count > 0:
@@ -4409,30 +4683,27 @@ def run_simulation(body: SimulationRequest, _cur_user: dict = Depends(require_pl
             {
                 "date": date_str,
                 "day": int(date_str.split("-")[2]),
-                "weekday": _cal.weekday(year, month, int(date_str.split("-")[2])),
+                "weekday": _calendar.weekday(year, month, int(date_str.split("-")[2])),
                 "baseline_count": baseline_count,
                 "simulated_count": sim_count,
                 "lost_shifts": lost,
                 "status": status,
                 "missing": missing_emps,
-                "cover_candidates": cover_candidates[:5],  # top 5
+                "cover_candidates": cover_candidates,  # top 5
             }
         )
 
     # Per-employee impact summary
     employee_impacts = []
     for emp_id in absent_map:
-        emp = emp_map.get(emp_id, {})
-        emp_entries = [
-            e for e in entries if e["employee_id"] == emp_id and e["kind"] == "shift"
-        ]
+        emp_entries = entries_by_emp.get(emp_id, [])
         absent_dates = absent_map[emp_id]
         affected = [e for e in emp_entries if e["date"] in absent_dates]
         employee_impacts.append(
             {
                 "emp_id": emp_id,
-                "name": f"{emp.get('FIRSTNAME', '')} {emp.get('NAME', '')}".strip(),
-                "shortname": emp.get("SHORTNAME", str(emp_id)),
+                "name": name_by_id.get(emp_id, ""),
+                "shortname": short_by_id.get(emp_id, str(emp_id)),
                 "total_shifts_in_month": len(emp_entries),
                 "absent_shifts": len(affected),
                 "absent_days": sorted(
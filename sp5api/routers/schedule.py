@@ -1,5 +1,7 @@
 """Schedule, shift-cycles, staffing, einsatzplan, restrictions router."""
 
+import re
+from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field, field_validator
@@ -19,6 +21,20 @@ from .events import broadcast
 
 router = APIRouter()
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_iso_date(v: str) -> bool:
+    """Schneller ISO-Datums-Check: Regex-Vorfilter, dann fromisoformat für die
+    Kalender-Gültigkeit — erspart strptime samt try/except je Aufruf."""
+    if not _ISO_DATE_RE.fullmatch(v):
+        return False
+    try:
+        date.fromisoformat(v)
+    except ValueError:
+        return False
+    return True
+
 
 @router.get(
     "/api/schedule",
@@ -59,6 +75,61 @@ def get_schedule(
     return db.apply_absence_visibility(entries, abs_mode)
 
 
+@router.get(
+    "/api/schedule/batch",
+    tags=["Schedule"],
+    summary="Get multiple schedule months in one call",
+    description=(
+        "Return the schedule grids for several months in a single response, "
+        "keyed by 'YYYY-MM'. Amortisiert den Request-Overhead der Jahresansicht "
+        "(ein Aufruf statt zwölf); die DBF-Reads teilen sich den Fassaden-Cache."
+    ),
+)
+def get_schedule_batch(
+    months: str = Query(
+        ...,
+        description="Comma-separated months as YYYY-MM (max 12), e.g. '2026-01,2026-02'",
+    ),
+    group_id: int | None = Query(None, description="Filter by group ID"),
+    plan: str = Query(
+        "ist",
+        description="Soll-/Istplan-Sicht: 'ist' (Vorgabe), 'soll' oder 'both'",
+    ),
+    abs_mode: int = Depends(absence_visibility_mode),
+    scope: set[int] | None = Depends(visible_employee_ids),
+):
+    if plan not in ("ist", "soll", "both"):
+        raise HTTPException(
+            status_code=400, detail="plan muss 'ist', 'soll' oder 'both' sein"
+        )
+    wanted: list[tuple[int, int]] = []
+    for part in months.split(","):
+        part = part.strip()
+        if not _ISO_DATE_RE.fullmatch(part + "-01"):
+            raise HTTPException(
+                status_code=400, detail=f"Invalid month '{part}': expected YYYY-MM"
+            )
+        y, m = int(part[:4]), int(part[5:7])
+        if not (1 <= m <= 12) or not (2000 <= y <= 2100):
+            raise HTTPException(
+                status_code=400, detail=f"Invalid month '{part}': out of range"
+            )
+        if (y, m) not in wanted:
+            wanted.append((y, m))
+    if not wanted:
+        raise HTTPException(status_code=400, detail="No months given")
+    if len(wanted) > 12:
+        raise HTTPException(status_code=400, detail="At most 12 months per call")
+    db = get_db()
+    result: dict[str, list] = {}
+    for y, m in wanted:
+        entries = db.get_schedule(year=y, month=m, group_id=group_id, plan=plan)
+        if scope is not None:
+            entries = [e for e in entries if e.get("employee_id") in scope]
+        result[f"{y:04d}-{m:02d}"] = db.apply_absence_visibility(entries, abs_mode)
+    return result
+
+
 @router.get("/api/cycles", tags=["Schedule"], summary="List schedule cycles", description="Return all configured schedule cycles.")
 def get_cycles():
     return get_db().get_cycles()
@@ -124,11 +195,7 @@ def get_schedule_day(
     group_id: int | None = Query(None),
     abs_mode: int = Depends(absence_visibility_mode),
 ):
-    try:
-        from datetime import datetime
-
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -146,11 +213,7 @@ def get_schedule_week(
     group_id: int | None = Query(None),
     abs_mode: int = Depends(absence_visibility_mode),
 ):
-    try:
-        from datetime import datetime
-
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -243,14 +306,10 @@ class CycleAssignBody(BaseModel):
     description="Assign an employee to a shift rotation cycle. Requires Planer role.",
 )
 def assign_cycle(body: CycleAssignBody, _cur_user: dict = Depends(require_write("WCYCLEASS"))):
-    # start_date-Format bereits per Pydantic-Pattern validiert; zusätzlich auf Kalender-Gültigkeit parsen
-    try:
-        from datetime import datetime
-
-        datetime.strptime(body.start_date, "%Y-%m-%d")
-        if body.end_date is not None:
-            datetime.strptime(body.end_date, "%Y-%m-%d")
-    except ValueError:
+    # start_date-Format bereits per Pydantic-Pattern validiert; zusätzlich auf Kalender-Gültigkeit prüfen
+    if not _is_iso_date(body.start_date) or (
+        body.end_date is not None and not _is_iso_date(body.end_date)
+    ):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -548,15 +607,29 @@ class ScheduleEntryCreate(BaseModel):
     @field_validator("date")
     @classmethod
     def validate_date(cls, v: str) -> str:
-        from datetime import datetime as _dtt
-
-        try:
-            _dtt.strptime(v, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(v):
             raise ValueError("Date must be a valid date in YYYY-MM-DD format")
         return v
 
 
+# Felddefinitionen je DBF-Pfad — das Tabellen-Layout ist je Datenbank statisch,
+# find_all_records liest es sonst bei jedem Aufruf neu von der Platte.
+# Leere Ergebnisse (Datei fehlt/unlesbar) werden nicht gecacht.
+_FIELDS_CACHE: dict[str, list[dict]] = {}
+
+
+def _table_fields(filepath: str) -> list[dict]:
+    """Memoisierte Felddefinitionen einer DBF-Datei."""
+    fields = _FIELDS_CACHE.get(filepath)
+    if not fields:
+        from sp5lib.dbf_reader import get_table_fields
+
+        fields = get_table_fields(filepath)
+        if fields:
+            _FIELDS_CACHE[filepath] = fields
+    return fields
+
+
 def _startend_windows(value: str) -> list[tuple[int, int]]:
     """Parse a STARTEND string into (start_min, end_min) windows via calc.
 
@@ -593,11 +666,8 @@ def _windows_overlap(a: list[tuple[int, int]], b: list[tuple[int, int]]) -> bool
 def create_schedule_entry(
     body: ScheduleEntryCreate, _cur_user: dict = Depends(require_write("WDUTIES"))
 ):
-    from datetime import date as _date
-
     enforce_wpast(_cur_user, body.date)
 
-    from sp5lib.dbf_reader import get_table_fields
     from sp5lib.dbf_writer import find_all_records
 
     # Date validation handled by Pydantic model
@@ -614,7 +684,7 @@ def create_schedule_entry(
 
     from sp5lib import calculations as calc
 
-    entry_date = _date.fromisoformat(body.date)
+    entry_date = date.fromisoformat(body.date)
     # Tagindex für STARTEND-Lookups: 7 an Feiertagen (D-34), sonst 0=Mo..6=So
     try:
         day_idx = calc.day_index(entry_date, calc.holiday_calendar(db._read("HOLID")))
@@ -624,7 +694,7 @@ def create_schedule_entry(
     # ── Conflict Check 1: Duplicate assignment (same employee + same shift + same date) ──
     try:
         filepath = db._table("MASHI")
-        fields = get_table_fields(filepath)
+        fields = _table_fields(filepath)
         existing_entries = find_all_records(
             filepath, fields, EMPLOYEEID=body.employee_id, DATE=body.date
         )
@@ -681,7 +751,7 @@ def create_schedule_entry(
                             )
         # Auch SPSHI (Sonderdienste) auf Überlappungen prüfen
         spshi_path = db._table("SPSHI")
-        spshi_fields = get_table_fields(spshi_path)
+        spshi_fields = _table_fields(spshi_path)
         spshi_entries = find_all_records(
             spshi_path, spshi_fields, EMPLOYEEID=body.employee_id, DATE=body.date
         )
@@ -712,7 +782,7 @@ def create_schedule_entry(
     # ── Conflict Check 3: Absence/vacation on same day ──
     try:
         absen_path = db._table("ABSEN")
-        absen_fields = get_table_fields(absen_path)
+        absen_fields = _table_fields(absen_path)
         absence_entries = find_all_records(
             absen_path, absen_fields, EMPLOYEEID=body.employee_id, DATE=body.date
         )
@@ -858,11 +928,7 @@ def assign_schedule_workplace(
 def delete_schedule_entry(
     employee_id: int, date: str, _cur_user: dict = Depends(require_write("WDUTIES"))
 ):
-    try:
-        from datetime import datetime
-
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -903,11 +969,7 @@ def delete_shift_only(
     employee_id: int, date: str, _cur_user: dict = Depends(require_write("WDUTIES"))
 ):
     """Löscht nur Schichteinträge (MASHI/SPSHI) eines MA an einem Datum; Abwesenheiten bleiben."""
-    try:
-        from datetime import datetime
-
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -1024,11 +1086,7 @@ def get_eligible_replacements(
         None, description="Restrict area to this group; default: groups of the absent employee"
     ),
 ):
-    from datetime import datetime
-
-    try:
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400, detail="Invalid date format, please use YYYY-MM-DD"
         )
@@ -1122,8 +1180,6 @@ class BulkScheduleBody(BaseModel):
 def bulk_schedule(body: BulkScheduleBody, _cur_user: dict = Depends(require_write("WDUTIES"))):
     """Bulk create/update/delete schedule entries in a single request.
     If shift_id is null the entry is deleted; otherwise created or overwritten."""
-    from datetime import datetime as _dt2
-
     enforce_wpast(_cur_user, *(entry.date for entry in body.entries))
 
     created = 0
@@ -1140,9 +1196,7 @@ def bulk_schedule(body: BulkScheduleBody, _cur_user: dict = Depends(require_writ
                 status_code=404, detail=f"Schicht {entry.shift_id} nicht gefunden"
             )
     for entry in body.entries:
-        try:
-            _dt2.strptime(entry.date, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(entry.date):
             raise HTTPException(
                 status_code=400, detail=f"Invalid date format: {entry.date}"
             )
@@ -1187,9 +1241,6 @@ class BulkGroupAssignBody(BaseModel):
 )
 def bulk_group_assign(body: BulkGroupAssignBody, _cur_user: dict = Depends(require_write("WDUTIES"))):
     """Weist einer MA-Gruppe eine Schicht über einen Zeitraum zu."""
-    from datetime import datetime as _dt3
-    from datetime import timedelta
-
     enforce_wpast(_cur_user, body.date_from)
 
     if not body.group_id and not body.employee_ids:
@@ -1210,10 +1261,11 @@ def bulk_group_assign(body: BulkGroupAssignBody, _cur_user: dict = Depends(requi
         if not emp_ids:
             raise HTTPException(status_code=404, detail=f"Gruppe {body.group_id} hat keine Mitglieder")
 
-    # Daten parsen und validieren
+    # Daten parsen und validieren — fromisoformat statt strptime, das den
+    # Formatstring je Aufruf neu interpretiert (Pydantic-Pattern greift vorher)
     try:
-        d_from = _dt3.strptime(body.date_from, "%Y-%m-%d").date()
-        d_to = _dt3.strptime(body.date_to, "%Y-%m-%d").date()
+        d_from = date.fromisoformat(body.date_from)
+        d_to = date.fromisoformat(body.date_to)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format")
 
@@ -1227,7 +1279,7 @@ def bulk_group_assign(body: BulkGroupAssignBody, _cur_user: dict = Depends(requi
     dates: list[str] = []
     current = d_from
     while current <= d_to:
-        dates.append(current.strftime("%Y-%m-%d"))
+        dates.append(current.isoformat())
         current += timedelta(days=1)
 
     created = 0
@@ -1323,11 +1375,7 @@ def create_einsatzplan_entry(
     body: EinsatzplanCreate, _cur_user: dict = Depends(require_write("WDUTIES"))
 ):
     """Create a Sonderdienst entry in SPSHI (TYPE=0)."""
-    try:
-        from datetime import datetime
-
-        datetime.strptime(body.date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(body.date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -1426,11 +1474,7 @@ def delete_einsatzplan_entry(entry_id: int, _cur_user: dict = Depends(require_wr
 )
 def create_deviation(body: DeviationCreate, _cur_user: dict = Depends(require_write("WDEVIATION"))):
     """Create an Arbeitszeitabweichung entry in SPSHI (TYPE=1)."""
-    try:
-        from datetime import datetime
-
-        datetime.strptime(body.date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(body.date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -1472,11 +1516,7 @@ def get_einsatzplan(
     group_id: int | None = Query(None),
 ):
     """Liefert die SPSHI-Einträge eines Datums (Sonderdienste + Abweichungen)."""
-    try:
-        from datetime import datetime
-
-        datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_iso_date(date):
         raise HTTPException(
             status_code=400,
             detail="Invalid date format, please use YYYY-MM-DD",
@@ -1556,11 +1596,8 @@ class SwapShiftsRequest(BaseModel):
 )
 def swap_shifts(body: SwapShiftsRequest, _cur_user: dict = Depends(require_write("WDUTIES", "WSWAPONLY"))):
     """Tauscht Planeinträge (Schichten + Abwesenheiten) zweier MA an den Daten."""
-    from datetime import datetime as _dt3
-
     enforce_wpast(_cur_user, *body.dates)
 
-    from sp5lib.dbf_reader import get_table_fields
     from sp5lib.dbf_writer import find_all_records
 
     if body.employee_id_1 == body.employee_id_2:
@@ -1570,9 +1607,7 @@ def swap_shifts(body: SwapShiftsRequest, _cur_user: dict = Depends(require_write
     if not body.dates:
         raise HTTPException(status_code=400, detail="Mindestens ein Datum erforderlich")
     for d in body.dates:
-        try:
-            _dt3.strptime(d, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(d):
             raise HTTPException(status_code=400, detail=f"Invalid date: {d}")
 
     db = get_db()
@@ -1587,7 +1622,7 @@ def swap_shifts(body: SwapShiftsRequest, _cur_user: dict = Depends(require_write
             ("ABSEN", "absence"),
         ]:
             filepath = db._table(table)
-            fields = get_table_fields(filepath)
+            fields = _table_fields(filepath)
             matches = find_all_records(
                 filepath, fields, EMPLOYEEID=emp_id, DATE=date_str
             )
@@ -1687,54 +1722,50 @@ def copy_week(body: CopyWeekRequest, _cur_user: dict = Depends(require_write("WD
         )
 
     # Validate dates
-    from datetime import datetime as _dt2
-
     for d in body.dates:
-        try:
-            _dt2.strptime(d, "%Y-%m-%d")
-        except ValueError:
+        if not _is_iso_date(d):
             raise HTTPException(status_code=400, detail=f"Invalid date: {d}")
 
-    # Collect source entries grouped by date
-    # Jedes Datum einzeln über die Plantabellen abfragen
-    from sp5lib.dbf_reader import get_table_fields
-    from sp5lib.dbf_writer import find_all_records
+    # Collect source entries grouped by date.
+    # Jede Plantabelle EINMAL über den gecachten _read()-Parse filtern statt je
+    # Datum drei volle DBF-Scans über find_all_records zu fahren — das Datums-
+    # Filter läuft in einem Durchgang, Zeilen außerhalb des Zeitraums fallen
+    # sofort raus.
+    wanted_dates = set(body.dates)
+    source_entries: dict[str, list[dict]] = {d: [] for d in body.dates}
+    for table, kind in [
+        ("MASHI", "shift"),
+        ("SPSHI", "special_shift"),
+        ("ABSEN", "absence"),
+    ]:
+        for rec in db._read(table):
+            if rec.get("EMPLOYEEID") != body.source_employee_id:
+                continue
+            date_str = rec.get("DATE")
+            if date_str not in wanted_dates:
+                continue
+            if kind == "absence":
+                source_entries[date_str].append(
+                    {"kind": "absence", "leave_type_id": rec.get("LEAVETYPID")}
+                )
+            else:
+                source_entries[date_str].append(
+                    {
+                        "kind": kind,
+                        "shift_id": rec.get("SHIFTID"),
+                        "workplace_id": rec.get("WORKPLACID", 0),
+                    }
+                )
 
-    source_entries: dict[str, list[dict]] = {}  # date → list of entry dicts
-    for date_str in body.dates:
-        entries_for_date = []
-        for table, kind in [
-            ("MASHI", "shift"),
-            ("SPSHI", "special_shift"),
-            ("ABSEN", "absence"),
-        ]:
-            filepath = db._table(table)
-            fields = get_table_fields(filepath)
-            matches = find_all_records(
-                filepath, fields, EMPLOYEEID=body.source_employee_id, DATE=date_str
-            )
-            for _, rec in matches:
-                if kind == "shift":
-                    entries_for_date.append(
-                        {
-                            "kind": "shift",
-                            "shift_id": rec.get("SHIFTID"),
-                            "workplace_id": rec.get("WORKPLACID", 0),
-                        }
-                    )
-                elif kind == "special_shift":
-                    entries_for_date.append(
-                        {
-                            "kind": "special_shift",
-                            "shift_id": rec.get("SHIFTID"),
-                            "workplace_id": rec.get("WORKPLACID", 0),
-                        }
-                    )
-                elif kind == "absence":
-                    entries_for_date.append(
-                        {"kind": "absence", "leave_type_id": rec.get("LEAVETYPID")}
-                    )
-        source_entries[date_str] = entries_for_date
+    # Belegte (MA, Datum)-Paare vorab in einem Pass sammeln — die Ziel-MA
+    # schreiben nur ihre eigenen Zeilen, der Vorab-Stand bleibt daher gültig.
+    occupied: set[tuple] | None = None
+    if body.skip_existing:
+        occupied = {
+            (rec.get("EMPLOYEEID"), rec.get("DATE"))
+            for table in ("MASHI", "SPSHI", "ABSEN")
+            for rec in db._read(table)
+        }
 
     # Apply to targets
     created = 0
@@ -1747,17 +1778,7 @@ def copy_week(body: CopyWeekRequest, _cur_user: dict = Depends(require_write("WD
             if not entries:
                 continue
             # Check existing
-            existing_any = False
-            if body.skip_existing:
-                for table in ["MASHI", "SPSHI", "ABSEN"]:
-                    filepath = db._table(table)
-                    fields = get_table_fields(filepath)
-                    if find_all_records(
-                        filepath, fields, EMPLOYEEID=target_id, DATE=date_str
-                    ):
-                        existing_any = True
-                        break
-            if existing_any:
+            if occupied is not None and (target_id, date_str) in occupied:
                 skipped += len(entries)
                 continue
             # Delete existing first (if not skip_existing)
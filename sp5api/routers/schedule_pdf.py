@@ -82,16 +82,14 @@ def _build_schedule_html(
     # Sort employees by name
     emp_ids_seen.sort(key=lambda eid: emp_map[eid]["name"])
 
-    # Raster bauen: emp_id → Tag → Zell-Beschriftungen
-    grid: dict[int, dict[int, list[str]]] = {
-        eid: {d: [] for d in range(1, num_days + 1)}
-        for eid in emp_ids_seen
-    }
+    # Raster bauen: (emp_id, Tag) → Zell-Beschriftungen. Sparse halten —
+    # nur belegte Zellen anlegen statt MA × 31 leere Listen vorzuallozieren.
+    grid: dict[tuple[int, int], list[str]] = {}
 
     for e in entries:
         eid = e.get("employee_id")
         date_str = e.get("date", "")
-        if not eid or eid not in grid or len(date_str) < 10:
+        if not eid or eid not in emp_map or len(date_str) < 10:
             continue
         try:
             day = int(date_str[8:10])
@@ -111,7 +109,7 @@ def _build_schedule_html(
                 or e.get("shift_name", "?")[:4]
             )
         if label:
-            grid[eid][day].append(label)
+            grid.setdefault((eid, day), []).append(label)
 
     # Determine weekend/holiday columns
     today = date.today()
@@ -142,32 +140,38 @@ def _build_schedule_html(
     except Exception:
         pass
 
-    rows_html = ""
+    # HTML über Listen + join zusammensetzen statt Strings in der Schleife
+    # zu verketten (jedes += kopiert den bisherigen Puffer komplett)
+    row_parts: list[str] = []
     for eid in emp_ids_seen:
         emp = emp_map[eid]
         emp_label = emp["name"] or emp["short"] or str(eid)
-        cells = ""
+        cell_parts: list[str] = []
         for meta in day_meta:
-            d = meta["day"]
-            labels = grid[eid][d]
+            labels = grid.get((eid, meta["day"]))
             cell_text = "<br>".join(labels) if labels else ""
             css_class = "cell"
             if meta["is_weekend"]:
                 css_class += " weekend"
             if meta["is_today"]:
                 css_class += " today"
-            cells += f'<td class="{css_class}">{cell_text}</td>'
-        rows_html += f"<tr><td class='emp-name'>{emp_label}</td>{cells}</tr>\n"
+            cell_parts.append(f'<td class="{css_class}">{cell_text}</td>')
+        cells = "".join(cell_parts)
+        row_parts.append(f"<tr><td class='emp-name'>{emp_label}</td>{cells}</tr>\n")
+    rows_html = "".join(row_parts)
 
     # Day header row
-    day_headers = ""
+    header_parts: list[str] = []
     for meta in day_meta:
         css = "day-header"
         if meta["is_weekend"]:
             css += " weekend"
         if meta["is_today"]:
             css += " today"
-        day_headers += f'<th class="{css}">{meta["day"]}<br><span class="wd">{meta["short"]}</span></th>'
+        header_parts.append(
+            f'<th class="{css}">{meta["day"]}<br><span class="wd">{meta["short"]}</span></th>'
+        )
+    day_headers = "".join(header_parts)
 
     html = f"""<!DOCTYPE html>
 <html lang="de">
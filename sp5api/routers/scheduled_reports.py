@@ -489,22 +489,28 @@ def _generate_absences_report(year: int, month: int, filters: dict, fmt: str) ->
     return buf2.getvalue().encode("utf-8-sig"), f"abwesenheiten_{year:04d}-{month:02d}.csv"
 
 
+# Dispatch-Tabelle statt if/elif-Kette — alle Generatoren teilen die Signatur
+# (year, month, filters, fmt); neue Berichtstypen brauchen nur einen Eintrag
+# hier plus VALID_REPORT_TYPES.
+_REPORT_GENERATORS = {
+    "schedule_overview": _generate_schedule_overview,
+    "overtime": _generate_overtime_report,
+    "absences": _generate_absences_report,
+}
+
+
 def generate_report(report: dict) -> tuple[bytes, str]:
     """Verteilt an den passenden Berichts-Generator. Liefert (file_bytes, filename)."""
     report_type = report.get("report_type", "schedule_overview")
+    generator = _REPORT_GENERATORS.get(report_type)
+    if generator is None:
+        raise ValueError(f"Unknown report_type: {report_type}")
+
     frequency = report.get("frequency", "monthly")
     fmt = report.get("format", "xlsx")
     filters = report.get("filters", {})
     year, month = _get_reference_month(frequency)
-
-    if report_type == "schedule_overview":
-        return _generate_schedule_overview(year, month, filters, fmt)
-    elif report_type == "overtime":
-        return _generate_overtime_report(year, month, filters, fmt)
-    elif report_type == "absences":
-        return _generate_absences_report(year, month, filters, fmt)
-    else:
-        raise ValueError(f"Unknown report_type: {report_type}")
+    return generator(year, month, filters, fmt)
 
 
 # ── Email delivery ─────────────────────────────────────────────────────────────
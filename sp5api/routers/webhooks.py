@@ -10,6 +10,7 @@ from datetime import UTC
 from datetime import datetime as _dt
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field, field_validator
 
@@ -123,14 +124,14 @@ BACKOFF_MS = 500
 
 async def deliver_webhook(webhook: dict, event: str, data: dict) -> dict:
     """Stellt ein Webhook-Ereignis mit Retry-Logik zu. Liefert das Ergebnis."""
-    payload = json.dumps(
+    # orjson liefert direkt UTF-8-Bytes — kein dumps().encode() je Zustellung
+    payload = orjson.dumps(
         {
             "event": event,
             "timestamp": _dt.now(UTC).isoformat(),
             "data": data,
-        },
-        ensure_ascii=False,
-    ).encode("utf-8")
+        }
+    )
 
     signature = sign_payload(webhook["secret"], payload)
     headers = {
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -89,35 +90,69 @@ class CheckResult(BaseModel):
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
-def _employee_plan(
-    db, employee_id: int, from_date: date, to_date: date
-) -> tuple[list[tuple[date, dict]], list[tuple[date, dict]], list[tuple[date, dict]]]:
-    """Plan-Quellen eines Mitarbeiters (Spec 3.4.2): 5MASHI, 5CYASS, 5SPSHI.
+def _check_context(db) -> dict:
+    """MA-unabhängige Plan-Quellen einmal je Request bündeln.
 
-    Zyklusdienste werden — wie in der lib-Fassade — von 5MASHI-Einträgen am
-    selben Tag verdrängt (Materialisierungs-Override).
+    check-all lief vorher O(MA × Zeilen): jeder Mitarbeiter scannte 5MASHI/
+    5SPSHI/5CYASS komplett und leitete Feiertagskalender und Schicht-Map neu
+    ab. Hier wird einmal nach EMPLOYEEID gruppiert; alle Prüfungen teilen
+    sich das Ergebnis. DATE wird dabei gleich in ein date-Objekt normalisiert
+    (defekte DBF-Daten fliegen hier raus) — downstream bleibt nur noch der
+    Bereichsvergleich.
     """
 
-    def _dated(rows) -> list[tuple[date, dict]]:
-        out = []
-        for r in rows:
-            if r.get("EMPLOYEEID") != employee_id:
-                continue
+    def _grouped_dated(name: str) -> dict[int, list[tuple[date, dict]]]:
+        out: dict[int, list[tuple[date, dict]]] = {}
+        for r in db._read(name):
             try:
                 d = calc.to_date(r.get("DATE"))
             except ValueError:  # defektes DBF-Datum → überspringen
                 continue
-            if d is not None and from_date <= d <= to_date:
-                out.append((d, r))
+            if d is not None:
+                out.setdefault(r.get("EMPLOYEEID"), []).append((d, r))
         return out
 
-    manual = _dated(db._read("MASHI"))
-    special = _dated(db._read("SPSHI"))
+    mashi_by_emp = _grouped_dated("MASHI")
+    spshi_by_emp = _grouped_dated("SPSHI")
+    cyass_by_emp: dict[int, list[dict]] = {}
+    for r in db._read("CYASS"):
+        cyass_by_emp.setdefault(r.get("EMPLOYEEID"), []).append(r)
+    return {
+        "mashi_by_emp": mashi_by_emp,
+        "spshi_by_emp": spshi_by_emp,
+        "cyass_by_emp": cyass_by_emp,
+        "cycles": db._read("CYCLE"),
+        "cycle_entries": db._read("CYENT"),
+        "cycle_exceptions": db._read("CYEXC"),
+        "holidays": calc.holiday_calendar(db._read("HOLID")),
+        "shifts_by_id": {
+            int(s["ID"]): s for s in db._read("SHIFT") if s.get("ID") is not None
+        },
+    }
+
+
+def _employee_plan(
+    db, employee_id: int, from_date: date, to_date: date, ctx: dict | None = None
+) -> tuple[list[tuple[date, dict]], list[tuple[date, dict]], list[tuple[date, dict]]]:
+    """Plan-Quellen eines Mitarbeiters (Spec 3.4.2): 5MASHI, 5CYASS, 5SPSHI.
+
+    Zyklusdienste werden — wie in der lib-Fassade — von 5MASHI-Einträgen am
+    selben Tag verdrängt (Materialisierungs-Override).
+    """
+    if ctx is None:
+        ctx = _check_context(db)
+
+    def _in_range(rows) -> list[tuple[date, dict]]:
+        # Daten sind im Kontext bereits normalisiert — nur noch Bereichsfilter
+        return [(d, r) for d, r in rows if from_date <= d <= to_date]
+
+    manual = _in_range(ctx["mashi_by_emp"].get(employee_id, ()))
+    special = _in_range(ctx["spshi_by_emp"].get(employee_id, ()))
     cycle_recs = calc.expand_cycle_assignments(
-        [r for r in db._read("CYASS") if r.get("EMPLOYEEID") == employee_id],
-        cycles=db._read("CYCLE"),
-        cycle_entries=db._read("CYENT"),
-        cycle_exceptions=db._read("CYEXC"),
+        ctx["cyass_by_emp"].get(employee_id, []),
+        cycles=ctx["cycles"],
+        cycle_entries=ctx["cycle_entries"],
+        cycle_exceptions=ctx["cycle_exceptions"],
         von=from_date,
         bis=to_date,
     )
@@ -131,7 +166,7 @@ def _employee_plan(
 
 
 def _collect_day_data(
-    db, employee_id: int, from_date: date, to_date: date
+    db, employee_id: int, from_date: date, to_date: date, ctx: dict | None = None
 ) -> tuple[dict[date, float], list[dict]]:
     """Tagesstunden und Dienstblöcke (echte Zeiten) eines Mitarbeiters.
 
@@ -143,15 +178,17 @@ def _collect_day_data(
     ein Block über die Spannweite seiner Fenster — Dienste ohne definierte
     Zeiten liefern keinen Block.
     """
-    holidays = calc.holiday_calendar(db._read("HOLID"))
-    shifts_by_id = {
-        int(s["ID"]): s for s in db._read("SHIFT") if s.get("ID") is not None
-    }
-    manual, cycle, special = _employee_plan(db, employee_id, from_date, to_date)
+    if ctx is None:
+        ctx = _check_context(db)
+    holidays = ctx["holidays"]
+    shifts_by_id = ctx["shifts_by_id"]
+    manual, cycle, special = _employee_plan(db, employee_id, from_date, to_date, ctx)
     replaced = {d for d, r in special if int(r.get("SHIFTID") or 0)}
 
     day_hours: dict[date, float] = {}
-    blocks: list[dict] = []
+    # Blöcke als (Start, Ende, Tag)-Tupel statt Dicts: check-all baut sie je
+    # MA neu, und die Ruhezeit-Prüfung liest nur diese drei Felder
+    blocks: list[tuple[datetime, datetime, date]] = []
 
     def _add_block(d: date, windows: list[tuple[int, int]]) -> None:
         spans = [(s, e if e > s else e + 1440) for s, e in windows if (s, e) != (0, 0)]
@@ -159,14 +196,16 @@ def _collect_day_data(
             return
         base = datetime.combine(d, datetime.min.time())
         blocks.append(
-            {
-                "date": d,
-                "start": base + timedelta(minutes=min(s for s, _ in spans)),
-                "end": base + timedelta(minutes=max(e for _, e in spans)),
-            }
+            (
+                base + timedelta(minutes=min(s for s, _ in spans)),
+                base + timedelta(minutes=max(e for _, e in spans)),
+                d,
+            )
         )
 
-    for d, r in (*manual, *cycle):
+    # chain statt (*manual, *cycle): keine zusätzliche Tuple-Allokation,
+    # beide Quellen werden in einem Durchlauf konsumiert
+    for d, r in chain(manual, cycle):
         if d in replaced:
             continue
         shift = shifts_by_id.get(int(r.get("SHIFTID") or 0))
@@ -181,7 +220,7 @@ def _collect_day_data(
         day_hours[d] = day_hours.get(d, 0.0) + float(r.get("DURATION") or 0.0)
         _add_block(d, calc.parse_startend(str(r.get("STARTEND") or "")))
 
-    blocks.sort(key=lambda b: (b["start"], b["end"]))
+    blocks.sort()
     return day_hours, blocks
 
 
@@ -191,6 +230,7 @@ def _check_employee(
     from_date: date,
     to_date: date,
     rules: dict,
+    ctx: dict | None = None,
 ) -> list[dict]:
     """Führt alle Regelprüfungen für einen MA aus. Liefert die Verstoß-dicts."""
     violations: list[dict] = []
@@ -203,7 +243,7 @@ def _check_employee(
     min_rest = float(rules.get("min_rest_hours_between_shifts", 11))
     max_consec = int(rules.get("max_consecutive_days", 6))
 
-    day_hours, shift_blocks = _collect_day_data(db, employee_id, from_date, to_date)
+    day_hours, shift_blocks = _collect_day_data(db, employee_id, from_date, to_date, ctx)
 
     # ── Max hours per day ─────────────────────────────────────────
     for d, hrs in sorted(day_hours.items()):
@@ -242,15 +282,16 @@ def _check_employee(
 
     # ── Min rest between shifts ───────────────────────────────────
     for prev, curr in zip(shift_blocks, shift_blocks[1:], strict=False):
+        curr_start, _curr_end, curr_date = curr
         # Tatsächliche Ruhezeit in Stunden zwischen Vor-Ende und Ist-Beginn
-        rest_hours = (curr["start"] - prev["end"]).total_seconds() / 3600
+        rest_hours = (curr_start - prev[1]).total_seconds() / 3600
         if 0 < rest_hours < min_rest:
             violations.append({
                 "type": "min_rest_hours_between_shifts",
-                "date": curr["date"].isoformat(),
+                "date": curr_date.isoformat(),
                 "employee_id": employee_id,
                 "description": (
-                    f"Only {rest_hours:.1f}h rest before shift on {curr['date']} "
+                    f"Only {rest_hours:.1f}h rest before shift on {curr_date} "
                     f"(min {min_rest}h required)"
                 ),
                 "severity": "error" if rest_hours < min_rest * 0.8 else "warning",
@@ -261,9 +302,12 @@ def _check_employee(
     # ── Max consecutive working days ──────────────────────────────
     worked_dates = sorted(day_hours.keys())
     if worked_dates:
+        # Tagesabstände über Ordinal-Ints statt date-Subtraktion — die legt
+        # sonst je Tagespaar ein timedelta-Objekt an
+        worked_ords = [d.toordinal() for d in worked_dates]
         consec = 1
         for i in range(1, len(worked_dates)):
-            if (worked_dates[i] - worked_dates[i - 1]).days == 1:
+            if worked_ords[i] - worked_ords[i - 1] == 1:
                 consec += 1
                 if consec > max_consec:
                     violations.append({
@@ -285,8 +329,14 @@ def _check_employee(
 
 
 def _build_result(violations: list[dict]) -> dict:
-    warnings = sum(1 for v in violations if v["severity"] == "warning")
-    errors = sum(1 for v in violations if v["severity"] == "error")
+    # Ein Durchlauf statt zwei getrennter Zähl-Scans über dieselbe Liste
+    warnings = 0
+    errors = 0
+    for v in violations:
+        if v["severity"] == "warning":
+            warnings += 1
+        elif v["severity"] == "error":
+            errors += 1
     return {
         "violations": violations,
         "summary": {"total": len(violations), "warnings": warnings, "errors": errors},
@@ -354,12 +404,14 @@ def check_all(
         employees = list(all_employees)
 
     rules = _load_rules()
+    # Geteilter Kontext: Tabellen und abgeleitete Maps einmal statt je MA
+    ctx = _check_context(db)
     all_violations: list[dict] = []
     for emp in employees:
         eid = emp.get("ID")
         if eid is None:
             continue
-        violations = _check_employee(db, int(eid), from_date, to_date, rules)
+        violations = _check_employee(db, int(eid), from_date, to_date, rules, ctx)
         all_violations.extend(violations)
 
     return _build_result(all_violations)
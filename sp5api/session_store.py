@@ -23,11 +23,12 @@ Redis-Verbindungs-URL kommt aus ``SP5_REDIS_URL``.
 
 from __future__ import annotations
 
-import json
 import os
 import time
 from typing import Any
 
+import orjson
+
 
 class SessionStore:
     """Schnittstelle des serverseitigen Session-Stores.
@@ -114,7 +115,8 @@ class RedisSessionStore(SessionStore):
         return f"{self._prefix}user:{user_id}"
 
     def set(self, session_id: str, data: dict, expires_at: float | None) -> None:
-        payload = json.dumps(data, default=str)
+        # orjson statt stdlib-json: C-Serializer, liefert direkt Bytes für Redis
+        payload = orjson.dumps(data, default=str)
         ttl = None
         if expires_at is not None:
             ttl = int(expires_at - time.time())
@@ -133,7 +135,7 @@ class RedisSessionStore(SessionStore):
             return None
         if isinstance(raw, bytes):
             raw = raw.decode("utf-8")
-        data = json.loads(raw)
+        data = orjson.loads(raw)
         # Auch den Ablauf in der Payload beachten (TTL ist der primäre Schutz,
         # aber ein Test kann expires_at ohne passende TTL setzen): wenn vorbei, räumen.
         expires_at = data.get("expires_at")
@@ -148,7 +150,7 @@ class RedisSessionStore(SessionStore):
         if raw is not None:
             if isinstance(raw, bytes):
                 raw = raw.decode("utf-8")
-            user_id = json.loads(raw).get("ID")
+            user_id = orjson.loads(raw).get("ID")
             if user_id is not None:
                 self._r.srem(self._ukey(user_id), session_id)
         self._r.delete(self._skey(session_id))
@@ -80,6 +80,20 @@ def app(patched_db):
     return _app
 
 
+@pytest.fixture(autouse=True)
+def reset_ttl_cache():
+    """Clear the in-process TTL cache before each test — Endpunkte cachen
+    Stammdaten-Lookups (employees:/shifts:/…), Reste aus Tests mit
+    gestubbtem get_db dürfen nicht in Folgetests durchschlagen."""
+    try:
+        from sp5api import cache
+
+        cache.clear()
+    except Exception:
+        pass
+    yield
+
+
 @pytest.fixture(autouse=True)
 def reset_rate_limiter():
     """Reset slowapi rate limiter storage before each test to avoid cross-test pollution."""
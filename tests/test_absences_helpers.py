@@ -26,12 +26,9 @@ class TestClassifyLeaveType:
 
 
 class TestBuildEmployeeStats:
-    def _lt_map(self):
-        return {
-            10: {"ENTITLED": True},          # vacation
-            20: {"NAME": "Krank"},           # sick
-            30: {"NAME": "Sonstiges"},       # other
-        }
+    def _category_map(self):
+        # vorklassifizierte Kategorien, wie sie _leave_categories liefert
+        return {10: "vacation", 20: "sick", 30: "other"}
 
     def test_aggregates_categories_months_and_pending(self):
         absences = [
@@ -43,7 +40,7 @@ class TestBuildEmployeeStats:
             {"employee_id": 1, "date": "2024-XX-01", "leave_type_id": 10, "id": 104},  # bad month → guard
         ]
         status_data = {"100": {"status": "pending"}, "101": "pending"}
-        s = _build_employee_stats(1, 2024, absences, self._lt_map(), status_data)
+        s = _build_employee_stats(1, 2024, absences, self._category_map(), status_data)
 
         assert s["employee_id"] == 1 and s["year"] == 2024
         assert s["vacation_days"] == 1
@@ -59,7 +56,7 @@ class TestBuildEmployeeStats:
         assert april["other"] == 1
 
     def test_no_matching_absences_is_zero(self):
-        s = _build_employee_stats(99, 2024, [], self._lt_map(), {})
+        s = _build_employee_stats(99, 2024, [], self._category_map(), {})
         assert s["total_days"] == 0
         assert s["pending_requests"] == 0
         assert all(m["vacation"] == 0 and m["sick"] == 0 and m["other"] == 0 for m in s["by_month"])
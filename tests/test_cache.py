@@ -87,6 +87,33 @@ class TestCacheBasics:
         cache.put("k", "new")
         assert cache.get("k") == "new"
 
+    def test_get_or_set_singleflight(self):
+        """Concurrent misses on the same key run the factory only once."""
+        import threading
+
+        calls = []
+        started = threading.Barrier(4)
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)  # keep the first computation in flight
+            return "computed"
+
+        results = []
+
+        def worker():
+            started.wait()
+            results.append(cache.get_or_set("sf_key", factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["computed"] * 4
+        assert len(calls) == 1
+
 
 class TestCacheIntegrationWithEndpoints:
     """Test that cache is used and invalidated by API endpoints."""
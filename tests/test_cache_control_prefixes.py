@@ -31,3 +31,36 @@ def test_non_cacheable_api_path_is_not_cached():
     resp = client.get("/api/health")
     cc = resp.headers.get("cache-control", "")
     assert "max-age" not in cc  # only the shared prefixes get max-age
+
+
+class TestRevalidatePrefixes:
+    def test_revalidate_prefix_constant_exists(self):
+        assert main._REVALIDATE_API_PREFIXES
+        for p in ("/api/stats", "/api/statistics"):
+            assert p in main._REVALIDATE_API_PREFIXES
+
+    def test_statistics_get_sets_etag_no_store_free(self, sync_client):
+        resp = sync_client.get("/api/statistics?year=2026&month=1")
+        assert resp.status_code == 200
+        assert resp.headers.get("etag", "").startswith('W/"')
+        cc = resp.headers.get("cache-control", "")
+        assert "no-cache" in cc and "max-age" not in cc
+
+    def test_matching_if_none_match_returns_304(self, sync_client):
+        first = sync_client.get("/api/statistics?year=2026&month=1")
+        etag = first.headers["etag"]
+        second = sync_client.get(
+            "/api/statistics?year=2026&month=1",
+            headers={"If-None-Match": etag},
+        )
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert not second.content
+
+    def test_stale_if_none_match_returns_full_body(self, sync_client):
+        resp = sync_client.get(
+            "/api/statistics?year=2026&month=1",
+            headers={"If-None-Match": 'W/"deadbeef"'},
+        )
+        assert resp.status_code == 200
+        assert resp.content
@@ -49,6 +49,15 @@ class _FakeDB:
     def _read(self, name):
         return self._tables.get(name, [])
 
+    def _read_by_month(self, name, date_field="DATE"):
+        # Fassaden-Vertrag: Zeilen nach YYYY-MM-Präfix gruppiert
+        index = {}
+        for r in self._read(name):
+            d = r.get(date_field) or ""
+            if len(d) >= 7:
+                index.setdefault(d[:7], []).append(r)
+        return index
+
     def get_employees(self, include_hidden=False):
         return self._employees
 
@@ -61,6 +70,9 @@ class _FakeDB:
     def get_group_members(self, gid):
         return self._members.get(gid, [])
 
+    def get_all_group_members(self):
+        return self._members
+
 
 def _detect_db(spshi=None):
     employees = [{"ID": 1, "FIRSTNAME": "Anna", "NAME": "Berg"}]
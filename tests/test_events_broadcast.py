@@ -145,7 +145,7 @@ class TestEventGenerator:
         assert "connected" in connected_msg
         event_msg = await gen.__anext__()
         assert "event: schedule_changed" in event_msg
-        assert '"foo": "bar"' in event_msg
+        assert '"foo":"bar"' in event_msg  # orjson: kompakte Separatoren
 
     @pytest.mark.asyncio
     async def test_sends_keepalive_on_timeout(self):
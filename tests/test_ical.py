@@ -7,6 +7,7 @@ import pytest
 from sp5api.routers.ical import (
     _build_ical,
     _escape_ical,
+    _Event,
     _ical_date,
     _ical_dt,
     _make_uid,
@@ -124,15 +125,14 @@ class TestBuildIcal:
 
     def test_timed_event(self):
         events = [
-            {
-                "uid": "test123@openschichtplaner5",
-                "dtstart": "20260315T060000Z",
-                "dtend": "20260315T140000Z",
-                "summary": "Frühschicht",
-                "description": "Früh",
-                "categories": "Schicht",
-                "all_day": False,
-            }
+            _Event(
+                uid="test123@openschichtplaner5",
+                dtstart="20260315T060000Z",
+                dtend="20260315T140000Z",
+                summary="Frühschicht",
+                description="Früh",
+                categories="Schicht",
+            )
         ]
         result = _build_ical(events, "Test")
         assert "BEGIN:VEVENT" in result
@@ -144,15 +144,14 @@ class TestBuildIcal:
 
     def test_all_day_event(self):
         events = [
-            {
-                "uid": "test456@openschichtplaner5",
-                "dtstart": "20260315",
-                "dtend": "20260316",
-                "summary": "Urlaub",
-                "description": "",
-                "categories": "Abwesenheit",
-                "all_day": True,
-            }
+            _Event(
+                uid="test456@openschichtplaner5",
+                dtstart="20260315",
+                dtend="20260316",
+                summary="Urlaub",
+                categories="Abwesenheit",
+                all_day=True,
+            )
         ]
         result = _build_ical(events, "Test")
         assert "DTSTART;VALUE=DATE:20260315" in result
@@ -160,15 +159,13 @@ class TestBuildIcal:
 
     def test_multiple_events(self):
         events = [
-            {
-                "uid": f"ev{i}@sp5",
-                "dtstart": f"2026031{i}",
-                "dtend": f"2026031{i+1}",
-                "summary": f"Event {i}",
-                "description": "",
-                "categories": "",
-                "all_day": True,
-            }
+            _Event(
+                uid=f"ev{i}@sp5",
+                dtstart=f"2026031{i}",
+                dtend=f"2026031{i+1}",
+                summary=f"Event {i}",
+                all_day=True,
+            )
             for i in range(1, 4)
         ]
         result = _build_ical(events, "Multi")
@@ -286,26 +286,26 @@ class TestIcalHelpers:
         assert _ical_date(date(2026, 3, 10)) == "20260310"
 
     def test_build_ical(self):
-        from sp5api.routers.ical import _build_ical
+        from sp5api.routers.ical import _build_ical, _Event
         events = [
-            {
-                "uid": "test-uid@test",
-                "dtstart": "20260310",
-                "dtend": "20260311",
-                "summary": "Test Event",
-                "description": "A description",
-                "categories": "Test",
-                "all_day": True,
-            },
-            {
-                "uid": "test-uid2@test",
-                "dtstart": "20260310T080000Z",
-                "dtend": "20260310T160000Z",
-                "summary": "Timed Event",
-                "description": "",
-                "categories": "",
-                "all_day": False,
-            },
+            _Event(
+                uid="test-uid@test",
+                dtstart="20260310",
+                dtend="20260311",
+                summary="Test Event",
+                description="A description",
+                categories="Test",
+                all_day=True,
+            ),
+            _Event(
+                uid="test-uid2@test",
+                dtstart="20260310T080000Z",
+                dtend="20260310T160000Z",
+                summary="Timed Event",
+                description="",
+                categories="",
+                all_day=False,
+            ),
         ]
         ical = _build_ical(events, "Test Calendar")
         assert "BEGIN:VCALENDAR" in ical
@@ -8,6 +8,7 @@ from datetime import date
 from starlette.testclient import TestClient
 
 import sp5api.main as main
+from sp5api import cache
 
 _TODAY = date.today()
 _PREFIX = f"{_TODAY.year:04d}-{_TODAY.month:02d}"
@@ -55,6 +56,15 @@ class _DashDB:
             return [{"DATE": _TODAY_STR, "EMPLOYEEID": 1, "LEAVETYPID": 1, "LEAVETYPEID": 1}]
         return []
 
+    def _read_by_month(self, name, date_field="DATE"):
+        # Fassaden-Vertrag: Zeilen nach YYYY-MM-Präfix gruppiert
+        index = {}
+        for r in self._read(name):
+            d = r.get(date_field) or ""
+            if len(d) >= 7:
+                index.setdefault(d[:7], []).append(r)
+        return index
+
     def get_schedule(self, year, month, group_id=None):
         # Fassaden-Shape (B-2): Dashboards zählen jetzt über get_schedule
         return [
@@ -93,6 +103,9 @@ class _DashDB:
 
 def _client(monkeypatch):
     monkeypatch.setattr(main, "get_db", lambda: _DashDB())
+    # Die Dashboard-Endpunkte lesen Stammdaten über den TTL-Cache — Reste aus
+    # vorherigen Tests gegen die echte Test-DB wegräumen.
+    cache.clear()
     tok = secrets.token_hex(20)
     main._sessions[tok] = {"ID": 997, "NAME": "dash", "role": "Admin", "ADMIN": True, "RIGHTS": 255}
     client = TestClient(main.app, raise_server_exceptions=False)
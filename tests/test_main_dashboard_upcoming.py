@@ -8,6 +8,7 @@ from datetime import date
 from starlette.testclient import TestClient
 
 import sp5api.main as main
+from sp5api import cache
 
 _TODAY = date.today()
 
@@ -30,6 +31,9 @@ class _UpcomingDB:
 
 def test_upcoming_recurring_holidays_and_birthdays(monkeypatch):
     monkeypatch.setattr(main, "get_db", lambda: _UpcomingDB())
+    # Die Dashboard-Endpunkte lesen MA über den TTL-Cache — Reste aus
+    # vorherigen Tests gegen die echte Test-DB wegräumen.
+    cache.clear()
     tok = secrets.token_hex(20)
     main._sessions[tok] = {"ID": 998, "NAME": "up", "role": "Admin", "ADMIN": True, "RIGHTS": 255}
     try:
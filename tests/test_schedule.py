@@ -27,6 +27,33 @@ class TestGetSchedule:
         assert res.status_code in (400, 422)
 
 
+class TestGetScheduleBatch:
+    def test_batch_returns_dict_keyed_by_month(self, sync_client: TestClient):
+        """GET /api/schedule/batch?months=… → 200, dict mit YYYY-MM-Keys."""
+        res = sync_client.get("/api/schedule/batch?months=2026-01,2026-02")
+        assert res.status_code == 200
+        data = res.json()
+        assert set(data.keys()) == {"2026-01", "2026-02"}
+        assert all(isinstance(v, list) for v in data.values())
+
+    def test_batch_matches_single_month_endpoint(self, sync_client: TestClient):
+        """Batch liefert je Monat dasselbe wie /api/schedule."""
+        single = sync_client.get("/api/schedule?year=2026&month=1").json()
+        batch = sync_client.get("/api/schedule/batch?months=2026-01").json()
+        assert batch["2026-01"] == single
+
+    def test_batch_invalid_month_returns_400(self, sync_client: TestClient):
+        res = sync_client.get("/api/schedule/batch?months=2026-13")
+        assert res.status_code == 400
+        res = sync_client.get("/api/schedule/batch?months=nonsense")
+        assert res.status_code == 400
+
+    def test_batch_limits_to_twelve_months(self, sync_client: TestClient):
+        months = ",".join(f"2026-{m:02d}" for m in range(1, 13)) + ",2027-01"
+        res = sync_client.get(f"/api/schedule/batch?months={months}")
+        assert res.status_code == 400
+
+
 class TestCreateAndDeleteScheduleEntry:
     def test_post_schedule_entry(self, write_client: TestClient):
         """POST /api/schedule → creates an entry (or 409 if exists)."""
@@ -63,3 +63,41 @@ class TestStatisticsFreePeriod:
         assert res.status_code == 400
         res = sync_client.get("/api/statistics?from=2026-02-01&to=2026-01-31")
         assert res.status_code == 400
+
+
+class TestEmployeeStatisticsBatch:
+    def test_batch_returns_dict_keyed_by_id(self, sync_client: TestClient):
+        """GET /api/statistics/employee/batch?ids=… → 200, dict mit ID-Keys."""
+        emps = sync_client.get("/api/employees").json()
+        ids = [e["ID"] for e in emps[:2]]
+        res = sync_client.get(
+            f"/api/statistics/employee/batch?ids={ids[0]},{ids[1]}&year=2026"
+        )
+        assert res.status_code == 200
+        data = res.json()
+        assert set(data.keys()) == {str(i) for i in ids}
+
+    def test_batch_matches_single_endpoint(self, sync_client: TestClient):
+        """Batch liefert je MA dasselbe wie /api/statistics/employee/{id}."""
+        emp_id = sync_client.get("/api/employees").json()[0]["ID"]
+        single = sync_client.get(
+            f"/api/statistics/employee/{emp_id}?year=2026"
+        ).json()
+        batch = sync_client.get(
+            f"/api/statistics/employee/batch?ids={emp_id}&year=2026"
+        ).json()
+        assert batch[str(emp_id)] == single
+
+    def test_batch_unknown_id_is_null(self, sync_client: TestClient):
+        res = sync_client.get("/api/statistics/employee/batch?ids=999999&year=2026")
+        assert res.status_code == 200
+        assert res.json()["999999"] is None
+
+    def test_batch_invalid_ids_rejected(self, sync_client: TestClient):
+        assert (
+            sync_client.get("/api/statistics/employee/batch?ids=nonsense").status_code
+            == 400
+        )
+        assert (
+            sync_client.get("/api/statistics/employee/batch?ids=").status_code == 400
+        )
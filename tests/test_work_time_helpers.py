@@ -91,8 +91,9 @@ def test_holiday_uses_index7():
     )
     day_hours, blocks = wtr._collect_day_data(db, 5, date(2026, 3, 1), date(2026, 3, 31))
     assert day_hours[date(2026, 3, 4)] == 4.0
-    assert blocks[0]["start"] == datetime(2026, 3, 4, 10, 0)
-    assert blocks[0]["end"] == datetime(2026, 3, 4, 14, 0)
+    start, end, _day = blocks[0]
+    assert start == datetime(2026, 3, 4, 10, 0)
+    assert end == datetime(2026, 3, 4, 14, 0)
 
 
 def test_spshi_replaces_normal_duty_no_double_counting():
@@ -162,7 +163,7 @@ def test_rest_time_uses_real_startend_times():
     )
     _, blocks = wtr._collect_day_data(db, 5, date(2026, 3, 1), date(2026, 3, 31))
     # Tageswechsel-Konvention D-30: Ende <= Start ⇒ +24h
-    assert blocks[0]["end"] == datetime(2026, 3, 3, 6, 0)
+    assert blocks[0][1] == datetime(2026, 3, 3, 6, 0)
 
     violations = wtr._check_employee(db, 5, date(2026, 3, 1), date(2026, 3, 31), _RULES)
     rest = [v for v in violations if v["type"] == "min_rest_hours_between_shifts"]